@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import patch, Mock
+from unittest.mock import patch, Mock, MagicMock
 import os
 from tulit.client.state.portugal import PortugalDREClient
 from tests.conftest import locate_data_dir, locate_tests_dir
@@ -67,5 +67,58 @@ class TestPortugalDREClient(unittest.TestCase):
         file_path = self.client.download('journal', series='1a', number='1', year='1991', supplement=0, lang='pt', fmt='html')
         self.assertIsNone(file_path)
 
+    @patch('tulit.client.state.portugal.httpx', None)
+    def test_bulk_without_httpx_falls_back_to_requests(self):
+        client = PortugalDREClient(download_dir=self.download_dir, log_dir=self.log_dir, bulk=True)
+        self.assertIsNone(client._client)
+        client.close()
+
+    def test_bulk_download_streams_response(self):
+        mock_response = Mock()
+        mock_response.headers = {'Content-Type': 'text/html'}
+        mock_response.iter_bytes.return_value = [b'<html>', b'Bulk</html>']
+        mock_client = MagicMock()
+        mock_client.stream.return_value.__enter__.return_value = mock_response
+        self.client._client = mock_client
+        file_path = self.client.download('journal', series='1a', number='2', year='1991', supplement=0, lang='pt', fmt='html')
+        mock_response.iter_bytes.assert_called_once_with(PortugalDREClient.CHUNK_SIZE)
+        with open(file_path, 'rb') as f:
+            self.assertEqual(f.read(), b'<html>Bulk</html>')
+        os.remove(file_path)
+
+    def test_bulk_download_failure_leaves_no_partial_file(self):
+        def broken_stream(size):
+            yield b'<html>'
+            raise ConnectionError('connection reset')
+        mock_response = Mock()
+        mock_response.headers = {'Content-Type': 'text/html'}
+        mock_response.iter_bytes.side_effect = broken_stream
+        mock_client = MagicMock()
+        mock_client.stream.return_value.__enter__.return_value = mock_response
+        self.client._client = mock_client
+        file_path = self.client.download('journal', series='1a', number='3', year='1991', supplement=0, lang='pt', fmt='html')
+        self.assertIsNone(file_path)
+        expected = os.path.join(self.download_dir, 'dre_journal_1a_3_1991_0_pt.html')
+        self.assertFalse(os.path.exists(expected))
+        self.assertFalse(os.path.exists(expected + '.part'))
+
+    def test_bulk_client_follows_redirects(self):
+        fake_httpx = MagicMock()
+        with patch('tulit.client.state.portugal.httpx', fake_httpx):
+            client = PortugalDREClient(download_dir=self.download_dir, log_dir=self.log_dir, bulk=True)
+        # requests follows redirects by default; the bulk client must as well
+        self.assertTrue(fake_httpx.Client.call_args.kwargs['follow_redirects'])
+        self.assertIs(client._client, fake_httpx.Client.return_value)
+        client.close()
+
+    def test_bulk_with_old_httpx_falls_back_to_requests(self):
+        fake_httpx = MagicMock()
+        fake_httpx.Client.side_effect = TypeError("unexpected keyword argument 'proxy'")
+        with patch('tulit.client.state.portugal.httpx', fake_httpx):
+            client = PortugalDREClient(download_dir=self.download_dir, log_dir=self.log_dir,
+                                       proxies={'https': 'http://proxy:8080'}, bulk=True)
+        self.assertIsNone(client._client)
+        client.close()
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,8 @@ import pytest
 import os
 from pathlib import Path
 from unittest.mock import patch, MagicMock
+from lxml import etree
+from lxml import html as lxml_html
 from tulit.parser.html.cellar import CellarHTMLParser
 from tests.conftest import locate_data_dir
 
@@ -86,6 +88,47 @@ class TestCellarHTMLParser:
         parser_with_root.get_preamble()
         assert parser_with_root.preamble is not None
 
+    def test_get_preamble_resolves_id_without_prefix_scan(self, parser_with_root):
+        """Test get_preamble resolves pbl_1 through the parser's id table."""
+        from tulit.parser.html.cellar import cellar as cellar_module
+        with patch.object(cellar_module, '_XP_DIVS_WITH_ID',
+                          wraps=cellar_module._XP_DIVS_WITH_ID) as id_scan:
+            parser_with_root.get_preamble()
+        
+        assert parser_with_root.preamble.get('id') == 'pbl_1'
+        assert id_scan.call_count == 0
+
+    def test_get_preamble_falls_back_without_id_table(self, cellar_parser):
+        """Test get_preamble still finds pbl_1 in trees built without an id table."""
+        root = lxml_html.Element('html')
+        body = etree.SubElement(root, 'body')
+        etree.SubElement(body, 'div', {'class': 'eli-subdivision', 'id': 'pbl_1'})
+        cellar_parser.root = root
+        
+        cellar_parser.get_preamble()
+        
+        assert cellar_parser.preamble is body[0]
+
+    def test_preamble_getters_without_preamble(self, cellar_parser, tmp_path):
+        """Test preamble getters return empty results when there is no preamble."""
+        html_file = tmp_path / "no_preamble.html"
+        html_file.write_text('<html><body><div id="enc_1"></div></body></html>', encoding='utf-8')
+        cellar_parser.get_root(str(html_file))
+        
+        with patch.object(cellar_parser.logger, 'error') as log_error:
+            cellar_parser.get_preamble()
+            cellar_parser.get_formula()
+            cellar_parser.get_citations()
+            cellar_parser.get_recitals()
+            cellar_parser.get_preamble_final()
+        
+        log_error.assert_not_called()
+        assert cellar_parser.preamble is None
+        assert cellar_parser.formula is None
+        assert cellar_parser.citations == []
+        assert cellar_parser.recitals == []
+        assert cellar_parser.preamble_final is None
+
     def test_get_preamble_removes_anchor_tags(self, cellar_parser, tmp_path):
         """Test get_preamble removes all <a> tags."""
         html_file = tmp_path / "preamble_with_links.html"
@@ -102,7 +145,8 @@ class TestCellarHTMLParser:
         
         # Check that anchor tag was decomposed
         assert cellar_parser.preamble.find('a') is None
-        assert 'Text with' in cellar_parser.preamble.get_text()
+        assert 'Text with' in cellar_parser.preamble.text_content()
+        assert ' removed' in cellar_parser.preamble.text_content()
 
     def test_get_formula_success(self, parser_with_root):
         """Test get_formula extracts oj-normal paragraph from preamble."""
@@ -111,13 +155,12 @@ class TestCellarHTMLParser:
         assert parser_with_root.formula is not None
         assert isinstance(parser_with_root.formula, str)
 
-    def test_get_formula_with_mock(self, cellar_parser):
-        """Test get_formula extracts text from oj-normal p tag."""
-        mock_p = MagicMock()
-        mock_p.text = "Formula text"
-        
-        cellar_parser.preamble = MagicMock()
-        cellar_parser.preamble.find.return_value = mock_p
+    def test_get_formula_first_oj_normal_paragraph(self, cellar_parser):
+        """Test get_formula extracts text from the first oj-normal p tag."""
+        cellar_parser.preamble = lxml_html.fragment_fromstring(
+            '<div id="pbl_1"><p class="oj-normal">Formula <span>text</span></p>'
+            '<p class="oj-normal">Final</p></div>'
+        )
         
         cellar_parser.get_formula()
         assert cellar_parser.formula == "Formula text"
@@ -164,6 +207,99 @@ class TestCellarHTMLParser:
         
         assert cellar_parser.citations == []
 
+    def test_citations_and_recitals_require_subdivision_class(self, cellar_parser, tmp_path):
+        """Test citations and recitals only match eli-subdivision divs with the id prefix."""
+        html_file = tmp_path / "citations_recitals.html"
+        html_file.write_text(
+            '''<html><body>
+                <div class="eli-subdivision" id="pbl_1">
+                    <div class="eli-subdivision" id="cit_1">Citation <a href="#">(1)</a>,</div>
+                    <div class="other" id="cit_2">Not a subdivision</div>
+                    <div class="eli-subdivision extra" id="rct_1">(1) Recital</div>
+                </div>
+            </body></html>''',
+            encoding='utf-8'
+        )
+        cellar_parser.get_root(str(html_file))
+        cellar_parser.get_preamble()
+        cellar_parser.get_citations()
+        cellar_parser.get_recitals()
+        
+        assert cellar_parser.citations == [{'eId': 'cit_1', 'text': 'Citation,'}]
+        assert cellar_parser.recitals == [{'eId': 'rct_1', 'text': 'Recital'}]
+
+    def test_text_skips_script_and_style(self):
+        """Test _text leaves out script/style contents like cellar_standard's _text."""
+        from tulit.parser.html.cellar.cellar import _text
+        from tulit.parser.html.cellar import cellar_standard
+        div = lxml_html.fragment_fromstring(
+            '<div> Lead <script>track()</script><b>bold</b><style>p {}</style> tail </div>'
+        )
+
+        assert _text(div) == ' Lead bold tail '
+        assert _text(div, ' ', strip=True) == 'Lead bold tail'
+        assert _text(div) == cellar_standard._text(div)
+        assert _text(div, strip=True) == cellar_standard._text(div, strip=True)
+
+    def test_preamble_subqueries_share_one_scan(self, cellar_parser):
+        """Test formula, citations, recitals and preamble_final reuse one preamble scan."""
+        from tulit.parser.html.cellar import cellar as cellar_module
+        cellar_parser.preamble = lxml_html.fragment_fromstring(
+            '<div class="eli-subdivision" id="pbl_1">'
+            '<p class="oj-normal">Formula</p>'
+            '<div class="eli-subdivision" id="cit_1">Citation</div>'
+            '<div class="eli-subdivision" id="rct_1">(1) Recital</div>'
+            '<p class="oj-normal">Final</p></div>'
+        )
+        with patch.object(cellar_module, '_XP_DIVS_WITH_ID',
+                          wraps=cellar_module._XP_DIVS_WITH_ID) as id_scan, \
+             patch.object(cellar_module, '_XP_OJ_NORMAL',
+                          wraps=cellar_module._XP_OJ_NORMAL) as paragraph_scan:
+            cellar_parser.get_formula()
+            cellar_parser.get_citations()
+            cellar_parser.get_recitals()
+            cellar_parser.get_preamble_final()
+        
+        assert id_scan.call_count == 1
+        assert paragraph_scan.call_count == 1
+        assert cellar_parser.formula == 'Formula'
+        assert [c['eId'] for c in cellar_parser.citations] == ['cit_1']
+        assert cellar_parser.recitals == [{'eId': 'rct_1', 'text': 'Recital'}]
+        assert cellar_parser.preamble_final == 'Final'
+
+    def test_body_chapters_and_articles_share_one_id_scan(self, cellar_parser, tmp_path):
+        """Test id-prefixed divs are bucketed once per container and filtered like before."""
+        from tulit.parser.html.cellar import cellar as cellar_module
+        html_file = tmp_path / "id_buckets.html"
+        html_file.write_text(
+            '''<html><body>
+                <div id="enc_1">
+                    <div id="cpt_I"><p class="oj-ti-section-1">CHAPTER I</p>
+                        <div class="eli-title">General</div>
+                        <div id="cpt_I.sct_1"><p class="oj-ti-section-1">Section 1</p>
+                            <div class="eli-title">Nested</div></div>
+                        <div id="art_1"><p class="oj-ti-art">Article 1</p>
+                            <p class="oj-normal">Text.</p>
+                            <div id="art_1.1">Subdivision</div></div>
+                        <div id="article_2"><p class="oj-ti-art">Article 2</p></div>
+                    </div>
+                </div>
+            </body></html>''',
+            encoding='utf-8'
+        )
+        cellar_parser.get_root(str(html_file))
+        with patch.object(cellar_module, '_XP_DIVS_WITH_ID',
+                          wraps=cellar_module._XP_DIVS_WITH_ID) as id_scan:
+            cellar_parser.get_body()
+            cellar_parser.get_chapters()
+            cellar_parser.get_articles()
+        
+        # one scan of the document for enc_, one of the body for cpt_ and art_
+        assert id_scan.call_count == 2
+        assert cellar_parser.body.get('id') == 'enc_1'
+        assert [c['eId'] for c in cellar_parser.chapters] == ['cpt_I']
+        assert [a['eId'] for a in cellar_parser.articles] == ['art_1']
+
     def test_get_recitals_success(self, parser_with_root):
         """Test get_recitals extracts rct_ subdivisions."""
         parser_with_root.get_preamble()
@@ -493,6 +629,44 @@ class TestCellarHTMLParser:
         # Should have intro + 2 table rows
         assert len(article['children']) == 3
 
+    def test_get_articles_nested_table_uses_subdivisions(self, cellar_parser, tmp_path):
+        """Test that a table owned by a nested div does not trigger the table branch."""
+        html_file = tmp_path / "article_nested_table.html"
+        html_file.write_text(
+            '''<html><body>
+                <div id="art_1">
+                    <p class="oj-ti-art">Article 1</p>
+                    <div id="art_1.1">
+                        <p class="oj-normal">Intro</p>
+                        <table><tr><td>(1)</td><td>Row</td></tr></table>
+                    </div>
+                </div>
+            </body></html>''',
+            encoding='utf-8'
+        )
+        cellar_parser.get_root(str(html_file))
+        cellar_parser.get_body()
+        cellar_parser.get_articles()
+        
+        children = cellar_parser.articles[0]['children']
+        assert len(children) == 1
+        assert children[0]['text'] == 'Intro (1) Row'
+
+    def test_extract_article_single_div(self, cellar_parser):
+        """Test _extract_article handles one article div on its own."""
+        article = lxml_html.fragment_fromstring(
+            '<div id="art_2"><p class="oj-ti-art">Article 2</p>'
+            '<p class="oj-sti-art">Scope</p><p class="oj-normal">Text .</p></div>'
+        )
+        
+        assert cellar_parser._extract_article(article) == {
+            'eId': 'art_2', 'num': 'Article 2', 'heading': 'Scope',
+            'children': [{'eId': 0, 'text': 'Text.'}],
+        }
+        assert cellar_parser._extract_article(
+            lxml_html.fragment_fromstring('<div id="art_3"><p>No title</p></div>')
+        ) is None
+
     def test_get_articles_with_subdivisions(self, cellar_parser, tmp_path):
         """Test get_articles with nested div subdivisions."""
         html_file = tmp_path / "article_subdivisions.html"
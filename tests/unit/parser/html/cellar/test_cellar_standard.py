@@ -1,6 +1,7 @@
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
+from lxml import html as lxml_html
 from tulit.parser.html.cellar.cellar_standard import CellarStandardHTMLParser
 
 
@@ -61,6 +62,22 @@ class TestCellarStandardHTMLParser:
         result = parser._clean_text(text)
         assert isinstance(result, str)
 
+    def test_text_leaf_and_mixed_elements(self):
+        """Leaf elements read .text directly; mixed ones join every text node."""
+        from tulit.parser.html.cellar.cellar_standard import _text
+        doc = lxml_html.fromstring(
+            '<div><p> leaf text </p><p></p><p> a <b> b </b><!-- c --> d </p>'
+            '<p>x<script>skip()</script>y</p><script>only()</script></div>'
+        )
+        leaf, empty, mixed, scripted, script = doc
+        assert _text(leaf) == ' leaf text '
+        assert _text(leaf, strip=True) == 'leaf text'
+        assert _text(empty) == '' and _text(empty, strip=True) == ''
+        assert _text(mixed) == ' a  b  d '
+        assert _text(mixed, strip=True) == 'abd'
+        assert _text(scripted) == 'xy'
+        assert _text(script) == ''
+
     def test_extract_article_number_success(self, parser):
         """Test _extract_article_number extracts article number."""
         text = "Article 1 Some heading"
@@ -75,6 +92,14 @@ class TestCellarStandardHTMLParser:
         assert num is None
         assert remaining == text
 
+    def test_extract_article_number_prefix(self, parser):
+        """Test _extract_article_number accepts any case and rejects near misses."""
+        assert parser._extract_article_number("ARTICLE 12") == ("12", "")
+        assert parser._extract_article_number("article\u00a03 Scope") == ("3", "Scope")
+        assert parser._extract_article_number("Articles 1 and 2") == (None, "Articles 1 and 2")
+        assert parser._extract_article_number("Artic") == (None, "Artic")
+        assert parser._extract_article_number("") == (None, "")
+
     def test_get_preface_from_meta(self, parser, tmp_path):
         """Test get_preface extracts from meta description."""
         html_file = tmp_path / "meta_preface.html"
@@ -88,6 +113,24 @@ class TestCellarStandardHTMLParser:
         
         assert parser.preface == "Test preface"
 
+    def test_get_root_builds_lxml_tree(self, parser, tmp_path):
+        """Test get_root parses with lxml.html and lowercases the TXT_TE tag."""
+        html_file = tmp_path / "noisy_head.html"
+        html_file.write_text(
+            '<html><head><title>Ignored</title><script>var x = 1;</script>'
+            '<meta name="DC.description" content="Test preface"/></head>'
+            '<body><TXT_TE><p>Article 1</p></TXT_TE></body></html>',
+            encoding='utf-8'
+        )
+
+        parser.get_root(str(html_file))
+
+        assert isinstance(parser.root, lxml_html.HtmlElement)
+        assert parser.root.tag == 'html'
+        assert parser.root.find('.//txt_te/p').text == "Article 1"
+        parser.get_preface()
+        assert parser.preface == "Test preface"
+
     def test_get_preface_from_h1(self, parser, tmp_path):
         """Test get_preface extracts from h1 when meta missing."""
         html_file = tmp_path / "h1_preface.html"
@@ -114,6 +157,22 @@ class TestCellarStandardHTMLParser:
         
         assert parser.preface == "Strong text"
 
+    def test_get_preface_priority_ignores_document_order(self, parser, tmp_path):
+        """Test get_preface prefers meta, then h1, then strong wherever they appear."""
+        html_file = tmp_path / "mixed_preface.html"
+        html_file.write_text(
+            '<html><head><meta name="DC.description" content=""/><meta name="other" content="No"/></head>'
+            '<body><strong>Strong text</strong><h1>First heading</h1><h1>Second heading</h1>'
+            '<meta name="DC.description" content="Late meta"/></body></html>',
+            encoding='utf-8'
+        )
+        
+        parser.get_root(str(html_file))
+        parser.get_preface()
+        
+        # The first DC.description meta is empty, so the first h1 wins over strong
+        assert parser.preface == "First heading"
+
     def test_get_preface_none_found(self, parser, tmp_path):
         """Test get_preface returns None when nothing found."""
         html_file = tmp_path / "no_preface.html"
@@ -162,6 +221,19 @@ class TestCellarStandardHTMLParser:
         assert parser.txt_te is not None
         assert parser.is_consolidated is False
 
+    def test_get_preamble_childless_container(self, parser, tmp_path):
+        """Test get_preamble accepts a TXT_TE element that only holds text."""
+        html_file = tmp_path / "text_only.html"
+        html_file.write_text('<html><body><TXT_TE>Preamble content</TXT_TE></body></html>', encoding='utf-8')
+        parser.get_root(str(html_file))
+
+        parser.get_preamble()
+
+        assert parser.txt_te.tag == 'txt_te'
+        assert parser.txt_te.text == 'Preamble content'
+        parser.get_formula()
+        assert parser.formula is None
+
     def test_get_preamble_consolidated_format(self, parser, tmp_path):
         """Test get_preamble raises ValueError when no TXT_TE tag found."""
         html_file = tmp_path / "consolidated.html"
@@ -190,6 +262,74 @@ class TestCellarStandardHTMLParser:
         with pytest.raises(AttributeError):
             parser.get_preamble()
 
+    def test_preamble_extractors_share_one_paragraph_scan(self, parser_with_root):
+        """Test the paragraph-based extractors walk TXT_TE only once."""
+        parser_with_root.get_preamble()
+        element_type = type(parser_with_root.txt_te)
+        findall = element_type.findall
+        paths = []
+
+        def spy(element, path, *args):
+            paths.append(path)
+            return findall(element, path, *args)
+
+        with patch.object(element_type, 'findall', spy):
+            parser_with_root.get_formula()
+            parser_with_root.get_citations()
+            parser_with_root.get_recitals()
+            parser_with_root.get_preamble_final()
+            parser_with_root.get_conclusions()
+        assert paths.count('.//p') == 1
+        assert parser_with_root.formula == "THE COUNCIL OF THE EUROPEAN UNION,"
+        assert parser_with_root.preamble_final == "HAS ADOPTED THIS REGULATION:"
+
+    def test_paragraph_text_cleaned_once_per_element(self, parser_with_root):
+        """Test citations, recitals, articles and conclusions reuse cleaned paragraph text."""
+        parser_with_root.get_preamble()
+        with patch.object(parser_with_root, '_clean_text', wraps=parser_with_root._clean_text) as clean:
+            parser_with_root.get_citations()
+            parser_with_root.get_recitals()
+            parser_with_root.get_conclusions()
+            parser_with_root.get_articles()
+        cleaned = [c.args[0] for c in clean.call_args_list]
+        assert cleaned.count("Having regard to the Treaty") == 1
+        assert cleaned.count("Article 1") == 1
+        assert parser_with_root.citations == [{'eId': 'cit_1', 'text': 'Having regard to the Treaty'}]
+
+    def test_formula_and_preamble_final_share_one_scan(self, parser_with_root):
+        """Test get_formula and get_preamble_final read the paragraphs once, up to the enacting formula."""
+        from tulit.parser.html.cellar import cellar_standard
+        parser_with_root.get_preamble()
+        with patch.object(cellar_standard, '_text', wraps=cellar_standard._text) as text:
+            parser_with_root.get_formula()
+            parser_with_root.get_preamble_final()
+        # Paragraphs 1-4 are read; the scan stops at 'HAS ADOPTED THIS REGULATION:'
+        assert text.call_count == 4
+        assert parser_with_root.formula == "THE COUNCIL OF THE EUROPEAN UNION,"
+        assert parser_with_root.preamble_final == "HAS ADOPTED THIS REGULATION:"
+
+    def test_preamble_statement_prefixes_ignore_case(self, parser, tmp_path):
+        """Test formula and enacting formula openings match in any case."""
+        html_file = tmp_path / "mixed_case.html"
+        html_file.write_text(
+            '<html><body><txt_te><p>Theory first</p><p>The European Parliament and the Council,</p>'
+            '<p>Has decided as follows:</p></txt_te></body></html>',
+            encoding='utf-8'
+        )
+        parser.get_root(str(html_file))
+        parser.get_preamble()
+        parser.get_formula()
+        parser.get_preamble_final()
+        assert parser.formula == "The European Parliament and the Council,"
+        assert parser.preamble_final == "Has decided as follows:"
+
+    def test_element_text_survives_proxy_reuse(self, parser_with_root):
+        """Test cached text stays tied to its node when lxml recreates element proxies."""
+        parser_with_root.get_preamble()
+        expected = [p.text for p in parser_with_root.txt_te]
+        for _ in range(2):
+            assert [parser_with_root._element_text(p) for p in parser_with_root.txt_te] == expected
+
     def test_get_formula_success(self, parser, tmp_path):
         """Test get_formula extracts formula text."""
         html_file = tmp_path / "formula.html"
@@ -257,6 +397,32 @@ class TestCellarStandardHTMLParser:
         assert parser.citations[0]['eId'] == 'cit_1'
         assert 'regard' in parser.citations[0]['text']
 
+    def test_get_citations_only_cleans_candidates(self, parser, tmp_path):
+        """Test get_citations filters paragraphs in XPath and keeps the cleaned-text match."""
+        html_file = tmp_path / "citations_filter.html"
+        html_file.write_text(
+            '''<html><body><txt_te>
+                <p>THE COUNCIL,</p>
+                <p><b>Having</b>\u00a0regard to the Treaty,</p>
+                <p>\u25bcB Having considered the opinion,</p>
+                <p>Having\nregard to nothing,</p>
+                <p>Whereas the citations end here</p>
+            </txt_te></body></html>''',
+            encoding='utf-8'
+        )
+        parser.get_root(str(html_file))
+        parser.get_preamble()
+
+        with patch.object(parser, '_clean_text', wraps=parser._clean_text) as clean:
+            parser.get_citations()
+
+        assert parser.citations == [
+            {'eId': 'cit_1', 'text': 'Having regard to the Treaty,'},
+            {'eId': 'cit_2', 'text': 'Having considered the opinion,'},
+        ]
+        # Only the three paragraphs containing 'Having' are cleaned
+        assert clean.call_count == 3
+
     def test_get_citations_no_container(self, parser):
         """Test get_citations when txt_te not set."""
         parser.get_citations()
@@ -308,6 +474,75 @@ class TestCellarStandardHTMLParser:
         assert len(recitals) == 2
         assert recitals[0]['eId'] == 'rct_1'
 
+    def test_extract_recitals_from_tables_skips_other_rows(self, parser, tmp_path):
+        """Test rows without a recital number or with more than two cells are skipped."""
+        html_file = tmp_path / "table_mixed.html"
+        html_file.write_text(
+            '''<html><body><txt_te>
+                <table>
+                    <tr><td>(1)</td><td>First</td><td>Extra</td></tr>
+                    <tr><td>Note</td><td>Not a recital</td></tr>
+                    <tr><td>(2)</td><td>Second recital</td></tr>
+                </table>
+            </txt_te></body></html>''',
+            encoding='utf-8'
+        )
+        
+        parser.get_root(str(html_file))
+        parser.get_preamble()
+        recitals = parser._extract_recitals_from_tables()
+        
+        assert recitals == [{'eId': 'rct_2', 'text': 'Second recital'}]
+
+    def test_extract_recitals_from_tables_rejects_tables_on_first_row(self, parser, tmp_path):
+        """Test tables whose first cell is not a recital number are skipped whole."""
+        html_file = tmp_path / "table_layout.html"
+        html_file.write_text(
+            '''<html><body><txt_te>
+                <table>
+                    <tr><td>Header</td><td>Layout</td></tr>
+                    <tr><td>(9)</td><td>Numbered annex row</td></tr>
+                </table>
+                <table></table>
+                <table><tr><th>(5)</th><td>No data cell first</td></tr></table>
+                <table><tr><td>(3)</td><td>Third recital</td></tr></table>
+            </txt_te></body></html>''',
+            encoding='utf-8'
+        )
+        
+        from tulit.parser.html.cellar.cellar_standard import _text
+        parser.get_root(str(html_file))
+        parser.get_preamble()
+        with patch('tulit.parser.html.cellar.cellar_standard._text', wraps=_text) as text:
+            recitals = parser._extract_recitals_from_tables()
+        
+        assert recitals == [{'eId': 'rct_3', 'text': 'Third recital'}]
+        # Rejected tables cost one cell read each; only the recital row is read in full
+        assert text.call_count == 5
+
+    def test_extract_recitals_from_tables_skips_header_rows(self, parser, tmp_path):
+        """Test header rows without data cells do not decide whether a table holds recitals."""
+        html_file = tmp_path / "table_header.html"
+        html_file.write_text(
+            '''<html><body><txt_te>
+                <table>
+                    <tr><th>No</th><th>Recital</th></tr>
+                    <tr><td>(1)</td><td>First recital</td></tr>
+                    <tr><td>(2)</td><td>Second recital</td></tr>
+                </table>
+                <table><tr><th>Only a header</th></tr></table>
+            </txt_te></body></html>''',
+            encoding='utf-8'
+        )
+        
+        parser.get_root(str(html_file))
+        parser.get_preamble()
+        
+        assert parser._extract_recitals_from_tables() == [
+            {'eId': 'rct_1', 'text': 'First recital'},
+            {'eId': 'rct_2', 'text': 'Second recital'},
+        ]
+
     def test_is_recitals_start(self, parser):
         """Test _is_recitals_start identifies whereas marker."""
         assert parser._is_recitals_start("Whereas:")
@@ -472,6 +707,20 @@ class TestCellarStandardHTMLParser:
         assert parser._is_signature_section("Member of the Commission")
         assert not parser._is_signature_section("Regular text")
 
+    def test_is_signature_section_covers_every_alternative(self, parser):
+        """Test the fused signature pattern keeps each alternative anchored."""
+        for text in (
+            "done at Luxembourg",
+            "For the European Parliament",
+            "President of the Council",
+            "The President",
+            "Brussels, 1 January 2020",
+        ):
+            assert parser._is_signature_section(text)
+        assert not parser._is_signature_section("Signed in Brussels, 1 January 2020")
+        assert not parser._is_signature_section("For the purposes of this Regulation")
+        assert not parser._is_signature_section("")
+
     def test_is_footnote(self, parser):
         """Test _is_footnote identifies footnote references."""
         assert parser._is_footnote("(1) OJ L 123")
@@ -490,7 +739,7 @@ class TestCellarStandardHTMLParser:
         )
         
         parser.get_root(str(html_file))
-        table = parser.root.find('table')
+        table = parser.root.find('.//table')
         text = parser._extract_table_text(table)
         
         assert "Cell 1 | Cell 2" in text
@@ -505,11 +754,23 @@ class TestCellarStandardHTMLParser:
         )
         
         parser.get_root(str(html_file))
-        table = parser.root.find('table')
+        table = parser.root.find('.//table')
         text = parser._extract_table_text(table)
         
         assert text is None
 
+    def test_process_table_element_only_reads_article_tables(self, parser):
+        """Test tables are read only inside an article and blank rows are dropped."""
+        table = lxml_html.fromstring(
+            '<table><tr><td> </td><td></td></tr><tr><th>A</th><td>B</td></tr></table>'
+        )
+        content = []
+        with patch.object(parser, '_extract_table_text', wraps=parser._extract_table_text) as extract:
+            parser._process_table_element(table, None, content)
+            extract.assert_not_called()
+            parser._process_table_element(table, {'eId': 'art_1'}, content)
+        assert content == ["[TABLE]\nA | B"]
+
     def test_finalize_article_with_heading(self, parser):
         """Test _finalize_article uses first paragraph as heading."""
         parser.articles = []
@@ -527,6 +788,20 @@ class TestCellarStandardHTMLParser:
         assert parser.articles[0]['heading'] == "Short title"
         assert len(parser.articles[0]['children']) == 2
 
+    def test_finalize_article_leaves_reused_buffer_intact(self, parser):
+        """Articles do not share state with the paragraph buffer the caller clears."""
+        parser.articles = []
+        buffer = ["Short title", "First paragraph."]
+        parser._finalize_article({'eId': 'art_1', 'num': 'Article 1', 'heading': None, 'children': []}, buffer)
+        assert buffer == ["Short title", "First paragraph."]
+        buffer.clear()
+        buffer.append("Only paragraph.")
+        parser._finalize_article({'eId': 'art_2', 'num': 'Article 2', 'heading': 'H', 'children': []}, buffer)
+        first, second = parser.articles
+        assert first['heading'] == "Short title"
+        assert first['children'] == [{'eId': '001.001', 'text': 'First paragraph.'}]
+        assert second['children'] == [{'eId': '002.001', 'text': 'Only paragraph.'}]
+
     def test_finalize_article_lettered_points(self, parser):
         """Test _finalize_article groups lettered points together."""
         parser.articles = []
@@ -548,6 +823,51 @@ class TestCellarStandardHTMLParser:
         # Should have 2 children: first para, grouped (a)+(b), second para
         assert len(parser.articles[0]['children']) >= 2
 
+    def test_extract_articles_consolidated_uses_paragraph_styles(self, parser, tmp_path):
+        """Test consolidated extraction keys article numbers, headings and content off styles."""
+        html_file = tmp_path / "consolidated_styles.html"
+        html_file.write_text(
+            '''<html><body><txt_te>
+                <p style="font-style: italic; text-align: center">Article 1</p>
+                <p style="font-weight: bold; text-align: center">Subject matter</p>
+                <p>This Regulation lays down rules.</p>
+                <p style="text-align: center">\u25bcM1</p>
+                <p style="font-style: italic">Editorial note</p>
+                <p style="font-style: italic; text-align: center">Article 2</p>
+                <p>It shall apply from 1 January.</p>
+            </txt_te></body></html>''',
+            encoding='utf-8'
+        )
+        parser.get_root(str(html_file))
+        parser.get_preamble()
+        parser.articles = []
+
+        parser._extract_articles_consolidated()
+
+        assert [a['eId'] for a in parser.articles] == ['art_1', 'art_2']
+        assert parser.articles[0]['heading'] == 'Subject matter'
+        assert parser.articles[0]['children'] == [{'eId': '001.001', 'text': 'This Regulation lays down rules.'}]
+        assert parser.articles[1]['children'] == [{'eId': '002.001', 'text': 'It shall apply from 1 January.'}]
+
+    def test_finalize_article_groups_points_into_children(self, parser):
+        """Test _finalize_article numbers children and joins lettered and roman points."""
+        parser.articles = []
+        article = {'eId': 'art_12', 'num': 'Article 12', 'heading': 'Scope', 'children': []}
+        paragraphs = [
+            "1. First paragraph:",
+            "(a) first point;",
+            "(iv) roman point;",
+            "2. Second paragraph.",
+            "(B) upper-case point.",
+        ]
+
+        parser._finalize_article(article, paragraphs)
+
+        assert parser.articles[0]['children'] == [
+            {'eId': '012.001', 'text': "1. First paragraph:\n(a) first point;\n(iv) roman point;"},
+            {'eId': '012.002', 'text': "2. Second paragraph.\n(B) upper-case point."},
+        ]
+
     def test_get_conclusions_success(self, parser, tmp_path):
         """Test get_conclusions extracts conclusion text."""
         html_file = tmp_path / "conclusions.html"
@@ -567,6 +887,33 @@ class TestCellarStandardHTMLParser:
         assert parser.conclusions is not None
         assert "Done at Brussels" in parser.conclusions
 
+    def test_get_conclusions_only_cleans_candidates(self, parser, tmp_path):
+        """Test get_conclusions skips normalising paragraphs that cannot start with 'Done at'."""
+        html_file = tmp_path / "marked_conclusions.html"
+        html_file.write_text(
+            '''<html><body><txt_te>
+                <p>Article content</p>
+                <p>\u25bcB Done at Brussels, 20 December 2025.</p>
+                <p>For the Council</p>
+                <p>The President</p>
+            </txt_te></body></html>''',
+            encoding='utf-8'
+        )
+        parser.get_root(str(html_file))
+        parser.get_preamble()
+
+        parser.get_conclusions()
+        assert parser.conclusions == "Done at Brussels, 20 December 2025. For the Council The President"
+
+        # Without a 'Done at' paragraph nothing in the scan window is cleaned
+        done_at = parser.txt_te.findall('p')[1]
+        done_at.getparent().remove(done_at)
+        parser._paragraph_cache = parser._text_cache = None
+        with patch.object(parser, '_clean_text', wraps=parser._clean_text) as clean:
+            parser.get_conclusions()
+        assert parser.conclusions is None
+        clean.assert_not_called()
+
     def test_get_conclusions_not_found(self, parser, tmp_path):
         """Test get_conclusions when no conclusion found."""
         html_file = tmp_path / "no_conclusions.html"
@@ -620,3 +967,15 @@ class TestCellarStandardHTMLParser:
         
         result = parser.parse(str(html_file), validate=False)
         assert result == parser
+
+    def test_parse_with_validation_reuses_validator(self, tmp_path, sample_standard_html):
+        """The LegalJSON validator is built once and shared by every parse."""
+        from tulit.parser.parser import LegalJSONValidator
+        with patch.object(CellarStandardHTMLParser, '_legaljson_validator', None), \
+                patch('tulit.parser.html.cellar.cellar_standard.LegalJSONValidator',
+                      wraps=LegalJSONValidator) as validator_cls:
+            first = CellarStandardHTMLParser()
+            second = CellarStandardHTMLParser()
+            assert first.parse(sample_standard_html, validate=True) is first
+            assert second.parse(sample_standard_html, validate=True) is second
+        validator_cls.assert_called_once_with()
@@ -1,6 +1,7 @@
 import pytest
 import os
 from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 from tulit.parser.html.html_parser import HTMLParser
 from tulit.parser.html.cellar import CellarHTMLParser
 from tests.conftest import locate_data_dir
@@ -21,10 +22,41 @@ def parser():
 
 
 def test_get_root_loads_html(parser):
-    """Test that get_root loads HTML file and creates BeautifulSoup root."""
+    """Test that get_root loads HTML file and creates an lxml root."""
     assert os.path.exists(file_path), f"Test file not found at {file_path}"
     assert parser.root is not None
-    assert isinstance(parser.root, BeautifulSoup)
+    assert isinstance(parser.root, lxml_html.HtmlElement)
+    assert parser.root.tag == 'html'
+
+
+def test_base_get_root_uses_beautifulsoup(tmp_path):
+    """Test that the base HTMLParser.get_root still builds a BeautifulSoup root."""
+    html_file = tmp_path / "simple.html"
+    html_file.write_text("<html><body><p>Text</p></body></html>", encoding='utf-8')
+
+    p = CellarHTMLParser()
+    HTMLParser.get_root(p, str(html_file))
+
+    assert isinstance(p.root, BeautifulSoup)
+    assert p.root.builder.NAME == 'lxml'
+
+
+def test_base_get_root_accepts_xhtml_without_warning(tmp_path):
+    """Test that XHTML documents parse with the lxml builder without XMLParsedAsHTMLWarning."""
+    import warnings
+    html_file = tmp_path / "doc.xhtml"
+    html_file.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<html xmlns="http://www.w3.org/1999/xhtml"><body><p>Text</p></body></html>',
+        encoding='utf-8',
+    )
+
+    p = CellarHTMLParser()
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        HTMLParser.get_root(p, str(html_file))
+
+    assert p.root.find('p').get_text() == 'Text'
 
 
 def test_get_root_with_nonexistent_file():
@@ -256,4 +288,4 @@ def test_get_root_with_utf8_content(tmp_path):
     p.get_root(str(html_file))
     
     assert p.root is not None
-    assert '€' in str(p.root) or '\u20ac' in str(p.root)
+    assert '€ § ©' in p.root.text_content()
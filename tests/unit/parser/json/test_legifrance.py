@@ -1,6 +1,22 @@
 import importlib
+import json
+from unittest.mock import patch
 
 
 class TestLegifrance:
     def test_import(self):
         importlib.import_module('tulit.parser.json.legifrance')
+
+    def test_save_legaljson_same_output_with_and_without_orjson(self, tmp_path):
+        module = importlib.import_module('tulit.parser.json.legifrance')
+        parser = module.LegifranceParser(log_dir=str(tmp_path / 'logs'))
+        legal_json = {'preface': 'Code civil – Article 1er', 'articles': [{'eId': 'art_1', 'num': 1}]}
+
+        parser.save_legaljson(legal_json, str(tmp_path / 'default.json'))
+        with patch.object(module, 'orjson', None):
+            parser.save_legaljson(legal_json, str(tmp_path / 'stdlib.json'))
+
+        default = (tmp_path / 'default.json').read_text(encoding='utf-8')
+        stdlib = (tmp_path / 'stdlib.json').read_text(encoding='utf-8')
+        assert json.loads(default) == json.loads(stdlib) == legal_json
+        assert default == stdlib
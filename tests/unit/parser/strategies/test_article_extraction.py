@@ -4,3 +4,26 @@ import importlib
 class TestArticleExtraction:
     def test_import(self):
         importlib.import_module('tulit.parser.strategies.article_extraction')
+
+    def test_article_marker_and_number_helpers(self):
+        module = importlib.import_module('tulit.parser.strategies.article_extraction')
+        strategy = module.CellarStandardArticleStrategy()
+        assert strategy._is_article_marker('Article 3')
+        assert strategy._is_article_marker('ARTICLE 2a Definitions')
+        assert not strategy._is_article_marker('Article 28 of Regulation (EEC) No 1204/72')
+        assert not strategy._is_article_marker('Article 5 (1) applies')
+        assert not strategy._is_article_marker('See Article 4')
+        assert strategy._extract_article_number('Article 7 – Scope') == ('7', 'Scope')
+        assert strategy._generate_article_eid('Art. 12a') == '012a'
+
+    def test_find_elements_reuses_compiled_xpath(self):
+        from lxml import etree
+        module = importlib.import_module('tulit.parser.strategies.article_extraction')
+        strategy = module.FormexArticleStrategy(namespaces={'a': 'urn:a'})
+        doc = etree.fromstring('<r xmlns:a="urn:a"><a:p/><a:p/><p/></r>')
+        module._compiled_xpath.cache_clear()
+        assert len(strategy._find_elements(doc, './/a:p')) == 2
+        assert len(strategy._find_elements(doc, './/a:p')) == 2
+        assert module._compiled_xpath.cache_info().hits == 1
+        plain = module.FormexArticleStrategy()
+        assert [e.tag for e in plain._find_elements(doc, './p')] == ['p']
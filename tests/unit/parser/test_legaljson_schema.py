@@ -7,3 +7,120 @@ class TestLegaljsonSchema:
         pkg = importlib.import_module('tulit.parser')
         base = pathlib.Path(pkg.__file__).parent / 'legaljson_schema.json'
         assert base.exists(), f"Schema file not found: {base}"
+
+    def test_validator_checks_schema_once(self):
+        from unittest.mock import patch
+        from tulit.parser.parser import LegalJSONValidator
+        validator = LegalJSONValidator()
+        with patch('tulit.parser.parser.jsonschema.validate') as validate, \
+                patch.object(type(validator._validator), 'check_schema') as check_schema:
+            assert validator.validate([]) is False
+            assert validator.validate('not a document') is False
+        validate.assert_not_called()
+        check_schema.assert_not_called()
+
+    def test_validator_builds_errors_only_for_invalid_data(self, tmp_path):
+        import json
+        from unittest.mock import patch
+        from tulit.parser.parser import LegalJSONValidator
+        schema = tmp_path / 'schema.json'
+        schema.write_text(json.dumps({'type': 'object', 'required': ['articles']}), encoding='utf-8')
+        validator = LegalJSONValidator(str(schema))
+        import jsonschema
+        with patch('tulit.parser.parser.jsonschema.exceptions.best_match',
+                   wraps=jsonschema.exceptions.best_match) as best_match:
+            assert validator.validate({'articles': []}) is True
+            best_match.assert_not_called()
+            assert validator.validate({}) is False
+            best_match.assert_called_once()
+
+    def test_validator_loads_same_schema_with_and_without_orjson(self):
+        from unittest.mock import patch
+        from tulit.parser import parser as module
+        default = module.LegalJSONValidator()
+        with patch.object(module, 'orjson', None), \
+                patch.dict(module.LegalJSONValidator._schema_cache, clear=True):
+            stdlib = module.LegalJSONValidator()
+        assert default.schema == stdlib.schema
+
+    def test_validator_uses_compiled_schema_when_available(self):
+        import types
+        from unittest.mock import patch, MagicMock
+        from tulit.parser import parser as module
+
+        class DefinitionException(Exception):
+            pass
+
+        class ValueException(Exception):
+            pass
+
+        def compiled(data):
+            if not isinstance(data, dict):
+                raise ValueException('not an object')
+            return data
+
+        fake = types.SimpleNamespace(
+            compile=MagicMock(return_value=compiled),
+            JsonSchemaDefinitionException=DefinitionException,
+            JsonSchemaValueException=ValueException,
+        )
+        with patch.object(module, 'fastjsonschema', fake), \
+                patch.dict(module.LegalJSONValidator._schema_cache, clear=True):
+            validator = module.LegalJSONValidator()
+            fake.compile.assert_called_once_with(validator.schema, use_default=False)
+            with patch.object(type(validator._validator), 'is_valid') as is_valid:
+                assert validator._is_valid({}) is True
+                assert validator._is_valid([]) is False
+            is_valid.assert_not_called()
+            # Invalid documents are still reported through jsonschema
+            assert validator.validate([]) is False
+
+            fake.compile.side_effect = DefinitionException('unsupported draft')
+            module.LegalJSONValidator._schema_cache.clear()
+            fallback = module.LegalJSONValidator()
+        assert fallback._compiled is None
+        assert fallback._is_valid([]) is False
+
+    def test_validator_trusts_jsonschema_when_validators_disagree(self, tmp_path):
+        import json, types
+        from unittest.mock import patch, MagicMock
+        from tulit.parser import parser as module
+
+        class ValueException(Exception):
+            pass
+
+        def compiled(data):
+            raise ValueException('always rejected')
+
+        fake = types.SimpleNamespace(
+            compile=MagicMock(return_value=compiled),
+            JsonSchemaDefinitionException=Exception,
+            JsonSchemaValueException=ValueException,
+        )
+        with patch.object(module, 'fastjsonschema', fake), \
+                patch.dict(module.LegalJSONValidator._schema_cache, clear=True):
+            schema = tmp_path / 'schema.json'
+            schema.write_text(json.dumps({'type': 'object'}), encoding='utf-8')
+            validator = module.LegalJSONValidator(str(schema))
+            with patch.object(validator.logger, 'warning') as warning:
+                assert validator.validate({}) is True
+            warning.assert_called_once()
+            assert validator.validate([]) is False
+
+    def test_validator_shares_loaded_schema(self, tmp_path):
+        import json, os
+        from unittest.mock import patch
+        from tulit.parser import parser as module
+        schema = tmp_path / 'schema.json'
+        schema.write_text(json.dumps({'type': 'object'}), encoding='utf-8')
+        first = module.LegalJSONValidator(str(schema))
+        with patch.object(module.jsonschema.validators, 'validator_for') as validator_for:
+            second = module.LegalJSONValidator(str(schema))
+        validator_for.assert_not_called()
+        assert second.schema is first.schema and second._validator is first._validator
+
+        # A rewritten schema file is loaded afresh
+        schema.write_text(json.dumps({'type': 'array'}), encoding='utf-8')
+        stat = os.stat(schema)
+        os.utime(schema, (stat.st_atime, stat.st_mtime + 10))
+        assert module.LegalJSONValidator(str(schema)).schema == {'type': 'array'}
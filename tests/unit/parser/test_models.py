@@ -4,3 +4,23 @@ import importlib
 class TestModelsModule:
     def test_import(self):
         importlib.import_module('tulit.parser.models')
+
+    def test_records_are_slotted(self):
+        models = importlib.import_module('tulit.parser.models')
+        article = models.Article(eId='art_1', num='Article 1',
+                                 children=[models.ArticleChild(eId='001.001', text='Text')])
+        for record in (article, article.children[0], models.Citation('cit_1', 'C'),
+                       models.Recital('rct_1', 'R'), models.Chapter('cpt_1', 'I')):
+            assert not hasattr(record, '__dict__')
+        assert article.to_dict() == {
+            'eId': 'art_1', 'num': 'Article 1',
+            'children': [{'eId': '001.001', 'text': 'Text'}],
+        }
+
+    def test_article_child_amendment_only_when_set(self):
+        models = importlib.import_module('tulit.parser.models')
+        assert models.ArticleChild('001.001', 'Text').to_dict() == {'eId': '001.001', 'text': 'Text'}
+        assert models.ArticleChild('001.002', 'Text', amendment=False).to_dict() == {
+            'eId': '001.002', 'text': 'Text', 'amendment': False,
+        }
+        assert list(models.ArticleChild('001.003', 'T', amendment=True).to_dict()) == ['eId', 'text', 'amendment']
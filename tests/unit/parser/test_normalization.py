@@ -4,3 +4,96 @@ import importlib
 class TestNormalizationModule:
     def test_import(self):
         importlib.import_module('tulit.parser.normalization')
+
+    def test_whitespace_normalizer_single_scan_matches_two_passes(self):
+        import re
+        from tulit.parser.normalization import WhitespaceNormalizer
+
+        def two_passes(text):
+            text = text.replace('\n', '').replace('\t', '').replace('\r', '')
+            text = re.sub(r'\s+', ' ', text).strip()
+            return re.sub(r'\s+([.,!?;:\'])', r'\1', text)
+
+        normalizer = WhitespaceNormalizer()
+        for text in (
+            'Article  1 , first ;\tsecond .',
+            '   . leading',
+            'trailing \x0c ',
+            "word 's   gap",
+            'a\nb \n c',
+            'plain words only',
+        ):
+            assert normalizer.normalize(text) == two_passes(text)
+        assert WhitespaceNormalizer(fix_punctuation=False).normalize(' a  ,\x0cb ') == 'a , b'
+
+    def test_composite_normalizer_applies_strategies_in_order(self):
+        from tulit.parser.normalization import (
+            CompositeNormalizer, PatternReplacementNormalizer, create_html_normalizer
+        )
+        composite = CompositeNormalizer([
+            PatternReplacementNormalizer([(r'a', 'b')]),
+            PatternReplacementNormalizer([(r'b', 'c')]),
+        ])
+        assert composite.normalize('ab') == 'cc'
+        assert composite.normalize('') == ''
+        assert create_html_normalizer().normalize(' ▼B Text  ,\nmore ') == 'Text,more'
+
+    def test_whitespace_normalizer_clean_text_shortcut_matches_full_path(self):
+        import random
+        from tulit.parser.normalization import WhitespaceNormalizer
+
+        def full_path(normalizer, text):
+            # The regex path normalize() takes for text that needs work
+            text = text.replace('\n', '').replace('\t', '').replace('\r', '')
+            if normalizer.fix_punctuation:
+                text = normalizer._WHITESPACE_AND_PUNCT_RE.sub(normalizer._collapse_run, text)
+            else:
+                text = normalizer._WHITESPACE_RE.sub(' ', text)
+            return text.strip()
+
+        rng = random.Random(7)
+        alphabet = ['a', 'É', ' ', '  ', '.', ',', "'", ';', '\n', '\t', '\xa0', ' ', '\x1c']
+        for fix_punctuation in (True, False):
+            normalizer = WhitespaceNormalizer(fix_punctuation=fix_punctuation)
+            for _ in range(500):
+                text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 12)))
+                assert normalizer.normalize(text) == full_path(normalizer, text), repr(text)
+
+    def test_unicode_normalizer_skips_normalized_text(self):
+        from unittest.mock import patch
+        from tulit.parser import normalization
+        normalizer = normalization.UnicodeNormalizer(unicode_form='NFC')
+        with patch.object(normalization.unicodedata, 'normalize', wraps=normalization.unicodedata.normalize) as normalize:
+            assert normalizer.normalize('Café') == 'Café'
+            normalize.assert_not_called()
+            assert normalizer.normalize('Café') == 'Café'
+            normalize.assert_called_once()
+
+    def test_pattern_replacement_skips_patterns_missing_their_first_char(self):
+        from tulit.parser.normalization import PatternReplacementNormalizer
+        required = PatternReplacementNormalizer._required_first_char
+        assert required(r'▼[A-Z]\d*') == '▼'
+        assert required(r'a+b') == 'a'
+        for pattern in (r'^\(\d+\)', r'a?b', r'a*', r'a{0,2}', r'a|b', r'\d', r'[ab]', r'(x)', ''):
+            assert required(pattern) is None, pattern
+
+        normalizer = PatternReplacementNormalizer([(r'▼[A-Z]\d*', ''), (r'a|b', 'c'), (r'^\(\d+\)', '')])
+        assert normalizer.normalize('(1) a ▼B12text') == ' c text'
+        assert normalizer.normalize('text') == 'text'
+
+    def test_pattern_replacement_accepts_compiled_patterns(self):
+        import re
+        from tulit.parser.normalization import PatternReplacementNormalizer
+        required = PatternReplacementNormalizer._required_first_char
+        assert required(re.compile(r'▼[A-Z]\d*')) == '▼'
+        assert required(re.compile(r'a|b')) is None
+        # A case-insensitive pattern may start with either case
+        assert required(re.compile(r'x\d', re.IGNORECASE)) is None
+        assert required(re.compile(rb'x')) is None
+
+        normalizer = PatternReplacementNormalizer([
+            (re.compile(r'▼[A-Z]\d*'), ''),
+            (re.compile(r'note', re.IGNORECASE), 'N'),
+        ])
+        assert normalizer.normalize('NOTE ▼B12text') == 'N text'
+        assert normalizer.normalize('text') == 'text'
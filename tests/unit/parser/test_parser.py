@@ -49,6 +49,20 @@ class TestAbstractParserEnforcement:
         parser = CompleteParser()
         assert parser is not None
         assert parser.get_preface() == "Test Preface"
+
+    def test_logger_is_resolved_once_per_class(self):
+        """Test each subclass gets its fully qualified logger without a per-instance lookup."""
+        import logging
+        from unittest.mock import patch
+        from tulit.parser.html.cellar.cellar_standard import CellarStandardHTMLParser
+
+        assert CellarStandardHTMLParser._logger is logging.getLogger(
+            'tulit.parser.html.cellar.cellar_standard.CellarStandardHTMLParser'
+        )
+        with patch('tulit.parser.parser.logging.getLogger') as get_logger:
+            first, second = CellarStandardHTMLParser(), CellarStandardHTMLParser()
+        get_logger.assert_not_called()
+        assert first.logger is second.logger is CellarStandardHTMLParser._logger
     
     def test_abstract_methods_have_correct_signatures(self):
         """Test that abstract methods have expected signatures."""
@@ -249,3 +263,61 @@ class TestConcreteImplementations:
         assert parser is not None
         assert isinstance(parser, Parser)
         assert isinstance(parser, HTMLParser)
+
+
+class TestToDictSerialization:
+    """Test to_dict() conversion of extracted data."""
+    
+    def test_scalar_leaves_skip_json_probe(self):
+        """Test that JSON-native leaves are returned without a json.dumps check."""
+        from unittest.mock import patch
+        from lxml import etree
+        
+        class MinimalParser(Parser):
+            def get_preface(self):
+                return None
+            
+            def get_articles(self):
+                pass
+            
+            def parse(self, file):
+                return self
+        
+        parser = MinimalParser()
+        parser.preface = etree.fromstring('<p>Title <b>text</b></p>')
+        parser.articles = [{'eId': 'art_1', 'num': 1, 'heading': None,
+                            'children': [{'text': 'Body', 'amendment': False}]}]
+        
+        with patch('tulit.parser.parser.json.dumps') as dumps:
+            result = parser.to_dict()
+        
+        dumps.assert_not_called()
+        assert result['preface'] == 'Title text'
+        assert result['articles'] == parser.articles
+
+    def test_to_json_matches_with_and_without_orjson(self):
+        """Test that to_json() encodes to_dict() identically on both paths."""
+        import json
+        from unittest.mock import patch
+        from tulit.parser import parser as module
+        
+        class MinimalParser(Parser):
+            def get_preface(self):
+                return None
+            
+            def get_articles(self):
+                pass
+            
+            def parse(self, file):
+                return self
+        
+        parser = MinimalParser()
+        parser.preface = 'Règlement (UE) 2016/679 — "GDPR"'
+        parser.articles = [{'eId': 'art_1', 'num': 'Article 1', 'heading': None,
+                            'children': [{'eId': '001.001', 'text': 'Texte', 'amendment': False}]}]
+        
+        encoded = parser.to_json()
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == parser.to_dict()
+        with patch.object(module, 'orjson', None):
+            assert parser.to_json() == encoded
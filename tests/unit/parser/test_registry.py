@@ -4,3 +4,64 @@ import importlib
 class TestRegistryModule:
     def test_import(self):
         importlib.import_module('tulit.parser.registry')
+
+    def test_create_resolves_aliases_and_prefers_factories(self):
+        import pytest
+        from tulit.parser.registry import ParserRegistry
+        from tulit.parser.exceptions import ParserError
+
+        class Plain:
+            def __init__(self, value=None):
+                self.value = value
+
+        registry = ParserRegistry()
+        registry.register('xml', Plain, aliases=['xmldoc'])
+        assert isinstance(registry.create('xmldoc', value=1), Plain)
+        assert registry.create('xml', 2).value == 2
+
+        registry.register_factory('xml', lambda **kwargs: 'from factory')
+        assert registry.create('xml') == 'from factory'
+        assert registry.create('xmldoc') == 'from factory'
+
+        # Unknown names report every registered format
+        registry.register_factory('html', lambda: 'html', aliases=['web'])
+        assert registry.is_registered('web') and not registry.is_registered('pdf')
+        with pytest.raises(ParserError, match="Available formats: html, xml"):
+            registry.create('pdf')
+
+    def test_alias_conflict_keeps_format_usable(self):
+        import pytest
+        from tulit.parser.registry import ParserRegistry
+        from tulit.parser.exceptions import ParserError
+
+        registry = ParserRegistry()
+        registry.register('a', object, aliases=['shared'])
+        with pytest.raises(ParserError, match="Alias 'shared'"):
+            registry.register('b', dict, aliases=['bee', 'shared'])
+        with pytest.raises(ParserError, match="Alias 'shared'"):
+            registry.register_factory('c', lambda: 'c', aliases=['shared'])
+        # The format and the aliases before the conflict are registered, as
+        # the error leaves them in place
+        assert registry.is_registered('b') and registry.is_registered('bee')
+        assert registry.create('bee') == {}
+        assert registry.create('c') == 'c'
+        assert registry.list_formats() == ['a', 'b', 'c']
+        with pytest.raises(ParserError, match="already registered"):
+            registry.register('b', dict)
+
+    def test_list_aliases_returns_a_copy(self):
+        from tulit.parser.registry import ParserRegistry
+
+        registry = ParserRegistry()
+        registry.register('xml', object, aliases=['xmldoc'])
+        aliases = registry.list_aliases()
+        assert aliases == {'xmldoc': 'xml'}
+        aliases['other'] = 'xml'
+        assert registry.list_aliases() == {'xmldoc': 'xml'}
+        assert not registry.is_registered('other')
+        registry.register_factory('html', lambda: None, aliases=['web'])
+        assert 'web' not in aliases
+        assert registry.list_aliases() == {'xmldoc': 'xml', 'web': 'html'}
+        formats = registry.list_formats()
+        formats.append('mutated')
+        assert registry.list_formats() == ['html', 'xml']
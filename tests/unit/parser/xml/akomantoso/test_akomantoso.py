@@ -125,7 +125,21 @@ class TestAkomaNtosoParser(unittest.TestCase):
         }
         self.parser.get_conclusions()
         self.assertEqual(self.parser.conclusions, conclusions, "Parsed conclusions do not match expected output")
-        
+
+    def test_get_conclusions_outside_schema_position(self):
+        """Conclusions and signature containers nested deeper are still found."""
+        self.parser.root = etree.fromstring("""
+        <akomaNtoso xmlns='http://docs.oasis-open.org/legaldocml/ns/akn/3.0'>
+          <components><component><doc><conclusions><blockContainer>
+            <container name='signature'><p><signature><date date='2024-01-01'>1 January 2024</date>
+              Signed</signature></p></container>
+          </blockContainer></conclusions></doc></component></components>
+        </akomaNtoso>
+        """)
+        self.parser.get_conclusions()
+        self.assertEqual(self.parser.conclusions,
+                         {'date': '1 January 2024', 'signatures': [['1 January 2024\n              Signed']]})
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -96,6 +96,38 @@ class TestAkomaNtosoUtilsAndExtractors(unittest.TestCase):
         self.assertEqual(a.extract_eId(e), 'eid_1')
         self.assertEqual(a.extract_eId(etree.Element('a'), index=2), 'art_2')
 
+    def test_namespaces_copied_per_instance(self):
+        for cls, akn in ((AkomaNtosoParser, 'http://docs.oasis-open.org/legaldocml/ns/akn/3.0'),
+                         (AKN4EUParser, 'http://docs.oasis-open.org/legaldocml/ns/akn/3.0'),
+                         (GermanLegalDocMLParser, 'http://Inhaltsdaten.LegalDocML.de/1.8.2/'),
+                         (LuxembourgAKNParser, 'http://docs.oasis-open.org/legaldocml/ns/akn/3.0/CSD13')):
+            first, second = cls(), cls()
+            self.assertEqual(first.namespaces['akn'], akn)
+            self.assertEqual(first.namespaces, cls.NAMESPACES)
+            self.assertEqual(first.namespaces, second.namespaces)
+            self.assertIsNot(first.namespaces, second.namespaces)
+            self.assertIsNot(first._extractor.namespaces, cls.NAMESPACES)
+            # Mutating one instance leaves other instances and the class alone
+            first.namespaces['extra'] = 'http://example.org'
+            self.assertNotIn('extra', second.namespaces)
+            self.assertNotIn('extra', cls.NAMESPACES)
+            self.assertNotIn('extra', cls().namespaces)
+
+    def test_strip_authorial_notes_matches_remove_node(self):
+        xml = """
+        <body xmlns='http://docs.oasis-open.org/legaldocml/ns/akn/3.0'>
+          <p><authorialNote><p>lead</p></authorialNote>first<b>bold</b><authorialNote/>
+          mid<authorialNote><authorialNote/>nested</authorialNote>end</p>
+        </body>
+        """
+        expected = AkomaNtosoParser()
+        expected.body = expected.remove_node(etree.fromstring(xml), './/akn:authorialNote')
+        parser = AkomaNtosoParser()
+        parser.body = etree.fromstring(xml)
+        parser._strip_authorial_notes()
+        self.assertEqual(''.join(parser.body.itertext()), ''.join(expected.body.itertext()))
+        self.assertEqual([el.tag for el in parser.body.iter()], [el.tag for el in expected.body.iter()])
+
     def test_article_extractor(self):
         ns = {'akn': 'http://docs.oasis-open.org/legaldocml/ns/akn/3.0'}
         extractor = AKNArticleExtractor(ns)
@@ -115,6 +147,57 @@ class TestAkomaNtosoUtilsAndExtractors(unittest.TestCase):
         elems = extractor.extract_paragraphs_by_eid(article)
         self.assertTrue(any('par_1' in e['eId'] or e['eId']=='par_1' for e in elems))
 
+    def test_paragraph_text_joins_skip_empty_p(self):
+        ns = {'akn': 'http://docs.oasis-open.org/legaldocml/ns/akn/3.0'}
+        extractor = AKNArticleExtractor(ns)
+        article = etree.fromstring("""
+        <article eId='art_1' xmlns='http://docs.oasis-open.org/legaldocml/ns/akn/3.0'>
+          <paragraph eId='par_1'><p>Text <i>A</i></p><p> </p><p>more</p></paragraph>
+          <paragraph eId='par_2'><p>Text B</p></paragraph>
+          <intro>plain intro</intro>
+        </article>
+        """)
+        self.assertEqual(extractor.extract_paragraphs_by_eid(article), [
+            {'eId': 'par_1', 'text': 'Text A more'},
+            {'eId': 'par_2', 'text': 'Text B'},
+        ])
+        self.assertEqual(extractor._get_p_text(article[0]), 'Text A more')
+        self.assertEqual(extractor._get_p_text(None), '')
+        self.assertEqual(extractor._extract_element_text(article[2]), 'plain intro')
+
+    def test_article_extractor_uses_akn_namespace_binding(self):
+        ns = {'akn': 'http://Inhaltsdaten.LegalDocML.de/1.8.2/'}
+        extractor = AKNArticleExtractor(ns)
+        article = etree.fromstring("""
+        <article eId='art_1' xmlns='http://Inhaltsdaten.LegalDocML.de/1.8.2/'
+                 xmlns:o='http://docs.oasis-open.org/legaldocml/ns/akn/3.0'>
+          <o:num>ignored</o:num>
+          <num>2</num>
+          <paragraph eId='par_1'><num>(1)</num><content><p>Text</p></content></paragraph>
+        </article>
+        """)
+        self.assertEqual(extractor.extract_article_metadata(article)['num'], '2')
+        self.assertEqual(extractor.extract_paragraphs_by_eid(article),
+                         [{'eId': 'par_1', 'text': 'Text'}])
+
+    def test_article_metadata_heading_fallback(self):
+        extractor = AKNArticleExtractor({'akn': 'http://docs.oasis-open.org/legaldocml/ns/akn/3.0'})
+        def article(body):
+            return etree.fromstring(
+                "<article eId='art_1' xmlns='http://docs.oasis-open.org/legaldocml/ns/akn/3.0'>"
+                f"{body}</article>")
+        # A <heading> wins over a second <num>, wherever it sits
+        meta = extractor.extract_article_metadata(article(
+            '<heading>Scope</heading><num>Article 1</num><num>Other</num>'))
+        self.assertEqual((meta['num'], meta['heading']), ('Article 1', 'Scope'))
+        meta = extractor.extract_article_metadata(article(
+            '<num>Article 1</num><num>Scope</num><paragraph><num>1.</num></paragraph>'))
+        self.assertEqual((meta['num'], meta['heading']), ('Article 1', 'Scope'))
+        # Nested <num> elements are not direct children and are ignored
+        meta = extractor.extract_article_metadata(article(
+            '<num>Article 1</num><paragraph><num>1.</num></paragraph>'))
+        self.assertIsNone(meta['heading'])
+
     def test_content_processor_lists_and_tables(self):
         ns = {'akn': 'http://docs.oasis-open.org/legaldocml/ns/akn/3.0'}
         proc = AKNContentProcessor(ns)
@@ -103,6 +103,41 @@ def test_get_chapters(iopa_parser):
     assert [c['eId'] for c in iopa_parser.chapters] == [f'cpt_{i}' for i in range(1, 7)]
 
 
+def test_get_chapters_legacy_titles():
+    """Bare TITLE elements use their first two HT as number and heading."""
+    p = Formex4Parser()
+    p.body = etree.fromstring(
+        '<ENACTING.TERMS>'
+        '<TITLE><TI><P><HT>CHAPTER I</HT></P></TI><STI><P><HT>Scope</HT></P>'
+        '<P><HT>ignored</HT></P></STI></TITLE>'
+        '<TITLE><TI><P><HT>Only one</HT></P></TI></TITLE>'
+        '<ARTICLE IDENTIFIER="001"><TI.ART>Article 1</TI.ART></ARTICLE>'
+        '</ENACTING.TERMS>'
+    )
+    chapters = p.get_chapters()
+    assert chapters == [{
+        'eId': 'cpt_I', 'type': 'chapter', 'num': 'CHAPTER I',
+        'heading': 'Scope', 'parent': None,
+    }]
+
+
+def test_get_articles_resolves_elements_by_identifier():
+    """Headings come from the first ARTICLE carrying each IDENTIFIER."""
+    p = Formex4Parser()
+    p.body = etree.fromstring(
+        '<ENACTING.TERMS>'
+        '<ARTICLE IDENTIFIER="3001"><TI.ART>Article 1</TI.ART>'
+        '<STI.ART><P>Subject matter</P></STI.ART><ALINEA>One.</ALINEA></ARTICLE>'
+        '<ARTICLE IDENTIFIER="002"><TI.ART>Article 2</TI.ART>'
+        '<STI.ART><P>Scope</P></STI.ART><ALINEA>Two.</ALINEA></ARTICLE>'
+        '</ENACTING.TERMS>'
+    )
+    p.get_articles()
+    assert [(a['eId'], a['heading']) for a in p.articles] == [
+        ('art_1', 'Subject matter'), ('art_2', 'Scope'),
+    ]
+
+
 def test_get_articles(parser):
     parser.get_body()
     parser.get_articles()
@@ -879,6 +914,19 @@ def test_parse_skips_annex_files_referenced_as_inclusions(tmp_path):
     assert p.annexes[0]['children'][0]['text'] == 'Part 1 requirements.'
 
 
+def test_included_filerefs_ignore_manifest_declarations(tmp_path):
+    """Streamed inclusion scan counts body references, not BIB.INSTANCE ones."""
+    annex = tmp_path / "annex.xml"
+    annex.write_text(
+        '<ANNEX><BIB.INSTANCE><DOCUMENT.REF FILE="annex.xml"/>'
+        '<INCL.ELEMENT FILEREF="manifest_only.xml" TYPE="FORMEX.DOC"/></BIB.INSTANCE>'
+        '<CONTENTS><P>Intro.</P><INCL.ELEMENT FILEREF="sub/body_ref.xml" TYPE="FORMEX.DOC"/>'
+        '</CONTENTS></ANNEX>'
+    )
+
+    assert Formex4Parser._included_filerefs(str(annex)) == {'body_ref.xml'}
+
+
 def test_annotation_table_notes_are_extracted():
     """GR.NOTES containing GR.ANNOTATION blocks (not just NOTE) are kept."""
     p = Formex4Parser()
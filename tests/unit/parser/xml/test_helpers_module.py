@@ -1,7 +1,7 @@
 import unittest
 from lxml import etree
 
-from tulit.parser.xml.helpers import XMLNodeExtractor, XMLValidator
+from tulit.parser.xml.helpers import XMLNodeExtractor, XMLValidator, text_content
 from tulit.parser.xml.xml import XMLParser
 from tulit.parser.exceptions import FileLoadError
 
@@ -32,6 +32,20 @@ class TestXMLHelpersAndParser(unittest.TestCase):
         texts = self.extractor.extract_text_from_all(xml, './/p')
         self.assertEqual(texts, ['one', 'twosub'])
 
+    def test_text_content_matches_itertext(self):
+        xml = etree.fromstring('<root>a<b>b<!-- skipped --><c>c</c>d</b>e</root>')
+        for el in xml.iter(etree.Element):
+            self.assertEqual(text_content(el), ''.join(el.itertext()))
+        self.assertEqual(text_content(xml.find('b')), 'bcd')
+        self.assertIsInstance(text_content(xml), str)
+
+    def test_find_and_findall_accept_compiled_xpath(self):
+        xml = etree.fromstring('<root><p>one</p><p>two</p></root>')
+        compiled = etree.XPath('.//p[not(ancestor::q)]')
+        self.assertEqual(len(self.extractor.findall(xml, compiled)), 2)
+        self.assertEqual(self.extractor.find(xml, compiled).text, 'one')
+        self.assertIsNone(self.extractor.find(xml, etree.XPath('.//missing')))
+
     def test_safe_find_and_safe_find_text(self):
         xml = etree.fromstring('<root><a>hello</a></root>')
         found = self.extractor.safe_find(xml, './/a')
@@ -66,6 +80,36 @@ class TestXMLHelpersAndParser(unittest.TestCase):
         with self.assertRaises(FileLoadError):
             self.parser.get_root()
 
+    def test_secure_parser_is_shared_and_keeps_entities_unresolved(self):
+        import tempfile, os
+        self.assertIs(self.parser._create_secure_parser(), FakeXMLParser()._create_secure_parser())
+        # libxml2's depth and size limits stay on: nesting beyond the
+        # default maximum depth is rejected
+        with self.assertRaises(etree.XMLSyntaxError):
+            etree.fromstring('<a>' * 300 + '</a>' * 300, self.parser._create_secure_parser())
+
+        with tempfile.TemporaryDirectory() as tmp:
+            secret = os.path.join(tmp, 'secret.txt')
+            with open(secret, 'w', encoding='utf-8') as fh:
+                fh.write('leaked')
+            doc = os.path.join(tmp, 'doc.xml')
+            with open(doc, 'w', encoding='utf-8') as fh:
+                fh.write(f'<!DOCTYPE r [<!ENTITY x SYSTEM "file://{secret}">]><r>a&x;b</r>')
+            self.parser.get_root(doc)
+        self.assertNotIn('leaked', text_content(self.parser.root))
+
+    def test_secure_parser_accepts_remote_doctype(self):
+        import tempfile, os
+        # The external DTD is neither fetched nor required to parse the file
+        with tempfile.TemporaryDirectory() as tmp:
+            doc = os.path.join(tmp, 'doc.xml')
+            with open(doc, 'w', encoding='utf-8') as fh:
+                fh.write('<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN" '
+                         '"http://www.w3.org/TR/xhtml1/DTD/xhtml1-strict.dtd">'
+                         '<html xmlns="http://www.w3.org/1999/xhtml"><body><p id="p1">text</p></body></html>')
+            self.parser.get_root(doc)
+        self.assertEqual(text_content(self.parser.root), 'text')
+
     def test_remove_nodes_prev_sibling(self):
         xml = etree.fromstring('<root><a>one</a><to_remove/>tail</root>')
         # ensure previous sibling exists
@@ -131,6 +175,82 @@ class TestXMLHelpersAndParser(unittest.TestCase):
             except Exception:
                 pass
 
+    def test_validator_reuses_compiled_schema(self):
+        import importlib, os
+        from unittest.mock import patch
+        pkg = importlib.import_module('tulit.parser')
+        schema = os.path.join(os.path.dirname(pkg.__file__), 'xml', 'assets', 'xml.xsd')
+        self.assertTrue(self.validator.load_schema(schema))
+        with patch('tulit.parser.xml.helpers.etree.XMLSchema') as compile_schema:
+            other = XMLValidator()
+            self.assertTrue(other.load_schema(schema))
+        compile_schema.assert_not_called()
+        self.assertIs(other.schema, self.validator.schema)
+        self.assertEqual(other._expected_roots, self.validator._expected_roots)
+
+    def test_validators_sharing_a_schema_keep_their_own_errors(self):
+        import tempfile, os
+        from tulit.parser.exceptions import SchemaValidationError
+        xsd = b"""
+        <xs:schema xmlns:xs='http://www.w3.org/2001/XMLSchema'>
+            <xs:element name='ACT'>
+                <xs:complexType><xs:sequence><xs:element name='TITLE' type='xs:string'/></xs:sequence></xs:complexType>
+            </xs:element>
+        </xs:schema>
+        """
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.xsd') as fh:
+            fh.write(xsd)
+            xsd_path = fh.name
+
+        try:
+            other = XMLValidator()
+            self.assertTrue(self.validator.load_schema(xsd_path))
+            self.assertTrue(other.load_schema(xsd_path))
+            self.assertIs(other.schema, self.validator.schema)
+
+            with self.assertRaises(SchemaValidationError) as ctx:
+                self.validator.validate(etree.fromstring('<ACT><OTHER/></ACT>'))
+            errors = self.validator.get_validation_errors()
+            self.assertEqual(errors, ctx.exception.validation_errors)
+            self.assertTrue(errors)
+
+            # Another validator using the same schema object does not
+            # overwrite the errors reported by the first one
+            self.assertTrue(other.validate(etree.fromstring('<ACT><TITLE>t</TITLE></ACT>')))
+            self.assertEqual(other.get_validation_errors(), [])
+            self.assertEqual(self.validator.get_validation_errors(), errors)
+        finally:
+            os.unlink(xsd_path)
+
+    def test_validator_rejects_undeclared_root(self):
+        import tempfile, os
+        xsd = b"""
+        <xs:schema xmlns:xs='http://www.w3.org/2001/XMLSchema'>
+            <xs:element name='ACT'>
+                <xs:complexType><xs:sequence><xs:element name='TITLE' type='xs:string'/></xs:sequence></xs:complexType>
+            </xs:element>
+        </xs:schema>
+        """
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.xsd') as fh:
+            fh.write(xsd)
+            xsd_path = fh.name
+
+        try:
+            self.assertTrue(self.validator.load_schema(xsd_path))
+            self.assertEqual(self.validator._expected_roots, {'ACT'})
+
+            from tulit.parser.exceptions import SchemaValidationError
+            with self.assertRaises(SchemaValidationError) as ctx:
+                self.validator.validate(etree.ElementTree(etree.fromstring('<html><body/></html>')))
+            self.assertIn("Root element 'html'", ctx.exception.validation_errors[0])
+            self.assertEqual(self.validator.get_validation_errors(), ctx.exception.validation_errors)
+
+            # A declared root still goes through full validation
+            self.assertTrue(self.validator.validate(etree.fromstring('<ACT><TITLE>t</TITLE></ACT>')))
+            self.assertEqual(self.validator.get_validation_errors(), [])
+        finally:
+            os.unlink(xsd_path)
+
 
 if __name__ == '__main__':
     unittest.main()
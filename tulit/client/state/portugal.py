@@ -5,19 +5,84 @@ import os
 import logging
 import sys
 
+try:
+    import httpx
+except ImportError:  # optional dependency, only needed for bulk downloads
+    httpx = None
+
 class PortugalDREClient(Client):
     """
     Client for retrieving legal documents from the Portuguese DRE ELI portal.
     See: http://data.dre.pt/eli/
     """
     BASE_URL = "http://data.dre.pt/eli"
+    CHUNK_SIZE = 65536
+    # Substring expected in the Content-Type header and label used in error messages, per format
+    CONTENT_TYPES = {
+        'pdf': ('pdf', 'PDF'),
+        'xml': ('xml', 'XML'),
+        'html': ('html', 'HTML'),
+        'json': ('json', 'JSON'),
+        'txt': ('plain', 'TXT'),
+        'xhtml': ('xhtml', 'XHTML'),
+        'zip': ('zip', 'ZIP'),
+    }
 
-    def __init__(self, download_dir, log_dir, proxies=None):
+    def __init__(self, download_dir, log_dir, proxies=None, bulk=False):
+        """
+        Parameters
+        ----------
+        download_dir : str
+            Directory where downloaded files will be saved.
+        log_dir : str
+            Directory where log files will be saved.
+        proxies : dict, optional
+            Proxy configuration passed to the HTTP session.
+        bulk : bool, optional
+            If True and ``httpx`` >= 0.26 is installed (the ``http2`` extra),
+            downloads are streamed through a shared, pooled ``httpx.Client``
+            instead of ``requests``. HTTP/2 is only negotiated over TLS, so
+            requests to the plain-http ``BASE_URL`` keep using HTTP/1.1.
+        """
         super().__init__(download_dir, log_dir, proxies)
         self.session = requests.Session()
         if proxies:
             self.session.proxies.update(proxies)
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._client = self._create_bulk_client(proxies) if bulk else None
+
+    def _create_bulk_client(self, proxies=None):
+        """
+        Create a pooled httpx client for bulk downloads, or None if httpx is unavailable.
+        """
+        if httpx is None:
+            self.logger.warning("httpx is not installed; bulk downloads will use requests")
+            return None
+        proxy = (proxies.get('https') or proxies.get('http')) if proxies else None
+        try:
+            return httpx.Client(
+                http2=True,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                timeout=30,
+                proxy=proxy,
+            )
+        except ImportError:
+            # http2=True requires the optional 'h2' package (httpx[http2])
+            self.logger.warning("HTTP/2 support for httpx is not installed; bulk downloads will use requests")
+            return None
+        except TypeError:
+            # The proxy= keyword only exists from httpx 0.26 onwards
+            self.logger.warning("httpx >= 0.26 is required for bulk downloads; bulk downloads will use requests")
+            return None
+
+    def close(self):
+        """
+        Close the underlying HTTP connections.
+        """
+        if self._client is not None:
+            self._client.close()
+        self.session.close()
 
     def download(self, document_type, series=None, number=None, year=None, supplement=0, act_type=None, month=None, day=None, region=None, cons_date=None, lang='pt', fmt='html'):
         """
@@ -83,34 +148,26 @@ class PortugalDREClient(Client):
 
     def _download(self, url, filename, fmt=None):
         self.logger.info(f"Downloading from URL: {url} to filename: {filename}")
+        expected = self.CONTENT_TYPES.get(fmt)
+        file_path = os.path.join(self.download_dir, filename)
+        # Written under a temporary name and renamed once complete, so an
+        # interrupted download never leaves a truncated file at file_path
+        part_path = f"{file_path}.part"
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            content_type = response.headers.get('Content-Type', '')
-            if fmt == 'pdf' and 'pdf' not in content_type:
-                self.logger.error(f"Expected PDF response but got: {content_type}")
-                sys.exit(1)
-            if fmt == 'xml' and 'xml' not in content_type:
-                self.logger.error(f"Expected XML response but got: {content_type}")
-                sys.exit(1)
-            if fmt == 'html' and 'html' not in content_type:
-                self.logger.error(f"Expected HTML response but got: {content_type}")
-                sys.exit(1)
-            if fmt == 'json' and 'json' not in content_type:
-                self.logger.error(f"Expected JSON response but got: {content_type}")
-                sys.exit(1)
-            if fmt == 'txt' and 'plain' not in content_type:
-                self.logger.error(f"Expected TXT response but got: {content_type}")
-                sys.exit(1)
-            if fmt == 'xhtml' and 'xhtml' not in content_type:
-                self.logger.error(f"Expected XHTML response but got: {content_type}")
-                sys.exit(1)
-            if fmt == 'zip' and 'zip' not in content_type:
-                self.logger.error(f"Expected ZIP response but got: {content_type}")
-                sys.exit(1)
-            file_path = os.path.join(self.download_dir, filename)
-            with open(file_path, "wb") as f:
-                f.write(response.content)
+            if self._client is not None:
+                with self._client.stream('GET', url) as response:
+                    response.raise_for_status()
+                    self._check_content_type(response, expected)
+                    with open(part_path, "wb") as f:
+                        for chunk in response.iter_bytes(self.CHUNK_SIZE):
+                            f.write(chunk)
+            else:
+                response = self.session.get(url, timeout=30)
+                response.raise_for_status()
+                self._check_content_type(response, expected)
+                with open(part_path, "wb") as f:
+                    f.write(response.content)
+            os.replace(part_path, file_path)
             return file_path
         except requests.HTTPError as e:
             logging.error(f"HTTP error: {e} - {getattr(e.response, 'text', '')}")
@@ -118,3 +175,18 @@ class PortugalDREClient(Client):
         except Exception as e:
             logging.error(f"Error downloading from DRE: {e}")
             return None
+        finally:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+
+    def _check_content_type(self, response, expected):
+        """
+        Exit if the response Content-Type does not match the requested format.
+        """
+        if expected is None:
+            return
+        marker, label = expected
+        content_type = response.headers.get('Content-Type', '')
+        if marker not in content_type:
+            self.logger.error(f"Expected {label} response but got: {content_type}")
+            sys.exit(1)
@@ -1,16 +1,144 @@
 from tulit.parser.html.html_parser import HTMLParser
+from tulit.parser.html.cellar.cellar_standard import _XP_TEXT_NODES
 import json
 import re
 import argparse
 # LegalJSON validation
 from tulit.parser.parser import LegalJSONValidator
 import logging
+from copy import deepcopy
 from typing import Optional, Any
+from lxml import etree
+from lxml import html as lxml_html
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching one token of a space-separated class attribute."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Cellar HTML is read as UTF-8, whatever the (often missing) meta charset says.
+# collect_ids keeps libxml2's id table, which backs _XP_BY_ID lookups.
+_HTML_PARSER = lxml_html.HTMLParser(encoding='utf-8', collect_ids=True)
+
+# XPath expressions compiled once at import; element selection then runs in
+# libxml2 instead of a Python predicate per node
+# XPath id() resolves through the id table built while parsing instead of
+# scanning the tree (HtmlElement.get_element_by_id walks every element)
+_XP_BY_ID = etree.XPath("id($id)")
+_XP_PREFACE = etree.XPath(f".//div[{_has_class('eli-main-title')}]")
+_XP_OJ_NORMAL = etree.XPath(f".//p[{_has_class('oj-normal')}]")
+# Every div with an id, bucketed by id prefix (pbl, cit, rct, enc, cpt, art)
+# in one pass per container by CellarHTMLParser._divs_by_prefix
+_XP_DIVS_WITH_ID = etree.XPath(".//div[@id]")
+_XP_CONTAINER = etree.XPath(f".//div[{_has_class('eli-container')}]")
+_XP_CHAPTER_NUM = etree.XPath(f".//p[{_has_class('oj-ti-section-1')}]")
+_XP_CHAPTER_TITLE = etree.XPath(f".//div[{_has_class('eli-title')}]")
+_XP_ARTICLE_NUM = etree.XPath(f".//p[{_has_class('oj-ti-art')}]")
+_XP_ARTICLE_NUM_CONS = etree.XPath(f".//p[{_has_class('title-article-norm')}]")
+_XP_ARTICLE_TITLE = etree.XPath(f".//p[{_has_class('oj-sti-art')}]")
+_XP_ARTICLE_TITLE_CONS = etree.XPath(f".//p[{_has_class('stitle-article-norm')}]")
+_XP_ARTICLE_TITLES = etree.XPath(
+    ".//p[" + ' or '.join(_has_class(name) for name in
+                          ('oj-ti-art', 'oj-sti-art', 'title-article-norm', 'stitle-article-norm')) + "]"
+)
+_XP_SUBDIVISIONS = etree.XPath(".//div[contains(@id, '.')]")
+_XP_NORM_DIVS = etree.XPath(f"./div[{_has_class('norm')}]")
+_XP_NORM_PARAGRAPHS = etree.XPath(f"./p[{_has_class('norm')}]")
+_XP_NO_PARAG = etree.XPath(f".//span[{_has_class('no-parag')}]")
+_XP_INLINE_ELEMENT = etree.XPath(f".//div[{_has_class('inline-element')}]")
+_XP_CONCLUSIONS = etree.XPath(f".//div[{_has_class('oj-final')}]")
+
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_LEADING_NUMBER_RE = re.compile(r'^\(\d+\)')
+# Spaces before punctuation are dropped from extracted article text
+_SPACE_BEFORE_PUNCT_RE = re.compile(r'\s+([.,!?;:\\])')
+_ARTICLE_NUM_RE = re.compile(r'art_?(\d+)')
+
+
+def _first(xpath: etree.XPath, element) -> Optional[Any]:
+    """Returns the first match of a compiled XPath, or None."""
+    matches = xpath(element)
+    return matches[0] if matches else None
+
+
+def _with_class(element, name: str) -> bool:
+    """Whether ``name`` is one of the element's class tokens."""
+    return name in (element.get('class') or '').split()
+
+
+def _first_preamble(candidates) -> Optional[Any]:
+    """Returns the first eli-subdivision div with id pbl_1 among candidates."""
+    return next(
+        (el for el in candidates
+         if el.tag == 'div' and el.get('id') == 'pbl_1' and _with_class(el, 'eli-subdivision')),
+        None
+    )
+
+
+def _text(element, separator: str = '', strip: bool = False) -> str:
+    """
+    Text content of an element, leaving out <script> and <style> contents as
+    BeautifulSoup's get_text() did. With ``strip``, every text node is
+    stripped and empty ones are dropped before joining them with
+    ``separator``.
+    """
+    nodes = _XP_TEXT_NODES(element)
+    if not strip:
+        return ''.join(nodes)
+    return separator.join(text for text in (t.strip() for t in nodes) if text)
+
+
+def _remove_inline(element, replacement: str = '') -> None:
+    """
+    Removes an inline element (and its content) from the tree, optionally
+    leaving ``replacement`` text in its place.
+
+    The element is swapped for an empty comment carrying its tail. Comments
+    contribute no text, but keep the text before and after the removed
+    element as separate text nodes, so stripped text joins the same way it did
+    with BeautifulSoup (``'Committee <a>(1)</a>,'`` -> ``'Committee,'``).
+    """
+    parent = element.getparent()
+    if parent is None:
+        return
+    marker = etree.Comment('')
+    marker.tail = replacement + (element.tail or '')
+    parent.replace(element, marker)
 
 
 class CellarHTMLParser(HTMLParser):
     def __init__(self) -> None:
         super().__init__()
+        # (preamble, oj-normal paragraphs) of the last preamble indexed by
+        # _preamble_paragraphs
+        self._preamble_cache: Optional[tuple] = None
+        # container element -> {id prefix: divs in document order}
+        self._id_index: dict = {}
+
+    def get_root(self, file: str) -> None:
+        """
+        Loads an HTML file and parses it with lxml.
+
+        Parameters
+        ----------
+        file : str
+            The path to the HTML file.
+        
+        Returns
+        -------
+        None
+            The root ``<html>`` element is stored in the 'root' attribute.
+        """
+        try:
+            with open(file, 'rb') as f:
+                data = f.read()
+            self.root = lxml_html.document_fromstring(data, parser=_HTML_PARSER)
+            self._id_index = {}
+            self.logger.info("HTML loaded successfully")
+        except Exception as e:
+            self.logger.error(f"Error loading HTML: {e}", exc_info=True)
 
     def _normalize_text(self, text: str) -> str:
         """
@@ -49,9 +177,9 @@ class CellarHTMLParser(HTMLParser):
             The extracted preface is stored in the 'preface' attribute.
         """
         try:
-            preface_element = self.root.find('div', class_='eli-main-title')
-            if preface_element:
-                self.preface = self._normalize_text(preface_element.get_text(separator=' ', strip=True))
+            preface_element = _first(_XP_PREFACE, self.root)
+            if preface_element is not None:
+                self.preface = self._normalize_text(_text(preface_element, ' ', strip=True))
                 self.logger.info("Preface extracted successfully")
             else:
                 self.preface = None
@@ -74,12 +202,47 @@ class CellarHTMLParser(HTMLParser):
             The extracted preamble is stored in the 'preamble' attribute.
         """
         
-        self.preamble = self.root.find('div', class_='eli-subdivision', id='pbl_1')
+        self.preamble = _first_preamble(_XP_BY_ID(self.root, id='pbl_1'))
+        if self.preamble is None:
+            # Trees built without the id table, or whose first pbl_1 is not
+            # the eli-subdivision, fall back to the id-prefix scan
+            self.preamble = _first_preamble(self._divs_by_prefix(self.root, 'pbl'))
+        if self.preamble is None:
+            self.logger.warning("No preamble found")
+            return
         # Remove all a tags from the preamble
-        for a in self.preamble.find_all('a'):
-            a.decompose()
+        for a in list(self.preamble.iter('a')):
+            _remove_inline(a)
             
     
+    def _divs_by_prefix(self, container, prefix: str) -> list:
+        """
+        Returns the divs under ``container`` whose id prefix (the part before
+        the first underscore) is ``prefix``, in document order. All id-bearing
+        divs of a container are bucketed in a single pass on first use.
+        """
+        buckets = self._id_index.get(container)
+        if buckets is None:
+            buckets = {}
+            for div in _XP_DIVS_WITH_ID(container):
+                buckets.setdefault(div.get('id').split('_', 1)[0], []).append(div)
+            self._id_index[container] = buckets
+        return buckets.get(prefix, [])
+
+    def _preamble_paragraphs(self) -> list:
+        """
+        Returns the oj-normal paragraphs of the preamble, scanning it only
+        once per preamble element.
+        """
+        if self._preamble_cache is None or self._preamble_cache[0] is not self.preamble:
+            self._preamble_cache = (self.preamble, _XP_OJ_NORMAL(self.preamble))
+        return self._preamble_cache[1]
+
+    def _preamble_subdivisions(self, prefix: str) -> list:
+        """Returns the preamble's eli-subdivision divs with the given id prefix."""
+        return [div for div in self._divs_by_prefix(self.preamble, prefix)
+                if div.get('id').startswith(f'{prefix}_') and _with_class(div, 'eli-subdivision')]
+
     def get_formula(self) -> None:
         """
         Extracts the formula from the HTML, if present.
@@ -93,7 +256,11 @@ class CellarHTMLParser(HTMLParser):
         None
             The extracted formula is stored in the 'formula' attribute.
         """
-        self.formula = self.preamble.find('p', class_='oj-normal').text
+        if self.preamble is None:
+            self.formula = None
+            return
+        paragraphs = self._preamble_paragraphs()
+        self.formula = _text(paragraphs[0]) if paragraphs else None
 
 
     
@@ -110,11 +277,13 @@ class CellarHTMLParser(HTMLParser):
         None
             The extracted citations are stored in the 'citations' attribute
         """
-        citations = self.preamble.find_all('div', class_='eli-subdivision', id=lambda x: x and x.startswith('cit_'))
         self.citations = []
+        if self.preamble is None:
+            return
+        citations = self._preamble_subdivisions('cit')
         for citation in citations:
             eId = citation.get('id')
-            text = self._normalize_text(citation.get_text(strip=True))
+            text = self._normalize_text(_text(citation, strip=True))
             self.citations.append({
                     'eId' : eId,
                     'text' : text
@@ -134,14 +303,16 @@ class CellarHTMLParser(HTMLParser):
         None
             The extracted recitals are stored in the 'recitals' attribute.
         """
-        recitals = self.preamble.find_all('div', class_='eli-subdivision', id=lambda x: x and x.startswith('rct_'))
         self.recitals = []
+        if self.preamble is None:
+            return
+        recitals = self._preamble_subdivisions('rct')
         for recital in recitals:
             eId = recital.get('id')
             
-            text = recital.get_text()            
-            text = re.sub(r'\s+', ' ', text).strip()
-            text = re.sub(r'^\(\d+\)', '', text).strip()
+            text = _text(recital)
+            text = _WHITESPACE_RE.sub(' ', text).strip()
+            text = _LEADING_NUMBER_RE.sub('', text).strip()
             
             self.recitals.append({
                     'eId' : eId,
@@ -161,7 +332,11 @@ class CellarHTMLParser(HTMLParser):
         None
             The extracted final preamble is stored in the 'preamble_final' attribute.
         """
-        self.preamble_final = self.preamble.find_all('p', class_='oj-normal')[-1].get_text(strip=True)
+        if self.preamble is None:
+            self.preamble_final = None
+            return
+        paragraphs = self._preamble_paragraphs()
+        self.preamble_final = _text(paragraphs[-1], strip=True) if paragraphs else None
 
     def get_body(self) -> None:
         """
@@ -178,11 +353,15 @@ class CellarHTMLParser(HTMLParser):
         """
         
         # Try to find body with enc_ prefix
-        self.body = self.root.find('div', id=lambda x: x and x.startswith('enc_'))
+        self.body = next(
+            (div for div in self._divs_by_prefix(self.root, 'enc')
+             if div.get('id').startswith('enc_')),
+            None
+        )
         
         # If no explicit body found, use eli-container as fallback
         if self.body is None:
-            self.body = self.root.find('div', class_='eli-container')
+            self.body = _first(_XP_CONTAINER, self.root)
             self.logger.warning("Body element not found. Using eli-container as fallback")
         
         # If still no body, use root itself
@@ -190,10 +369,10 @@ class CellarHTMLParser(HTMLParser):
             self.body = self.root
             self.logger.warning("Body element not found. Using root as fallback")
         
-        # Remove anchor tags
-        if self.body:
-            for a in self.body.find_all('a'):
-                a.replace_with(' ')
+        # Replace anchor tags with a space
+        if self.body is not None:
+            for a in list(self.body.iter('a')):
+                _remove_inline(a, ' ')
 
     def get_chapters(self) -> None:
         """
@@ -205,15 +384,16 @@ class CellarHTMLParser(HTMLParser):
             self.logger.warning("No body element to extract chapters from")
             return
         
-        chapters = self.body.find_all('div', id=lambda x: x and x.startswith('cpt_') and '.' not in x)
+        chapters = [div for div in self._divs_by_prefix(self.body, 'cpt')
+                    if div.get('id').startswith('cpt_') and '.' not in div.get('id')]
         self.chapters = []
         for chapter in chapters:
             eId = chapter.get('id')
-            chapter_num_elem = chapter.find('p', class_="oj-ti-section-1")
-            chapter_title_elem = chapter.find('div', class_="eli-title")
-            if chapter_num_elem and chapter_title_elem:
-                chapter_num = chapter_num_elem.get_text(strip=True)
-                chapter_title = chapter_title_elem.get_text(strip=True)
+            chapter_num_elem = _first(_XP_CHAPTER_NUM, chapter)
+            chapter_title_elem = _first(_XP_CHAPTER_TITLE, chapter)
+            if chapter_num_elem is not None and chapter_title_elem is not None:
+                chapter_num = _text(chapter_num_elem, strip=True)
+                chapter_title = _text(chapter_title_elem, strip=True)
                 self.chapters.append({
                     'eId': eId,
                     'num': chapter_num,
@@ -235,162 +415,188 @@ class CellarHTMLParser(HTMLParser):
             return
         
         # Find all article divs: either id="art" (sole article) or id="art_X" (numbered articles)
-        articles = self.body.find_all('div', id=lambda x: x and (x == 'art' or (x.startswith('art_') and '.' not in x)))
+        articles = [div for div in self._divs_by_prefix(self.body, 'art')
+                    if div.get('id') == 'art'
+                    or (div.get('id').startswith('art_') and '.' not in div.get('id'))]
         self.articles = []
         for article in articles:
-            eId = article.get('id')  # Treat the id as the eId
-            
-            # Try original document format first (oj-ti-art), then consolidated format (title-article-norm)
-            article_num_elem = article.find('p', class_='oj-ti-art')
-            if article_num_elem is None:
-                article_num_elem = article.find('p', class_='title-article-norm')
-            
-            if article_num_elem is None:
-                self.logger.warning(f"Article {eId} has no article title element, skipping")
-                continue
-            
-            article_num = self._normalize_text(article_num_elem.get_text(strip=True))
-            
-            # Try original document format first (oj-sti-art), then consolidated format (stitle-article-norm)
-            article_title_element = article.find('p', class_='oj-sti-art')
-            if article_title_element is None:
-                article_title_element = article.find('p', class_='stitle-article-norm')
-            
-            if article_title_element is not None:
-                article_title = self._normalize_text(article_title_element.get_text(strip=True))
-            else:
-                article_title = None
-            
-            # Extract paragraphs and lists within the article
-            children = []
-            
-            # Handle articles with only paragraphs
-            paragraphs = article.find_all('p', class_='oj-normal')            
-            if paragraphs and len(article.find_all('table')) == 0:
-                for idx, paragraph in enumerate(paragraphs):
-                    text = ' '.join(paragraph.get_text(separator= ' ', strip=True).split())
-                    text = re.sub(r'\s+([.,!?;:\\''])', r'\1', text)  # replace spaces before punctuation with nothing
-                    text = self._normalize_text(text)
-                    children.append({
-                        'eId': idx,
-                        'text': text
-                    })
-            # Handle articles with only tables as first child:
-            elif article.find_all('table') and article.find_all('table')[0].find_parent('div') == article:
-                intro = article.find('p', class_='oj-normal')
+            extracted = self._extract_article(article)
+            if extracted is not None:
+                self.articles.append(extracted)
+        
+        # Standardize children numbering to 001.001 format
+        self._standardize_children_numbering()
+
+    def _extract_article(self, article) -> Optional[dict[str, Any]]:
+        """
+        Extracts one article div into its eId, number, heading and children.
+
+        Articles are extracted one at a time, in document order, on purpose:
+        lxml holds the GIL while evaluating XPath and building element proxies,
+        and the fallbacks below edit the tree in place, so a thread pool over
+        articles would serialise on the GIL and race on the shared document.
+
+        Parameters
+        ----------
+        article : lxml.html.HtmlElement
+            An article div (id "art" or "art_N").
+
+        Returns
+        -------
+        dict or None
+            The article, or None when it has no article title element.
+        """
+        eId = article.get('id')  # Treat the id as the eId
+
+        # Try original document format first (oj-ti-art), then consolidated format (title-article-norm)
+        article_num_elem = _first(_XP_ARTICLE_NUM, article)
+        if article_num_elem is None:
+            article_num_elem = _first(_XP_ARTICLE_NUM_CONS, article)
+
+        if article_num_elem is None:
+            self.logger.warning(f"Article {eId} has no article title element, skipping")
+            return None
+
+        article_num = self._normalize_text(_text(article_num_elem, strip=True))
+
+        # Try original document format first (oj-sti-art), then consolidated format (stitle-article-norm)
+        article_title_element = _first(_XP_ARTICLE_TITLE, article)
+        if article_title_element is None:
+            article_title_element = _first(_XP_ARTICLE_TITLE_CONS, article)
+
+        if article_title_element is not None:
+            article_title = self._normalize_text(_text(article_title_element, strip=True))
+        else:
+            article_title = None
+
+        # Extract paragraphs and lists within the article
+        children = []
+
+        # Tables and their closest enclosing div are looked up once per article
+        tables = article.findall('.//table')
+        table_owner = next(tables[0].iterancestors('div'), None) if tables else None
+
+        # Handle articles with only paragraphs
+        paragraphs = _XP_OJ_NORMAL(article)
+        if paragraphs and not tables:
+            for idx, paragraph in enumerate(paragraphs):
+                text = ' '.join(_text(paragraph, ' ', strip=True).split())
+                text = _SPACE_BEFORE_PUNCT_RE.sub(r'\1', text)  # replace spaces before punctuation with nothing
+                text = self._normalize_text(text)
                 children.append({
-                    'eId': 0,
-                    'text': intro.get_text(strip=True)
+                    'eId': idx,
+                    'text': text
                 })
-                tables = article.find_all('table')
-                for table in tables:
-                    rows = table.find_all('tr')
-                    for row in rows:
-                        cols = row.find_all('td')
-                        if len(cols) == 2:
-                            number_text = cols[0].get_text(strip=True)
-                            number_str = number_text.strip('()')  # Remove parentheses
-                            try:
-                                # Only proceed if first column is actually a number
-                                number = int(number_str)
-                                text = ' '.join(cols[1].get_text(separator = ' ', strip=True).split())
-                                text = re.sub(r'\s+([.,!?;:\\''])', r'\1', text)  # replace spaces before punctuation with nothing
-                                text = self._normalize_text(text)
-
-                                children.append({
-                                    'eId': number,
-                                    'text': text
-                                })
-                            except ValueError:
-                                # Not a numbered list table - will fallthrough to generic fallback
-                                pass
-            # Handle articles with paragraphs and tables by treating tables as part of the same paragraph
-            elif article.find_all('div', id=lambda x: x and '.' in x):
-                paragraphs = article.find_all('div', id=lambda x: x and '.' in x)
-                for idx, paragraph in enumerate(paragraphs):
-                    if not paragraph.get('class'):
-                        text = ' '.join(paragraph.get_text(separator = ' ', strip=True).split())
-                        text = re.sub(r'\s+([.,!?;:\\''])', r'\1', text)  # replace spaces before punctuation with nothing
-                        text = self._normalize_text(text)
-                        children.append({
-                                'eId': idx,
-                                'text': text
-                        })
-            
-            # Handle consolidated text format with <div class="norm"> and <span class="no-parag">
-            # This format is used in consolidated documents (e.g., 02009R1010)
-            if not children:  # Only try this if we haven't already extracted children
-                norm_divs = article.find_all('div', class_='norm', recursive=False)
-                if norm_divs:
-                    for idx, norm_div in enumerate(norm_divs):
-                        # Check if this div has a numbered paragraph marker
-                        no_parag = norm_div.find('span', class_='no-parag')
-                        if no_parag:
-                            # Get the text from the inline-element div or the norm div itself
-                            inline_elem = norm_div.find('div', class_='inline-element')
-                            if inline_elem:
-                                text = ' '.join(inline_elem.get_text(separator=' ', strip=True).split())
-                            else:
-                                # Get all text except the no-parag span
-                                no_parag.extract()
-                                text = ' '.join(norm_div.get_text(separator=' ', strip=True).split())
-                            text = re.sub(r'\s+([.,!?;:\\''])', r'\1', text)
+        # Handle articles with only tables as first child:
+        elif tables and table_owner is article:
+            intro = _first(_XP_OJ_NORMAL, article)
+            children.append({
+                'eId': 0,
+                'text': _text(intro, strip=True)
+            })
+            for table in tables:
+                for row in table.iter('tr'):
+                    cols = row.findall('.//td')
+                    if len(cols) == 2:
+                        number_text = _text(cols[0], strip=True)
+                        number_str = number_text.strip('()')  # Remove parentheses
+                        try:
+                            # Only proceed if first column is actually a number
+                            number = int(number_str)
+                            text = ' '.join(_text(cols[1], ' ', strip=True).split())
+                            text = _SPACE_BEFORE_PUNCT_RE.sub(r'\1', text)  # replace spaces before punctuation with nothing
                             text = self._normalize_text(text)
+
                             children.append({
-                                'eId': idx,
+                                'eId': number,
                                 'text': text
                             })
+                        except ValueError:
+                            # Not a numbered list table - will fallthrough to generic fallback
+                            pass
+        # Handle articles with paragraphs and tables by treating tables as part of the same paragraph
+        elif (subdivisions := _XP_SUBDIVISIONS(article)):
+            for idx, paragraph in enumerate(subdivisions):
+                if not paragraph.get('class'):
+                    text = ' '.join(_text(paragraph, ' ', strip=True).split())
+                    text = _SPACE_BEFORE_PUNCT_RE.sub(r'\1', text)  # replace spaces before punctuation with nothing
+                    text = self._normalize_text(text)
+                    children.append({
+                            'eId': idx,
+                            'text': text
+                    })
+
+        # Handle consolidated text format with <div class="norm"> and <span class="no-parag">
+        # This format is used in consolidated documents (e.g., 02009R1010)
+        if not children:  # Only try this if we haven't already extracted children
+            norm_divs = _XP_NORM_DIVS(article)
+            if norm_divs:
+                for idx, norm_div in enumerate(norm_divs):
+                    # Check if this div has a numbered paragraph marker
+                    no_parag = _first(_XP_NO_PARAG, norm_div)
+                    if no_parag is not None:
+                        # Get the text from the inline-element div or the norm div itself
+                        inline_elem = _first(_XP_INLINE_ELEMENT, norm_div)
+                        if inline_elem is not None:
+                            text = ' '.join(_text(inline_elem, ' ', strip=True).split())
                         else:
-                            # Single paragraph without numbering
-                            text = ' '.join(norm_div.get_text(separator=' ', strip=True).split())
-                            text = re.sub(r'\s+([.,!?;:\\''])', r'\1', text)
-                            text = self._normalize_text(text)
-                            if text:  # Only add if there's actual content
-                                children.append({
-                                    'eId': idx,
-                                    'text': text
-                                })
-                
-                # Also check for simple <p class="norm"> paragraphs (single paragraph articles)
-                if not children:
-                    norm_paragraphs = article.find_all('p', class_='norm', recursive=False)
-                    for idx, p in enumerate(norm_paragraphs):
-                        text = ' '.join(p.get_text(separator=' ', strip=True).split())
-                        text = re.sub(r'\s+([.,!?;:\\''])', r'\1', text)
+                            # Get all text except the no-parag span
+                            _remove_inline(no_parag)
+                            text = ' '.join(_text(norm_div, ' ', strip=True).split())
+                        text = _SPACE_BEFORE_PUNCT_RE.sub(r'\1', text)
+                        text = self._normalize_text(text)
+                        children.append({
+                            'eId': idx,
+                            'text': text
+                        })
+                    else:
+                        # Single paragraph without numbering
+                        text = ' '.join(_text(norm_div, ' ', strip=True).split())
+                        text = _SPACE_BEFORE_PUNCT_RE.sub(r'\1', text)
                         text = self._normalize_text(text)
-                        if text:
+                        if text:  # Only add if there's actual content
                             children.append({
                                 'eId': idx,
                                 'text': text
                             })
-            
-            # Generic fallback: if no specific pattern matched, extract all text content
-            # This handles articles with complex tables or other structures not covered by specific patterns
+
+            # Also check for simple <p class="norm"> paragraphs (single paragraph articles)
             if not children:
-                # Skip title elements to avoid duplicate content
-                article_copy = article.__copy__()
-                for title_elem in article_copy.find_all(['p'], class_=['oj-ti-art', 'oj-sti-art', 'title-article-norm', 'stitle-article-norm']):
-                    title_elem.decompose()
-                
-                text = ' '.join(article_copy.get_text(separator=' ', strip=True).split())
-                text = re.sub(r'\s+([.,!?;:\\''])', r'\1', text)
-                text = self._normalize_text(text)
-                if text:  # Only add if there's actual content after removing titles
-                    children.append({
-                        'eId': 0,
-                        'text': text
-                    })
+                norm_paragraphs = _XP_NORM_PARAGRAPHS(article)
+                for idx, p in enumerate(norm_paragraphs):
+                    text = ' '.join(_text(p, ' ', strip=True).split())
+                    text = _SPACE_BEFORE_PUNCT_RE.sub(r'\1', text)
+                    text = self._normalize_text(text)
+                    if text:
+                        children.append({
+                            'eId': idx,
+                            'text': text
+                        })
 
-            # Store the article with its eId and subdivisions
-            self.articles.append({
-                'eId': eId,
-                'num': article_num,
-                'heading': article_title,
-                'children': children
-            })
-        
-        # Standardize children numbering to 001.001 format
-        self._standardize_children_numbering()
+        # Generic fallback: if no specific pattern matched, extract all text content
+        # This handles articles with complex tables or other structures not covered by specific patterns
+        if not children:
+            # Skip title elements to avoid duplicate content
+            article_copy = deepcopy(article)
+            for title_elem in _XP_ARTICLE_TITLES(article_copy):
+                _remove_inline(title_elem)
+
+            text = ' '.join(_text(article_copy, ' ', strip=True).split())
+            text = _SPACE_BEFORE_PUNCT_RE.sub(r'\1', text)
+            text = self._normalize_text(text)
+            if text:  # Only add if there's actual content after removing titles
+                children.append({
+                    'eId': 0,
+                    'text': text
+                })
+
+        # Store the article with its eId and subdivisions
+        return {
+            'eId': eId,
+            'num': article_num,
+            'heading': article_title,
+            'children': children
+        }
 
 
     def _standardize_children_numbering(self) -> None:
@@ -398,10 +604,9 @@ class CellarHTMLParser(HTMLParser):
         Standardize article children numbering to format: 001.001, 001.002, etc.
         where the first number is the article number and the second is the child index.
         """
-        import re
         for article in self.articles:
             # Extract article number from eId (format: art_1 -> 1, or art -> 0)
-            article_num_match = re.search(r'art_?(\d+)', article['eId'])
+            article_num_match = _ARTICLE_NUM_RE.search(article['eId'])
             article_num = int(article_num_match.group(1)) if article_num_match else 0
             
             # Renumber all children with standardized format
@@ -412,9 +617,9 @@ class CellarHTMLParser(HTMLParser):
         """
         Extracts conclusions from the HTML, if present.
         """
-        conclusions_element = self.root.find('div', class_='oj-final')
-        if conclusions_element:
-            self.conclusions = conclusions_element.get_text(separator=' ', strip=True)
+        conclusions_element = _first(_XP_CONCLUSIONS, self.root)
+        if conclusions_element is not None:
+            self.conclusions = _text(conclusions_element, ' ', strip=True)
         else:
             self.conclusions = None
 
@@ -2,12 +2,73 @@ from tulit.parser.html.html_parser import HTMLParser
 import json
 import re
 import argparse
+from itertools import chain, islice
 from typing import Optional, Any
+from lxml import etree
+from lxml import html as lxml_html
 from tulit.parser.parser import LegalJSONValidator, create_html_normalizer
 from tulit.parser.strategies.article_extraction import CellarStandardArticleStrategy
 import logging
 
 
+_HTML_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+# Text nodes of an element; script and style content is not document text
+_XP_TEXT_NODES = etree.XPath('.//text()[not(parent::script or parent::style)]', smart_strings=False)
+_NON_TEXT_TAGS = ('script', 'style')
+# Paragraphs that can read 'Having regard to' / 'Having considered' once
+# cleaned. Cleaning deletes tabs and line breaks, so they are dropped before
+# the test; everything else is filtered by libxml2 without reaching Python.
+_XP_CITATION_CANDIDATES = etree.XPath(".//p[contains(translate(., '\t\n\r', ''), 'Having')]")
+
+# Patterns matched against every paragraph, compiled once at import
+_RE_ARTICLE = re.compile(r'^Article\s+(\d+)\s*(.*)$', re.IGNORECASE)
+# Case-insensitive openings of the formula and the enacting formula, tested
+# with str.startswith on one upper-cased prefix per paragraph
+_FORMULA_PREFIXES = ('THE COUNCIL', 'THE COMMISSION', 'THE EUROPEAN PARLIAMENT', 'HAS ADOPTED')
+_ENACTING_FORMULA_PREFIXES = ('HAS ADOPTED', 'HAS DECIDED')
+_STATEMENT_PREFIX_LEN = max(map(len, _FORMULA_PREFIXES + _ENACTING_FORMULA_PREFIXES))
+# Number cell of a recital laid out as a two-column table row, e.g. '(1)'
+_RE_TABLE_RECITAL_NUM = re.compile(r'^\(?\d+\)?$')
+_RE_PARENTHESES = re.compile(r'[()]')
+_RE_RECITALS_END = re.compile(r'^(HAS ADOPTED|HAS DECIDED|Article)', re.IGNORECASE)
+_RE_NUMBERED_RECITAL = re.compile(r'^\((\d+)\)\s*(.+)$')
+# Common signature openings, fused into one alternation so a paragraph is
+# tested with a single match() call
+_RE_SIGNATURE = re.compile(
+    r'(?:Done at'
+    r'|For the (?:Commission|Council|European Parliament)'
+    r'|Member of the Commission'
+    r'|President of the (?:Council|Commission|European Parliament)'
+    r'|The President'
+    r'|Brussels,)',
+    re.IGNORECASE,
+)
+# Footnotes typically start with (1), (2), etc. and contain OJ references
+_RE_FOOTNOTE = re.compile(r'^\(\d+\)\s+OJ\s+[A-Z]')
+_RE_ARTICLE_EID = re.compile(r'art_(\d+)')
+# Lettered (a) or roman (iv) point opening an article paragraph
+_RE_POINT = re.compile(r'^\s*\((?:[a-z]|[ivxlcdm]+)\)\s+', re.IGNORECASE)
+_RE_DONE_AT = re.compile(r'^Done at', re.IGNORECASE)
+# Raw-text prefilter for _RE_DONE_AT: cleaning only drops leading whitespace
+# and consolidation markers, so anything else must start with 'd'
+_RE_DONE_AT_CANDIDATE = re.compile(r'\s*(?:▼|d)', re.IGNORECASE)
+
+
+def _text(element, strip: bool = False) -> str:
+    """
+    Text content of an element. With ``strip``, every text node is stripped
+    and empty ones are dropped before joining them.
+    """
+    if len(element) == 0 and element.tag not in _NON_TEXT_TAGS:
+        # Leaf element (most paragraphs): its only text node is .text
+        text = element.text or ''
+        return text.strip() if strip else text
+    nodes = _XP_TEXT_NODES(element)
+    if not strip:
+        return ''.join(nodes)
+    return ''.join(text for text in (t.strip() for t in nodes) if text)
+
+
 class CellarStandardHTMLParser(HTMLParser):
     """
     Parser for standard HTML format documents from EU Cellar.
@@ -15,12 +76,98 @@ class CellarStandardHTMLParser(HTMLParser):
     unlike the semantic XHTML format with class-based structure.
     """
     
+    # Shared LegalJSON validator, created on the first validating parse
+    _legaljson_validator: Optional[LegalJSONValidator] = None
+    
+    @classmethod
+    def _get_validator(cls) -> LegalJSONValidator:
+        """
+        Returns the class-wide LegalJSON validator, loading the schema only once.
+        """
+        if cls._legaljson_validator is None:
+            cls._legaljson_validator = LegalJSONValidator()
+        return cls._legaljson_validator
+    
     def __init__(self) -> None:
         super().__init__()
         # Use HTML-specific normalizer for consolidation markers
         self.normalizer = create_html_normalizer()
         # Initialize article extraction strategy
         self.article_strategy = CellarStandardArticleStrategy()
+        # (txt_te, paragraphs) memo for _paragraphs
+        self._paragraph_cache: Optional[tuple] = None
+        # (txt_te, {element: cleaned text}) memo for _element_text
+        self._text_cache: Optional[tuple] = None
+        # (txt_te, formula, preamble final) memo for _preamble_statements
+        self._statement_cache: Optional[tuple] = None
+    
+    def _paragraphs(self) -> list:
+        """
+        Returns every <p> under TXT_TE, walking the container only once per
+        TXT_TE element for all the preamble and conclusion extractors.
+        """
+        if self._paragraph_cache is None or self._paragraph_cache[0] is not self.txt_te:
+            self._paragraph_cache = (self.txt_te, self.txt_te.findall('.//p'))
+        return self._paragraph_cache[1]
+    
+    def _element_text(self, element) -> str:
+        """
+        Returns the cleaned text of an element under TXT_TE. Citations,
+        recitals, articles and conclusions visit the same paragraphs, so the
+        text is extracted and normalised once per element.
+        
+        The element itself is the key: lxml proxies for a node are recreated
+        once no Python reference holds them, so id() is neither stable nor
+        unique across calls, while a dict key keeps the proxy alive.
+        """
+        if self._text_cache is None or self._text_cache[0] is not self.txt_te:
+            self._text_cache = (self.txt_te, {})
+        texts = self._text_cache[1]
+        text = texts.get(element)
+        if text is None:
+            text = texts[element] = self._clean_text(_text(element))
+        return text
+    
+    def _preamble_statements(self) -> tuple:
+        """
+        Returns the raw (formula, preamble final) paragraph texts, or None for
+        either, from one scan of the paragraphs that stops once both are found.
+        """
+        if self._statement_cache is None or self._statement_cache[0] is not self.txt_te:
+            formula = preamble_final = None
+            for p in self._paragraphs():
+                text = _text(p, strip=True)
+                head = text[:_STATEMENT_PREFIX_LEN].upper()
+                if formula is None and head.startswith(_FORMULA_PREFIXES):
+                    formula = text
+                if preamble_final is None and head.startswith(_ENACTING_FORMULA_PREFIXES):
+                    preamble_final = text
+                if formula is not None and preamble_final is not None:
+                    break
+            self._statement_cache = (self.txt_te, formula, preamble_final)
+        return self._statement_cache[1:]
+    
+    def get_root(self, file: str) -> None:
+        """
+        Loads an HTML file and parses it with lxml.
+
+        Parameters
+        ----------
+        file : str
+            The path to the HTML file.
+        
+        Returns
+        -------
+        None
+            The root ``<html>`` element is stored in the 'root' attribute.
+        """
+        try:
+            with open(file, 'rb') as f:
+                data = f.read()
+            self.root = lxml_html.document_fromstring(data, parser=_HTML_PARSER)
+            self.logger.info("HTML loaded successfully")
+        except Exception as e:
+            self.logger.error(f"Error loading HTML: {e}", exc_info=True)
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text content using strategy pattern."""
@@ -31,7 +178,11 @@ class CellarStandardHTMLParser(HTMLParser):
         Extract article number from text like 'Article 1' or 'Article 2'.
         Returns (article_num, remaining_text) or (None, text) if not found.
         """
-        match = re.match(r'^Article\s+(\d+)\s*(.*)$', text, re.IGNORECASE)
+        # Most paragraphs are not article headings; rejecting them on the
+        # prefix skips the regex engine entirely
+        if text[:7].lower() != 'article':
+            return None, text
+        match = _RE_ARTICLE.match(text)
         if match:
             return match.group(1), match.group(2)
         return None, text
@@ -42,24 +193,36 @@ class CellarStandardHTMLParser(HTMLParser):
         In standard HTML, this is typically in the metadata or first heading.
         """
         try:
+            # One walk over the candidates; priority is meta description, then
+            # the first h1, then the first strong tag
+            meta_desc = h1 = strong = None
+            for element in self.root.iter('meta', 'h1', 'strong'):
+                if element.tag == 'meta':
+                    if meta_desc is None and element.get('name') == 'DC.description':
+                        meta_desc = element
+                        if element.get('content'):
+                            break
+                elif element.tag == 'h1':
+                    if h1 is None:
+                        h1 = element
+                elif strong is None:
+                    strong = element
+            
             # Try to find in meta description
-            meta_desc = self.root.find('meta', attrs={'name': 'DC.description'})
-            if meta_desc and meta_desc.get('content'):
+            if meta_desc is not None and meta_desc.get('content'):
                 self.preface = meta_desc.get('content').strip()
                 self.logger.info("Preface extracted from meta description.")
                 return
             
             # Try to find in h1 or strong tags
-            h1 = self.root.find('h1')
-            if h1:
-                self.preface = self._clean_text(h1.get_text())
+            if h1 is not None:
+                self.preface = self._clean_text(_text(h1))
                 self.logger.info("Preface extracted from h1.")
                 return
             
             # Fallback to first strong tag
-            strong = self.root.find('strong')
-            if strong:
-                self.preface = self._clean_text(strong.get_text())
+            if strong is not None:
+                self.preface = self._clean_text(_text(strong))
                 self.logger.info("Preface extracted from strong tag.")
                 return
             
@@ -81,13 +244,10 @@ class CellarStandardHTMLParser(HTMLParser):
             ValueError: If no TXT_TE tag is found in the document.
         """
         try:
-            # Find the TXT_TE container (case-insensitive)
-            txt_te = self.root.find('txt_te')
-            if not txt_te:
-                # Try uppercase
-                txt_te = self.root.find(lambda tag: tag.name and tag.name.upper() == 'TXT_TE')
+            # Find the TXT_TE container (the HTML parser lowercases tag names)
+            txt_te = self.root.find('.//txt_te')
             
-            if txt_te:
+            if txt_te is not None:
                 # Standard HTML format with TXT_TE
                 self.txt_te = txt_te
                 self.preamble = txt_te
@@ -117,18 +277,15 @@ class CellarStandardHTMLParser(HTMLParser):
         Usually starts with "THE COUNCIL", "THE COMMISSION", etc.
         """
         try:
-            if not hasattr(self, 'txt_te') or not self.txt_te:
+            if getattr(self, 'txt_te', None) is None:
                 self.formula = None
                 return
             
-            paragraphs = self.txt_te.find_all('p')
-            for p in paragraphs:
-                text = p.get_text(strip=True)
-                # Look for common formula patterns
-                if re.match(r'^(THE (COUNCIL|COMMISSION|EUROPEAN PARLIAMENT)|HAS ADOPTED)', text, re.IGNORECASE):
-                    self.formula = self._clean_text(text)
-                    self.logger.info(f"Formula extracted: {self.formula[:50]}...")
-                    return
+            formula, _ = self._preamble_statements()
+            if formula is not None:
+                self.formula = self._clean_text(formula)
+                self.logger.info(f"Formula extracted: {self.formula[:50]}...")
+                return
             
             self.formula = None
             self.logger.warning("No formula found.")
@@ -142,16 +299,15 @@ class CellarStandardHTMLParser(HTMLParser):
         Usually contains phrases like "Having regard to".
         """
         try:
-            if not hasattr(self, 'txt_te') or not self.txt_te:
+            if getattr(self, 'txt_te', None) is None:
                 self.citations = []
                 return
             
             self.citations = []
-            paragraphs = self.txt_te.find_all('p')
             citation_idx = 0
             
-            for p in paragraphs:
-                text = self._clean_text(p.get_text())
+            for p in _XP_CITATION_CANDIDATES(self.txt_te):
+                text = self._element_text(p)
                 # Look for citation patterns
                 if text.startswith('Having regard to') or text.startswith('Having considered'):
                     citation_idx += 1
@@ -167,8 +323,8 @@ class CellarStandardHTMLParser(HTMLParser):
     
     def _extract_table_recital(self, num_text: str, content_text: str):
         """Extract recital from table row if format matches."""
-        if re.match(r'^\(?\d+\)?$', num_text):
-            recital_num = re.sub(r'[()]', '', num_text)
+        if _RE_TABLE_RECITAL_NUM.match(num_text):
+            recital_num = _RE_PARENTHESES.sub('', num_text)
             return {
                 'eId': f'rct_{recital_num}',
                 'text': content_text
@@ -178,18 +334,35 @@ class CellarStandardHTMLParser(HTMLParser):
     def _extract_recitals_from_tables(self):
         """Extract recitals from table format."""
         recitals = []
-        tables = self.txt_te.find_all('table')
-        for table in tables:
-            rows = table.find_all('tr')
-            for row in rows:
-                cols = row.find_all('td')
-                if len(cols) == 2:
-                    num_text = self._clean_text(cols[0].get_text())
-                    content_text = self._clean_text(cols[1].get_text())
-                    
-                    recital = self._extract_table_recital(num_text, content_text)
-                    if recital:
-                        recitals.append(recital)
+        for table in self.txt_te.iter('table'):
+            rows = table.iter('tr')
+            # Recital tables open with a numbered row; layout and annex tables
+            # are rejected on their first data cell without walking their
+            # rows. Header rows with no <td> (e.g. only <th>) come first.
+            for first_row in rows:
+                first_cell = next(first_row.iter('td'), None)
+                if first_cell is not None:
+                    break
+            else:
+                continue
+            if not _RE_TABLE_RECITAL_NUM.match(self._clean_text(_text(first_cell))):
+                continue
+            for row in chain((first_row,), rows):
+                # Only whether a row has exactly two cells matters, so stop
+                # collecting cells after the third
+                cols = list(islice(row.iter('td'), 3))
+                if len(cols) != 2:
+                    continue
+                num_text = self._clean_text(_text(cols[0]))
+                # Rows that do not start with a recital number are skipped
+                # before their (usually much longer) text is extracted
+                if not _RE_TABLE_RECITAL_NUM.match(num_text):
+                    continue
+                content_text = self._clean_text(_text(cols[1]))
+                
+                recital = self._extract_table_recital(num_text, content_text)
+                if recital:
+                    recitals.append(recital)
         return recitals
     
     def _is_recitals_start(self, text: str) -> bool:
@@ -198,11 +371,11 @@ class CellarStandardHTMLParser(HTMLParser):
     
     def _is_recitals_end(self, text: str) -> bool:
         """Check if text marks end of recitals section."""
-        return bool(re.match(r'^(HAS ADOPTED|HAS DECIDED|Article)', text, re.IGNORECASE))
+        return bool(_RE_RECITALS_END.match(text))
     
     def _extract_numbered_recital(self, text: str):
         """Extract numbered recital from text like '(1) Some text'."""
-        match = re.match(r'^\((\d+)\)\s*(.+)$', text)
+        match = _RE_NUMBERED_RECITAL.match(text)
         if match:
             return {
                 'eId': f'rct_{match.group(1)}',
@@ -213,11 +386,11 @@ class CellarStandardHTMLParser(HTMLParser):
     def _extract_recitals_from_paragraphs(self):
         """Extract recitals from paragraph format."""
         recitals = []
-        paragraphs = self.txt_te.find_all('p')
+        paragraphs = self._paragraphs()
         in_recitals = False
         
         for p in paragraphs:
-            text = self._clean_text(p.get_text())
+            text = self._element_text(p)
             
             if self._is_recitals_start(text):
                 in_recitals = True
@@ -239,7 +412,7 @@ class CellarStandardHTMLParser(HTMLParser):
         Usually starts with "Whereas:" followed by numbered items.
         """
         try:
-            if not hasattr(self, 'txt_te') or not self.txt_te:
+            if getattr(self, 'txt_te', None) is None:
                 self.recitals = []
                 return
             
@@ -258,17 +431,15 @@ class CellarStandardHTMLParser(HTMLParser):
         Extract final preamble statement (e.g., "HAS ADOPTED THIS DECISION:").
         """
         try:
-            if not hasattr(self, 'txt_te') or not self.txt_te:
+            if getattr(self, 'txt_te', None) is None:
                 self.preamble_final = None
                 return
             
-            paragraphs = self.txt_te.find_all('p')
-            for p in paragraphs:
-                text = p.get_text(strip=True)
-                if re.match(r'^HAS (ADOPTED|DECIDED)', text, re.IGNORECASE):
-                    self.preamble_final = self._clean_text(text)
-                    self.logger.info("Preamble final extracted.")
-                    return
+            _, preamble_final = self._preamble_statements()
+            if preamble_final is not None:
+                self.preamble_final = self._clean_text(preamble_final)
+                self.logger.info("Preamble final extracted.")
+                return
             
             self.preamble_final = None
             self.logger.warning("No preamble final found.")
@@ -308,7 +479,7 @@ class CellarStandardHTMLParser(HTMLParser):
         reducing code duplication and improving testability.
         """
         try:
-            if not hasattr(self, 'txt_te') or not self.txt_te:
+            if getattr(self, 'txt_te', None) is None:
                 self.articles = []
                 self.logger.warning("No container found for article extraction.")
                 return
@@ -357,16 +528,16 @@ class CellarStandardHTMLParser(HTMLParser):
     
     def _extract_articles_standard(self):
         """Extract articles from standard HTML format (with TXT_TE tags)."""
-        elements = self.txt_te.find_all(['p', 'table'], recursive=False)
+        elements = [element for element in self.txt_te if element.tag in ('p', 'table')]
         current_article = None
         article_content = []
         
         for element in elements:
-            if element.name == 'table':
+            if element.tag == 'table':
                 self._process_table_element(element, current_article, article_content)
                 continue
             
-            text = self._clean_text(element.get_text())
+            text = self._element_text(element)
             article_num, _ = self._extract_article_number(text)
             
             if article_num:
@@ -387,39 +558,25 @@ class CellarStandardHTMLParser(HTMLParser):
             self._finalize_article(current_article, article_content)
     
     def _extract_table_text(self, table):
-        """Extract text content from a table element."""
-        rows = []
-        for row in table.find_all('tr'):
-            cells = [self._clean_text(cell.get_text()) for cell in row.find_all(['td', 'th'])]
-            if any(cells):  # Only add non-empty rows
-                rows.append(' | '.join(cells))
-        return '\n'.join(rows) if rows else None
+        """Extract text content from a table element, or None if every row is empty."""
+        rows = (
+            [self._clean_text(_text(cell)) for cell in row.iter('td', 'th')]
+            for row in table.iter('tr')
+        )
+        # Only non-empty rows are kept; the text is joined in one pass
+        return '\n'.join(' | '.join(cells) for cells in rows if any(cells)) or None
     
     def _is_signature_section(self, text):
         """Check if text is part of signature/conclusion section."""
         if not text:
             return False
-        # Common signature patterns
-        signature_patterns = [
-            r'^Done at',
-            r'^For the (Commission|Council|European Parliament)',
-            r'^Member of the Commission',
-            r'^President of the (Council|Commission|European Parliament)',
-            r'^The President',
-            r'^Brussels,',
-        ]
-        return any(re.match(pattern, text, re.IGNORECASE) for pattern in signature_patterns)
+        return _RE_SIGNATURE.match(text) is not None
     
     def _is_footnote(self, text):
         """Check if text is a footnote reference."""
         if not text:
             return False
-        # Footnotes typically start with (1), (2), etc. and contain OJ references
-        return bool(re.match(r'^\(\d+\)\s+OJ\s+[A-Z]', text))
-    
-    def _is_article_number_style(self, style: str) -> bool:
-        """Check if style indicates article number (italic, centered)."""
-        return 'italic' in style and 'center' in style
+        return bool(_RE_FOOTNOTE.match(text))
     
     def _is_heading_style(self, style: str) -> bool:
         """Check if style indicates article heading (bold, centered)."""
@@ -427,19 +584,18 @@ class CellarStandardHTMLParser(HTMLParser):
     
     def _process_table_element(self, element, current_article, article_content):
         """Process table element and add to article content."""
-        if current_article:
-            table_text = self._extract_table_text(element)
-            if table_text:
-                article_content.append(f"[TABLE]\n{table_text}")
+        # Tables outside an article are never read
+        if current_article and (table_text := self._extract_table_text(element)):
+            article_content.append(f"[TABLE]\n{table_text}")
     
     def _extract_article_heading(self, elements, current_index: int):
         """Extract article heading from next element if present."""
         if current_index + 1 < len(elements):
             next_elem = elements[current_index + 1]
-            if next_elem.name == 'p':
+            if next_elem.tag == 'p':
                 next_style = next_elem.get('style', '')
                 if self._is_heading_style(next_style):
-                    return self._clean_text(next_elem.get_text())
+                    return self._element_text(next_elem)
         return None
     
     def _create_new_article(self, article_num: str, heading: str):
@@ -455,35 +611,38 @@ class CellarStandardHTMLParser(HTMLParser):
         """Check if text indicates end of articles section."""
         return self._is_signature_section(text) or self._is_footnote(text)
     
-    def _process_article_content(self, text: str, style: str, current_article, article_content):
+    def _process_article_content(self, text: str, centered_or_italic: bool, current_article, article_content):
         """Process paragraph as article content."""
         if current_article['heading'] and text == current_article['heading']:
             return
         
-        if text and 'center' not in style and 'italic' not in style:
+        if text and not centered_or_italic:
             article_content.append(text)
     
     def _extract_articles_consolidated(self):
         """Extract articles from consolidated HTML format (styled paragraphs)."""
-        elements = self.txt_te.find_all(['p', 'table'], recursive=False)
+        elements = [element for element in self.txt_te if element.tag in ('p', 'table')]
         current_article = None
         article_content = []
         
         for i, element in enumerate(elements):
-            if element.name == 'table':
+            if element.tag == 'table':
                 self._process_table_element(element, current_article, article_content)
                 continue
             
-            text = self._clean_text(element.get_text())
+            text = self._element_text(element)
+            # Read the style tokens once; article numbers are italic and centered
             style = element.get('style', '')
+            centered = 'center' in style
+            italic = 'italic' in style
             
-            if self._is_article_number_style(style):
+            if italic and centered:
                 article_num, remaining = self._extract_article_number(text)
                 
                 if article_num:
                     if current_article:
                         self._finalize_article(current_article, article_content)
-                        article_content = []
+                        article_content.clear()
                     
                     heading = self._extract_article_heading(elements, i)
                     current_article = self._create_new_article(article_num, heading)
@@ -494,7 +653,7 @@ class CellarStandardHTMLParser(HTMLParser):
                     current_article = None
                     break
                 
-                self._process_article_content(text, style, current_article, article_content)
+                self._process_article_content(text, centered or italic, current_article, article_content)
             else:
                 if self._should_stop_processing(text):
                     break
@@ -506,6 +665,8 @@ class CellarStandardHTMLParser(HTMLParser):
         """
         Process collected paragraphs for an article and add to articles list.
         Paragraphs are kept separate, but points within a paragraph are combined.
+        Nothing keeps a reference to ``paragraphs``, so callers reuse one buffer
+        across articles.
         """
         if not paragraphs:
             # No content paragraphs
@@ -513,67 +674,68 @@ class CellarStandardHTMLParser(HTMLParser):
             return
         
         # If first paragraph looks like a title (short and no ending punctuation), use it as heading
-        if len(paragraphs) > 0 and len(paragraphs[0]) < 100 and not paragraphs[0][-1] in '.!?':
+        start = 0
+        if len(paragraphs[0]) < 100 and not paragraphs[0][-1] in '.!?':
             if not article['heading']:
                 article['heading'] = paragraphs[0]
-                paragraphs = paragraphs[1:]
+                start = 1
         
         # Extract article number from eId (format: art_1 -> 1)
-        article_num_match = re.search(r'art_(\d+)', article['eId'])
+        article_num_match = _RE_ARTICLE_EID.search(article['eId'])
         article_num = int(article_num_match.group(1)) if article_num_match else 0
         
-        # Group paragraphs: combine consecutive lettered/roman points, but keep numbered paragraphs separate
-        grouped_paragraphs = []
+        # Group paragraphs: combine consecutive lettered/roman points, but keep numbered paragraphs separate.
+        # Each group becomes a child as soon as it is closed.
+        children = article['children']
         current_group = []
         
-        for para_text in paragraphs:
-            # Check if this is a lettered point: (a), (b), (c) or roman numerals: (i), (ii), (iii)
-            is_letter_point = bool(re.match(r'^\s*\([a-z]\)\s+', para_text, re.IGNORECASE))
-            is_roman_point = bool(re.match(r'^\s*\([ivxlcdm]+\)\s+', para_text, re.IGNORECASE))
-            
-            if (is_letter_point or is_roman_point) and current_group:
-                # This is a continuation point - add to current group
+        for para_text in islice(paragraphs, start, None):
+            # A lettered point (a), (b), (c) or roman numeral (i), (ii), (iii) continues the current group
+            if current_group and _RE_POINT.match(para_text):
                 current_group.append(para_text)
-            else:
-                # This is a new paragraph (including numbered points like 1., 2.)
-                if current_group:
-                    # Save previous group
-                    grouped_paragraphs.append('\n'.join(current_group))
-                # Start new group
-                current_group = [para_text]
+                continue
+            # This is a new paragraph (including numbered points like 1., 2.)
+            if current_group:
+                children.append(self._article_child(article_num, len(children) + 1, current_group))
+            current_group = [para_text]
         
         # Don't forget the last group
         if current_group:
-            grouped_paragraphs.append('\n'.join(current_group))
-        
-        # Create children from grouped paragraphs
-        for idx, para_text in enumerate(grouped_paragraphs, start=1):
-            article['children'].append({
-                'eId': f"{article_num:03d}.{idx:03d}",
-                'text': para_text
-            })
+            children.append(self._article_child(article_num, len(children) + 1, current_group))
         
         self.articles.append(article)
     
+    @staticmethod
+    def _article_child(article_num: int, idx: int, group: list) -> dict:
+        """Build an article child from a group of paragraph texts."""
+        return {
+            'eId': f"{article_num:03d}.{idx:03d}",
+            'text': '\n'.join(group)
+        }
+    
     def get_conclusions(self):
         """
         Extract conclusion text (e.g., "Done at Brussels, ...").
         """
         try:
-            if not hasattr(self, 'txt_te') or not self.txt_te:
+            if getattr(self, 'txt_te', None) is None:
                 self.conclusions = None
                 return
             
-            paragraphs = self.txt_te.find_all('p')
+            paragraphs = self._paragraphs()
             
             # Look for conclusion patterns, typically near the end
             for i in range(len(paragraphs) - 1, max(len(paragraphs) - 20, -1), -1):
-                text = self._clean_text(paragraphs[i].get_text())
-                if re.match(r'^Done at', text, re.IGNORECASE):
+                # Only paragraphs that can still read "Done at" once cleaned
+                # go through the normaliser
+                if not _RE_DONE_AT_CANDIDATE.match(_text(paragraphs[i])):
+                    continue
+                text = self._element_text(paragraphs[i])
+                if _RE_DONE_AT.match(text):
                     # Collect this and subsequent paragraphs as conclusion
                     conclusion_parts = []
                     for j in range(i, len(paragraphs)):
-                        conclusion_parts.append(self._clean_text(paragraphs[j].get_text()))
+                        conclusion_parts.append(self._element_text(paragraphs[j]))
                     self.conclusions = ' '.join(conclusion_parts)
                     self.logger.info("Conclusions extracted.")
                     return
@@ -651,10 +813,8 @@ class CellarStandardHTMLParser(HTMLParser):
             
             # Validate if requested
             if validate:
-                validator = LegalJSONValidator()
-                is_valid, errors = validator.validate(result)
-                if not is_valid:
-                    self.logger.warning(f"Validation failed: {errors}")
+                if not self._get_validator().validate(result):
+                    self.logger.warning("Validation failed: output does not match the LegalJSON schema")
             
             return self
             
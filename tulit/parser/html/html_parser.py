@@ -1,7 +1,8 @@
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, XMLParsedAsHTMLWarning
 from tulit.parser.parser import Parser
 import json
 import argparse
+import warnings
 import logging
 from tulit.parser.parser import LegalJSONValidator
 from typing import Optional
@@ -116,7 +117,11 @@ class HTMLParser(Parser):
         try:
             with open(file, 'r', encoding='utf-8') as f:
                 html = f.read()
-            self.root = BeautifulSoup(html, 'html.parser')
+            # Cellar serves XHTML; it is parsed as HTML on purpose, with the
+            # libxml2-backed builder rather than the pure-Python html.parser
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', XMLParsedAsHTMLWarning)
+                self.root = BeautifulSoup(html, 'lxml')
             self.logger.info("HTML loaded successfully")
         except Exception as e:
             self.logger.error(f"Error loading HTML: {e}", exc_info=True)
@@ -11,6 +11,11 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional dependency, only speeds up save_legaljson
+    orjson = None
+
 
 class LegifranceParser:
     """
@@ -406,8 +411,16 @@ class LegifranceParser:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(legal_json, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # orjson encodes straight to UTF-8 bytes, with the same two-space
+            # layout as the stdlib fallback below
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(legal_json, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                # legal_json is a freshly built tree of dicts and lists: skip the
+                # encoder's reference-cycle bookkeeping
+                json.dump(legal_json, f, indent=2, ensure_ascii=False, check_circular=False)
         
         self.logger.info(f"Saved LegalJSON to: {output_path}")
 
@@ -10,7 +10,7 @@ from dataclasses import dataclass
 from typing import Optional, List, Any, Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class Citation:
     """Represents a citation in a legal document."""
     eId: str
@@ -21,7 +21,7 @@ class Citation:
         return {'eId': self.eId, 'text': self.text}
 
 
-@dataclass
+@dataclass(slots=True)
 class Recital:
     """Represents a recital (whereas clause) in a legal document."""
     eId: str
@@ -32,7 +32,7 @@ class Recital:
         return {'eId': self.eId, 'text': self.text}
 
 
-@dataclass
+@dataclass(slots=True)
 class ArticleChild:
     """
     Represents a child element of an article (paragraph, point, etc.).
@@ -52,13 +52,13 @@ class ArticleChild:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert article child to dictionary format."""
-        result = {'eId': self.eId, 'text': self.text}
-        if self.amendment is not None:
-            result['amendment'] = self.amendment
-        return result
+        # One dict display per case rather than building and then growing it
+        if self.amendment is None:
+            return {'eId': self.eId, 'text': self.text}
+        return {'eId': self.eId, 'text': self.text, 'amendment': self.amendment}
 
 
-@dataclass
+@dataclass(slots=True)
 class Article:
     """
     Represents an article in a legal document.
@@ -96,7 +96,7 @@ class Article:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class Chapter:
     """
     Represents a chapter in a legal document.
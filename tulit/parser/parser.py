@@ -13,9 +13,20 @@ from abc import ABC, abstractmethod
 import jsonschema
 import json
 import logging
+import os
 from typing import Any, Optional, List, Dict
 from logging import Logger
 
+try:
+    import orjson
+except ImportError:  # optional dependency, speeds up schema loading and to_json
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:  # optional dependency, compiles the LegalJSON schema to Python
+    fastjsonschema = None
+
 # Import from organized modules
 from tulit.parser.exceptions import (
     ParserError, ParseError, ValidationError, ExtractionError, FileLoadError
@@ -37,6 +48,9 @@ from tulit.parser.normalization import (
     create_formex_normalizer,
 )
 
+# Leaf types that to_dict() passes through unchanged
+_JSON_SCALARS = (str, int, float, bool)
+
 
 # ============================================================================
 # Parser Abstract Base Class
@@ -91,6 +105,14 @@ class Parser(ABC):
         Extracted conclusions from the body.
     """
     
+    # Logger named after the fully qualified class name, looked up once per
+    # class (see __init_subclass__) instead of on every instantiation
+    _logger: Logger = logging.getLogger(f"{__name__}.Parser")
+    
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._logger = logging.getLogger(f"{cls.__module__}.{cls.__name__}")
+    
     def __init__(self) -> None:
         """
         Initializes the Parser object.
@@ -99,8 +121,7 @@ class Parser(ABC):
         ----------
         None
         """
-        # Initialize logger with fully qualified class name
-        self.logger: Logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        self.logger: Logger = self._logger
        
         self.root: Any = None  # Can be lxml.etree._Element or bs4.BeautifulSoup
         self.preface: Optional[str] = None
@@ -307,15 +328,13 @@ class Parser(ABC):
             If serialization fails due to unsupported object types
         """
         def _serialize(obj: Any) -> Any:
-            # Domain models with a to_dict() method
-            if hasattr(obj, 'to_dict') and callable(getattr(obj, 'to_dict')):
-                try:
-                    return obj.to_dict()
-                except Exception as e:
-                    from tulit.parser.exceptions import ParseError
-                    raise ParseError(f"Failed to serialize object with to_dict() method: {e}") from e
+            # JSON-native scalars are by far the most common leaves (every
+            # text field): return them before any of the probes below
+            if obj is None or isinstance(obj, _JSON_SCALARS):
+                return obj
 
-            # dicts and mappings
+            # Parsers emit plain dicts and lists, so dispatch on those before
+            # probing for to_dict(), which costs a failed attribute lookup
             if isinstance(obj, dict):
                 try:
                     return {k: _serialize(v) for k, v in obj.items()}
@@ -331,6 +350,14 @@ class Parser(ABC):
                     from tulit.parser.exceptions import ParseError
                     raise ParseError(f"Failed to serialize sequence: {e}") from e
 
+            # Domain models with a to_dict() method
+            if hasattr(obj, 'to_dict') and callable(getattr(obj, 'to_dict')):
+                try:
+                    return obj.to_dict()
+                except Exception as e:
+                    from tulit.parser.exceptions import ParseError
+                    raise ParseError(f"Failed to serialize object with to_dict() method: {e}") from e
+
             # BeautifulSoup Tag -> extract text
             try:
                 from bs4.element import Tag
@@ -387,17 +414,86 @@ class Parser(ABC):
             from tulit.parser.exceptions import ParseError
             raise ParseError(f"Failed to convert parser data to dictionary: {e}") from e
 
+    def to_json(self) -> bytes:
+        """
+        Serialize the parser's extracted data to compact UTF-8 encoded JSON.
+
+        Uses orjson when it is installed and the standard library otherwise;
+        both produce the same compact layout.
+
+        Returns
+        -------
+        bytes
+            The output of to_dict() encoded as JSON.
+        """
+        data = self.to_dict()
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        # to_dict() builds a fresh tree of dicts and lists: skip the encoder's
+        # reference-cycle bookkeeping
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':'),
+                          check_circular=False).encode('utf-8')
+
 class LegalJSONValidator:
     """
     Validator for LegalJSON output using the LegalJSON schema.
     """
+    # Looked up once per class rather than per instance
+    _logger: Logger = logging.getLogger('LegalJSONValidator')
+    
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._logger = logging.getLogger(cls.__name__)
+    
+    # Loaded schemas shared by all validators, keyed by (absolute path,
+    # modification time): parsers built one per document would otherwise
+    # re-read, re-check and re-compile the same bundled schema every time
+    _schema_cache: dict = {}
+    
     def __init__(self, schema_path: Optional[str] = None) -> None:
         if schema_path is None:
-            import os
             schema_path = os.path.join(os.path.dirname(__file__), 'legaljson_schema.json')
-        with open(schema_path, 'r', encoding='utf-8') as f:
-            self.schema: dict[str, Any] = json.load(f)
-        self.logger: Logger = logging.getLogger(self.__class__.__name__)
+        self.logger: Logger = self._logger
+        cache_key = (os.path.abspath(schema_path), os.path.getmtime(schema_path))
+        cached = self._schema_cache.get(cache_key)
+        if cached is None:
+            cached = self._load(schema_path)
+            self._schema_cache[cache_key] = cached
+        self.schema, self._validator, self._compiled = cached
+
+    def _load(self, schema_path: str) -> tuple:
+        """Read the schema and build its validators."""
+        if orjson is not None:
+            # orjson parses the UTF-8 bytes directly, without a decode step
+            with open(schema_path, 'rb') as f:
+                schema: dict[str, Any] = orjson.loads(f.read())
+        else:
+            with open(schema_path, 'r', encoding='utf-8') as f:
+                schema = json.load(f)
+        # Check the schema and build the validator once instead of on every call
+        validator_cls = jsonschema.validators.validator_for(schema)
+        validator_cls.check_schema(schema)
+        validator = validator_cls(schema)
+        # fastjsonschema turns the schema into generated Python code; jsonschema
+        # stays as the fallback and is what reports why a document is invalid
+        compiled = None
+        if fastjsonschema is not None:
+            try:
+                # use_default=False: validation must never fill in the document
+                compiled = fastjsonschema.compile(schema, use_default=False)
+            except fastjsonschema.JsonSchemaDefinitionException as e:
+                self.logger.debug(f"fastjsonschema cannot compile the schema, using jsonschema: {e}")
+        return schema, validator, compiled
+
+    def _is_valid(self, data: dict[str, Any]) -> bool:
+        """Check data against the schema without building any error report."""
+        if self._compiled is None:
+            return self._validator.is_valid(data)
+        try:
+            self._compiled(data)
+        except fastjsonschema.JsonSchemaValueException:
+            return False
+        return True
 
     def validate(self, data: dict[str, Any]) -> bool:
         """
@@ -405,9 +501,18 @@ class LegalJSONValidator:
         Returns True if valid, False otherwise.
         """
         try:
-            jsonschema.validate(instance=data, schema=self.schema)
-            self.logger.info("LegalJSON validation successful.")
-            return True
+            # The fast check stops at the first error without building error
+            # objects; the reported error is only worked out for invalid documents
+            if self._is_valid(data):
+                self.logger.info("LegalJSON validation successful.")
+                return True
+            error = jsonschema.exceptions.best_match(self._validator.iter_errors(data))
+            if error is None:
+                # The compiled check rejected a document jsonschema accepts;
+                # jsonschema stays the reference implementation
+                self.logger.warning("fastjsonschema and jsonschema disagree on the document, using the jsonschema result")
+                return self._validator.is_valid(data)
+            raise error
         except jsonschema.ValidationError as e:
             self.logger.error(f"LegalJSON validation error: {e.message}")
             return False
@@ -29,6 +29,29 @@ class ParserRegistry:
         self._parsers: Dict[str, Type] = {}
         self._aliases: Dict[str, str] = {}
         self._factory_functions: Dict[str, Callable] = {}
+        # Every format id and alias mapped straight to the callable that
+        # builds its parser, so create() resolves a name with one lookup
+        self._constructors: Dict[str, Callable] = {}
+        # Sorted format ids, refreshed on registration for list_formats()
+        self._formats: tuple = ()
+    
+    def _rebuild_constructors(self) -> None:
+        """
+        Recompute the name -> constructor map after a registration.
+        
+        Aliases win over format ids of the same name, and a factory wins
+        over a class registered for the same format, as in the two-step
+        resolution this map replaces.
+        """
+        constructors = {}
+        for name in (*self._parsers, *self._factory_functions, *self._aliases):
+            actual_format = self._aliases.get(name, name)
+            if actual_format in self._factory_functions:
+                constructors[name] = self._factory_functions[actual_format]
+            elif actual_format in self._parsers:
+                constructors[name] = self._parsers[actual_format]
+        self._constructors = constructors
+        self._formats = tuple(sorted({*self._parsers, *self._factory_functions}))
     
     def register(self, format_id: str, parser_class: Type, 
                 aliases: Optional[List[str]] = None) -> None:
@@ -54,11 +77,16 @@ class ParserRegistry:
         
         self._parsers[format_id] = parser_class
         
-        if aliases:
-            for alias in aliases:
-                if alias in self._aliases:
-                    raise ParserError(f"Alias '{alias}' is already registered")
-                self._aliases[alias] = format_id
+        try:
+            if aliases:
+                for alias in aliases:
+                    if alias in self._aliases:
+                        raise ParserError(f"Alias '{alias}' is already registered")
+                    self._aliases[alias] = format_id
+        finally:
+            # A conflicting alias leaves the format registered, so the
+            # lookup tables must reflect it either way
+            self._rebuild_constructors()
     
     def register_factory(self, format_id: str, factory_func: Callable,
                         aliases: Optional[List[str]] = None) -> None:
@@ -82,11 +110,16 @@ class ParserRegistry:
         
         self._factory_functions[format_id] = factory_func
         
-        if aliases:
-            for alias in aliases:
-                if alias in self._aliases:
-                    raise ParserError(f"Alias '{alias}' is already registered")
-                self._aliases[alias] = format_id
+        try:
+            if aliases:
+                for alias in aliases:
+                    if alias in self._aliases:
+                        raise ParserError(f"Alias '{alias}' is already registered")
+                    self._aliases[alias] = format_id
+        finally:
+            # A conflicting alias leaves the format registered, so the
+            # lookup tables must reflect it either way
+            self._rebuild_constructors()
     
     def create(self, format_id: str, *args, **kwargs):
         """
@@ -109,22 +142,14 @@ class ParserRegistry:
         ParserError
             If format_id is not registered
         """
-        # Resolve aliases
-        actual_format = self._aliases.get(format_id, format_id)
-        
-        # Try factory function first
-        if actual_format in self._factory_functions:
-            return self._factory_functions[actual_format](*args, **kwargs)
-        
-        # Fall back to direct class instantiation
-        if actual_format not in self._parsers:
+        try:
+            constructor = self._constructors[format_id]
+        except KeyError:
             raise ParserError(
                 f"No parser registered for format '{format_id}'. "
                 f"Available formats: {', '.join(self.list_formats())}"
-            )
-        
-        parser_class = self._parsers[actual_format]
-        return parser_class(*args, **kwargs)
+            ) from None
+        return constructor(*args, **kwargs)
     
     def list_formats(self) -> List[str]:
         """
@@ -135,9 +160,7 @@ class ParserRegistry:
         List[str]
             List of format identifiers (not including aliases)
         """
-        formats = set(self._parsers.keys())
-        formats.update(self._factory_functions.keys())
-        return sorted(formats)
+        return list(self._formats)
     
     def list_aliases(self) -> Dict[str, str]:
         """
@@ -148,7 +171,7 @@ class ParserRegistry:
         Dict[str, str]
             Mapping of alias -> format_id
         """
-        return self._aliases.copy()
+        return dict(self._aliases)
     
     def is_registered(self, format_id: str) -> bool:
         """
@@ -164,9 +187,7 @@ class ParserRegistry:
         bool
             True if format is registered
         """
-        actual_format = self._aliases.get(format_id, format_id)
-        return (actual_format in self._parsers or 
-                actual_format in self._factory_functions)
+        return format_id in self._constructors
 
 
 # Global registry instance
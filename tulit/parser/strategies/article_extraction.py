@@ -10,10 +10,83 @@ Purpose: Encapsulate article extraction algorithms and make them interchangeable
 """
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Any, Optional, List, Dict
 from lxml import etree
 import re
 
+from tulit.parser.xml.helpers import text_content
+
+
+# Patterns shared by every strategy, compiled once at import
+_RE_ARTICLE_PREFIX = re.compile(r'^(Article|Art\.?|Artikel)\s*', re.IGNORECASE)
+_RE_NON_EID_CHARS = re.compile(r'[^\w\-]')
+_RE_LEADING_NUMBER = re.compile(r'^(\d+)')
+_RE_HEADING_SEPARATORS = re.compile(r'^[\s\-:–—]+')
+_RE_ARTICLE_MARKER = re.compile(r'^Article\s+\d+[a-z]?', re.IGNORECASE)
+_RE_BARE_ARTICLE_MARKER = re.compile(r'^Article\s+\d+[a-z]?\s*$', re.IGNORECASE)
+# Phrases showing that an 'Article N' line refers to another act's article
+# rather than opening one; a single search replaces one search per phrase
+_RE_ARTICLE_REFERENCE = re.compile(
+    r'of Regulation'
+    r'|of Commission'
+    r'|of Council'
+    r'|of Directive'
+    r'|of Decision'
+    r'|\(\d+\)'  # Article 28 (1) - paragraph number
+    r'|is hereby'
+    r'|shall be'
+    r'|thereof'
+    r'|thereto',
+    re.IGNORECASE,
+)
+# List item starts and amendment commands grouped by _group_list_items
+_RE_LIST_ITEM = re.compile(r'^\s*\(\s*[A-Za-z0-9]+\s*\)\s+', re.IGNORECASE)
+_RE_NUMBERED_ITEM = re.compile(r'^\s*\d+\.\s+')
+_RE_DASH_ITEM = re.compile(r'^\s*-\s+')
+_RE_AMENDMENT = re.compile(
+    r'(shall be (amended|replaced|inserted|deleted|added)|'
+    r'is hereby (amended|replaced|inserted|deleted|added)|'
+    r'are hereby (amended|replaced|inserted|deleted|added)|'
+    r'shall be inserted|the following .* shall be (added|inserted))',
+    re.IGNORECASE
+)
+
+# Formex article queries, evaluated per document and per article: compiled
+# once here instead of on every element.xpath() call
+_XP_FORMEX_ARTICLES = etree.XPath('.//ARTICLE[@IDENTIFIER][not(ancestor::ARTICLE)]')
+_XP_FORMEX_TI_ART = etree.XPath('.//TI.ART[not(ancestor::QUOT.S)]')
+_XP_FORMEX_QUOTES = etree.XPath('.//QUOT.S | .//QUOT.START')
+_XP_FORMEX_QUOTED_CHILDREN = etree.XPath(
+    './/ALINEA[not(ancestor::QUOT.S) and not(ancestor::ALINEA)]'
+    ' | .//QUOT.S[not(ancestor::ALINEA) and not(ancestor::QUOT.S)]'
+    ' | .//SUBDIV/TITLE[not(ancestor::QUOT.S)]'
+)
+_XP_FORMEX_TOP_PARAG = etree.XPath('.//PARAG[not(ancestor::QUOT.S) and not(ancestor::PARAG)]')
+_XP_FORMEX_PARAG_CHILDREN = etree.XPath(
+    './/PARAG[not(ancestor::QUOT.S) and not(ancestor::PARAG)]'
+    ' | .//ALINEA[not(ancestor::QUOT.S) and not(ancestor::PARAG) and not(ancestor::ALINEA) and not(descendant::PARAG)]'
+    ' | .//SUBDIV/TITLE[not(ancestor::QUOT.S)]'
+)
+_XP_FORMEX_ALINEA_CHILDREN = etree.XPath('.//ALINEA[not(ancestor::ALINEA)] | .//SUBDIV/TITLE')
+
+
+@lru_cache(maxsize=256)
+def _compiled_xpath(xpath: str, namespaces: tuple) -> etree.XPath:
+    """Compiles an XPath expression once per (expression, namespaces) pair."""
+    return etree.XPath(xpath, namespaces=dict(namespaces))
+
+
+# Text nodes of an lxml.html element; script and style content is not document text
+_XP_HTML_TEXT_NODES = etree.XPath('.//text()[not(parent::script or parent::style)]', smart_strings=False)
+
+
+def _stripped_html_text(element) -> str:
+    """Joins the element's text nodes, each stripped, skipping empty ones."""
+    if len(element) == 0 and element.tag not in ('script', 'style'):
+        return (element.text or '').strip()
+    return ''.join(text for text in (t.strip() for t in _XP_HTML_TEXT_NODES(element)) if text)
+
 
 class ArticleExtractionStrategy(ABC):
     """
@@ -59,7 +132,7 @@ class ArticleExtractionStrategy(ABC):
         """
         # Remove common prefixes and normalize
         num = str(num).strip()
-        num = re.sub(r'^(Article|Art\.?|Artikel)\s*', '', num, flags=re.IGNORECASE)
+        num = _RE_ARTICLE_PREFIX.sub('', num)
         return num.strip()
     
     def _generate_article_eid(self, num: str, index: Optional[int] = None) -> str:
@@ -81,7 +154,7 @@ class ArticleExtractionStrategy(ABC):
         if num:
             normalized = self._normalize_article_number(num)
             # Remove non-alphanumeric chars except hyphens and underscores
-            clean = re.sub(r'[^\w\-]', '_', normalized)
+            clean = _RE_NON_EID_CHARS.sub('_', normalized)
             return f'art_{clean}'
         elif index is not None:
             return f'art_{index}'
@@ -123,9 +196,7 @@ class XMLArticleExtractionStrategy(ArticleExtractionStrategy):
         List[lxml.etree._Element]
             List of matching elements
         """
-        if self.namespaces:
-            return parent.xpath(xpath, namespaces=self.namespaces)
-        return parent.xpath(xpath)
+        return _compiled_xpath(xpath, tuple(sorted(self.namespaces.items())))(parent)
     
     def _extract_text(self, element: etree._Element, normalize: bool = True) -> str:
         """
@@ -143,7 +214,7 @@ class XMLArticleExtractionStrategy(ArticleExtractionStrategy):
         str
             Extracted text
         """
-        text = ''.join(element.itertext())
+        text = text_content(element)
         if normalize:
             text = ' '.join(text.split())  # Normalize whitespace
         return text.strip()
@@ -167,6 +238,7 @@ class HTMLArticleExtractionStrategy(ArticleExtractionStrategy):
             Regex pattern to identify article markers
         """
         self.article_pattern = article_pattern or r'Article\s+(\d+[a-z]?)'
+        self._article_re = re.compile(self.article_pattern, re.IGNORECASE)
     
     def _extract_article_number(self, text: str) -> tuple[Optional[str], str]:
         """
@@ -182,13 +254,13 @@ class HTMLArticleExtractionStrategy(ArticleExtractionStrategy):
         tuple[Optional[str], str]
             Tuple of (article_number, remaining_text)
         """
-        match = re.search(self.article_pattern, text, re.IGNORECASE)
+        match = self._article_re.search(text)
         if match:
             num = match.group(1)
             # Get remaining text after the article number
             remaining = text[match.end():].strip()
             # Clean up remaining text (remove common separators)
-            remaining = re.sub(r'^[\s\-:–—]+', '', remaining)
+            remaining = _RE_HEADING_SEPARATORS.sub('', remaining)
             return num, remaining
         return None, text
     
@@ -212,30 +284,16 @@ class HTMLArticleExtractionStrategy(ArticleExtractionStrategy):
             True if text is a standalone article marker
         """
         # Must start with Article N
-        if not re.match(r'^Article\s+\d+[a-z]?', text, re.IGNORECASE):
+        if not _RE_ARTICLE_MARKER.match(text):
             return False
         
         # If it's just "Article N" (possibly with whitespace), it's a marker
-        if re.match(r'^Article\s+\d+[a-z]?\s*$', text, re.IGNORECASE):
+        if _RE_BARE_ARTICLE_MARKER.match(text):
             return True
         
         # If it contains phrases indicating it's referencing another regulation's article, not a marker
-        reference_patterns = [
-            r'of Regulation',
-            r'of Commission',
-            r'of Council',
-            r'of Directive',
-            r'of Decision',
-            r'\(\d+\)',  # Article 28 (1) - paragraph number
-            r'is hereby',
-            r'shall be',
-            r'thereof',
-            r'thereto'
-        ]
-        
-        for pattern in reference_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return False
+        if _RE_ARTICLE_REFERENCE.search(text):
+            return False
         
         # If it's relatively short (likely "Article N" plus a short heading), it's a marker
         # Typical: "Article 1", "Article 2 - Definitions", "Article 3 Scope"
@@ -288,7 +346,7 @@ class FormexArticleStrategy(XMLArticleExtractionStrategy):
                 parent.remove(note)
         
         # Find top-level ARTICLE elements (not nested within other ARTICLEs)
-        article_elements = document.xpath(".//ARTICLE[@IDENTIFIER][not(ancestor::ARTICLE)]")
+        article_elements = _XP_FORMEX_ARTICLES(document)
         
         for article in article_elements:
             # Some Formex documents prefix article IDs with '3', but we need to be careful
@@ -309,7 +367,7 @@ class FormexArticleStrategy(XMLArticleExtractionStrategy):
             
             # Extract article number from TI.ART element (never from
             # quoted amendment content)
-            ti_arts = article.xpath('.//TI.ART[not(ancestor::QUOT.S)]')
+            ti_arts = _XP_FORMEX_TI_ART(article)
             ti_art = ti_arts[0] if ti_arts else None
             article_num = self._extract_text(ti_art) if ti_art is not None else article_id
             
@@ -343,15 +401,11 @@ class FormexArticleStrategy(XMLArticleExtractionStrategy):
         children = []
         
         # Check for amendments (quoted blocks or inline quotation markers)
-        if article.xpath('.//QUOT.S | .//QUOT.START'):
+        if _XP_FORMEX_QUOTES(article):
             # Extract ALINEAs that are NOT inside QUOT.S, plus quoted blocks
             # that are not inside any ALINEA (their text would otherwise be
             # lost), in document order
-            alineas = article.xpath(
-                './/ALINEA[not(ancestor::QUOT.S) and not(ancestor::ALINEA)]'
-                ' | .//QUOT.S[not(ancestor::ALINEA) and not(ancestor::QUOT.S)]'
-                ' | .//SUBDIV/TITLE[not(ancestor::QUOT.S)]'
-            )
+            alineas = _XP_FORMEX_QUOTED_CHILDREN(article)
             for idx, alinea in enumerate(alineas):
                 children.append({
                     'eId': f'para_{idx + 1}',
@@ -361,12 +415,8 @@ class FormexArticleStrategy(XMLArticleExtractionStrategy):
         
         # Extract PARAG elements (not inside QUOT.S), together with any
         # direct ALINEAs that sit outside a PARAG, in document order
-        elif article.xpath('.//PARAG[not(ancestor::QUOT.S) and not(ancestor::PARAG)]'):
-            parags = article.xpath(
-                './/PARAG[not(ancestor::QUOT.S) and not(ancestor::PARAG)]'
-                ' | .//ALINEA[not(ancestor::QUOT.S) and not(ancestor::PARAG) and not(ancestor::ALINEA) and not(descendant::PARAG)]'
-                ' | .//SUBDIV/TITLE[not(ancestor::QUOT.S)]'
-            )
+        elif _XP_FORMEX_TOP_PARAG(article):
+            parags = _XP_FORMEX_PARAG_CHILDREN(article)
             for idx, parag in enumerate(parags):
                 children.append({
                     'eId': f'para_{idx + 1}',
@@ -375,8 +425,8 @@ class FormexArticleStrategy(XMLArticleExtractionStrategy):
                 })
         
         # Fallback to ALINEA elements
-        elif article.findall('.//ALINEA'):
-            alineas = article.xpath('.//ALINEA[not(ancestor::ALINEA)] | .//SUBDIV/TITLE')
+        elif article.find('.//ALINEA') is not None:
+            alineas = _XP_FORMEX_ALINEA_CHILDREN(article)
             for idx, alinea in enumerate(alineas):
                 children.append({
                     'eId': f'para_{idx + 1}',
@@ -483,16 +533,16 @@ class CellarStandardArticleStrategy(HTMLArticleExtractionStrategy):
         """
         if num:
             normalized = self._normalize_article_number(num)
-            numeric_match = re.match(r'^(\d+)', normalized)
+            numeric_match = _RE_LEADING_NUMBER.match(normalized)
             if numeric_match:
                 padded_num = numeric_match.group(1).zfill(3)
                 remainder = normalized[len(numeric_match.group(1)):]
                 if remainder:
-                    clean_remainder = re.sub(r'[^\w\-]', '_', remainder)
+                    clean_remainder = _RE_NON_EID_CHARS.sub('_', remainder)
                     return f'{padded_num}{clean_remainder}'
                 return padded_num
             else:
-                clean = re.sub(r'[^\w\-]', '_', normalized)
+                clean = _RE_NON_EID_CHARS.sub('_', normalized)
                 return clean
         elif index is not None:
             return str(index).zfill(3)
@@ -504,7 +554,7 @@ class CellarStandardArticleStrategy(HTMLArticleExtractionStrategy):
         
         Parameters
         ----------
-        document : BeautifulSoup element
+        document : lxml.html.HtmlElement
             The txt_te container element
         **kwargs : dict
             Optional: 'stop_markers' (list) - text patterns that signal end of articles
@@ -517,19 +567,19 @@ class CellarStandardArticleStrategy(HTMLArticleExtractionStrategy):
         articles = []
         stop_markers = kwargs.get('stop_markers', ['Done at', 'For the'])
         
-        elements = document.find_all(['p', 'table'], recursive=False)
+        elements = [elem for elem in document if elem.tag in ('p', 'table')]
         current_article = None
         article_content = []
         
         for elem in elements:
-            text = elem.get_text(strip=True)
+            text = _stripped_html_text(elem)
             
             # Check for article start
             if self._is_article_marker(text):
                 # Save previous article
                 if current_article:
                     self._finalize_article(current_article, article_content, articles)
-                    article_content = []
+                    article_content.clear()
                 
                 # Start new article
                 article_num, remaining = self._extract_article_number(text)
@@ -626,25 +676,11 @@ class CellarStandardArticleStrategy(HTMLArticleExtractionStrategy):
         in_amendment_structure = False
         in_quoted_content = False
         
-        # Pattern to detect list item starts
-        list_item_pattern = re.compile(r'^\s*\(\s*[A-Za-z0-9]+\s*\)\s+', re.IGNORECASE)
-        numbered_pattern = re.compile(r'^\s*\d+\.\s+')
-        dash_item_pattern = re.compile(r'^\s*-\s+')
-        
-        # Pattern to detect amendment commands
-        amendment_pattern = re.compile(
-            r'(shall be (amended|replaced|inserted|deleted|added)|'
-            r'is hereby (amended|replaced|inserted|deleted|added)|'
-            r'are hereby (amended|replaced|inserted|deleted|added)|'
-            r'shall be inserted|the following .* shall be (added|inserted))',
-            re.IGNORECASE
-        )
-        
         def is_continuation_marker(text):
             """Check if text indicates continuation (ends with colon or contains amendment command)."""
             text_stripped = text.strip()
             return (text_stripped.endswith(':') or 
-                   (amendment_pattern.search(text) and text_stripped.endswith(':')))
+                   (_RE_AMENDMENT.search(text) and text_stripped.endswith(':')))
         
         def starts_with_quote(text):
             """Check if text starts with opening double quote."""
@@ -658,12 +694,12 @@ class CellarStandardArticleStrategy(HTMLArticleExtractionStrategy):
         
         def is_amendment_intro(text):
             """Check if this text is an amendment introduction that should keep grouping."""
-            return (numbered_pattern.match(text) and 
-                   (amendment_pattern.search(text) or text.strip().endswith(':')))
+            return (_RE_NUMBERED_ITEM.match(text) and 
+                   (_RE_AMENDMENT.search(text) or text.strip().endswith(':')))
         
         for i, text in enumerate(content):
-            is_list_item = (list_item_pattern.match(text) or dash_item_pattern.match(text))
-            is_numbered = numbered_pattern.match(text)
+            is_list_item = (_RE_LIST_ITEM.match(text) or _RE_DASH_ITEM.match(text))
+            is_numbered = _RE_NUMBERED_ITEM.match(text)
             is_intro = is_continuation_marker(text)
             is_amend_intro = is_amendment_intro(text)
             starts_quote = starts_with_quote(text)
@@ -685,7 +721,7 @@ class CellarStandardArticleStrategy(HTMLArticleExtractionStrategy):
             next_is_amend_intro = False
             if i + 1 < len(content):
                 next_text = content[i + 1]
-                next_is_list = (list_item_pattern.match(next_text) or dash_item_pattern.match(next_text))
+                next_is_list = (_RE_LIST_ITEM.match(next_text) or _RE_DASH_ITEM.match(next_text))
                 next_starts_quote = starts_with_quote(next_text)
                 next_is_amend_intro = is_amendment_intro(next_text)
             
@@ -769,12 +805,12 @@ class ProposalArticleStrategy(HTMLArticleExtractionStrategy):
         """
         if num:
             normalized = self._normalize_article_number(num)
-            numeric_match = re.match(r'^(\d+)', normalized)
+            numeric_match = _RE_LEADING_NUMBER.match(normalized)
             if numeric_match:
                 return numeric_match.group(1).zfill(3)
             else:
                 # Fallback for non-numeric article numbers
-                clean = re.sub(r'[^\w\-]', '_', normalized)
+                clean = _RE_NON_EID_CHARS.sub('_', normalized)
                 return clean
         elif index is not None:
             return str(index).zfill(3)
@@ -69,7 +69,7 @@ class AKN4EUParser(AkomaNtosoParser):
             return
         
         # Remove all authorialNote nodes
-        self.body = self.remove_node(self.body, './/akn:authorialNote')
+        self._strip_authorial_notes()
 
         # Use extractor with xml:id attribute for AKN4EU
         extractor = AKNArticleExtractor(
@@ -78,7 +78,7 @@ class AKN4EUParser(AkomaNtosoParser):
         )
 
         # Find all <article> elements in the XML
-        for article in self.body.findall('.//akn:article', namespaces=self.namespaces):
+        for article in self.body.iter(f"{{{self.namespaces['akn']}}}article"):
             metadata = extractor.extract_article_metadata(article)
             # Use flat extraction with intro chained to points
             children = extractor.extract_content_with_chained_intro(article)
@@ -91,7 +91,7 @@ class AKN4EUParser(AkomaNtosoParser):
             })
         
         # Also find all <section> elements (used in some jurisdictions)
-        for section in self.body.findall('.//akn:section', namespaces=self.namespaces):
+        for section in self.body.iter(f"{{{self.namespaces['akn']}}}section"):
             metadata = extractor.extract_article_metadata(section)
             children = extractor.extract_content_with_chained_intro(section)
 
@@ -7,6 +7,7 @@ Luxembourg) inherit from this base class.
 """
 
 from tulit.parser.xml.xml import XMLParser
+from tulit.parser.xml.helpers import text_content
 from tulit.parser.xml.akomantoso.extractors import (
     AKNArticleExtractor,
     AKNParseOrchestrator,
@@ -36,20 +37,22 @@ class AkomaNtosoParser(XMLParser):
     >>> articles = parser.get_articles()
     """
     
+    # Namespace mapping for Akoma Ntoso 3.0; dialect subclasses declare their
+    # own. Each instance works on its own copy.
+    NAMESPACES: dict[str, str] = {
+        'akn': 'http://docs.oasis-open.org/legaldocml/ns/akn/3.0',
+        'an': 'http://docs.oasis-open.org/legaldocml/ns/akn/3.0',
+        'fmx': 'http://formex.publications.europa.eu/schema/formex-05.56-20160701.xd',
+        # German LegalDocML namespace (for compatibility)
+        'akn-de': 'http://Inhaltsdaten.LegalDocML.de/1.8.2/',
+        # Luxembourg and other CSD variations (for compatibility)
+        'akn-csd13': 'http://docs.oasis-open.org/legaldocml/ns/akn/3.0/CSD13'
+    }
+    
     def __init__(self) -> None:
-        """Initialize the Akoma Ntoso parser with standard namespaces."""
+        """Initialize the Akoma Ntoso parser with a copy of the class namespaces."""
         super().__init__()
-                
-        # Define the namespace mapping for Akoma Ntoso 3.0
-        self.namespaces = {
-            'akn': 'http://docs.oasis-open.org/legaldocml/ns/akn/3.0',
-            'an': 'http://docs.oasis-open.org/legaldocml/ns/akn/3.0',
-            'fmx': 'http://formex.publications.europa.eu/schema/formex-05.56-20160701.xd',
-            # German LegalDocML namespace (for compatibility)
-            'akn-de': 'http://Inhaltsdaten.LegalDocML.de/1.8.2/',
-            # Luxembourg and other CSD variations (for compatibility)
-            'akn-csd13': 'http://docs.oasis-open.org/legaldocml/ns/akn/3.0/CSD13'
-        }
+        self.namespaces = dict(self.NAMESPACES)
     
     def get_preface(self) -> None:
         """
@@ -112,9 +115,13 @@ class AkomaNtosoParser(XMLParser):
         is extracted from the 'recital' element, with text from all paragraphs.
         """
         def extract_intro(recitals_section):
-            recitals_intro = recitals_section.find('.//akn:intro', namespaces=self.namespaces)
+            # <intro> is a direct child of <recitals> in the schema; the
+            # descendant search only covers documents that nest it deeper
+            recitals_intro = recitals_section.find('akn:intro', namespaces=self.namespaces)
+            if recitals_intro is None:
+                recitals_intro = recitals_section.find('.//akn:intro', namespaces=self.namespaces)
             intro_eId = self.extract_eId(recitals_intro, 'eId')
-            intro_text = ''.join(p.text.strip() for p in recitals_intro.findall('.//akn:p', namespaces=self.namespaces) if p.text)
+            intro_text = ''.join(p.text.strip() for p in recitals_intro.iterfind('.//akn:p', namespaces=self.namespaces) if p.text)
             return intro_eId, intro_text
 
         return super().get_recitals(
@@ -157,6 +164,15 @@ class AkomaNtosoParser(XMLParser):
             extract_eId=self.extract_eId
         )
     
+    def _strip_authorial_notes(self) -> None:
+        """
+        Remove all authorialNote elements from the body, keeping their tail text.
+        
+        Same result as remove_node(self.body, './/akn:authorialNote'), but done
+        by libxml2 in a single C-level pass instead of a per-node Python loop.
+        """
+        etree.strip_elements(self.body, f"{{{self.namespaces['akn']}}}authorialNote", with_tail=False)
+    
     def extract_eId(self, element: etree._Element, index: Optional[int] = None) -> str:
         """
         Extract the element ID (eId) from an XML element.
@@ -204,13 +220,13 @@ class AkomaNtosoParser(XMLParser):
         
         try:
             # Removing all authorialNote nodes
-            self.body = self.remove_node(self.body, './/akn:authorialNote')
+            self._strip_authorial_notes()
             
             # Use extractor for article processing
             extractor = AKNArticleExtractor(self.namespaces)
 
             # Find all <article> elements in the XML
-            article_elements = self.body.findall('.//akn:article', namespaces=self.namespaces)
+            article_elements = list(self.body.iter(f"{{{self.namespaces['akn']}}}article"))
             if not article_elements:
                 self.logger.warning("No <article> elements found in document body")
             
@@ -238,7 +254,7 @@ class AkomaNtosoParser(XMLParser):
         
         # Also find all <section> elements (used in some jurisdictions like Finland)
         try:
-            section_elements = self.body.findall('.//akn:section', namespaces=self.namespaces)
+            section_elements = self.body.iter(f"{{{self.namespaces['akn']}}}section")
             for section in section_elements:
                 try:
                     metadata = extractor.extract_article_metadata(section)
@@ -266,13 +282,22 @@ class AkomaNtosoParser(XMLParser):
         Extract conclusions from the document.
         
         Conclusions contain closing text and signatures.
+        
+        The schema places <conclusions> directly under the document type
+        element (akomaNtoso/act, akomaNtoso/bill, ...) and the signature
+        <container> directly under <conclusions>, so both are looked up there
+        first; the whole-tree descendant search is only a fallback.
         """
-        conclusions_section = self.root.find('.//akn:conclusions', namespaces=self.namespaces)
+        conclusions_section = self.root.find('*/akn:conclusions', namespaces=self.namespaces)
+        if conclusions_section is None:
+            conclusions_section = self.root.find('.//akn:conclusions', namespaces=self.namespaces)
         if conclusions_section is None:
             return None
 
         # Find the container with signatures
-        container = conclusions_section.find('.//akn:container[@name="signature"]', namespaces=self.namespaces)
+        container = conclusions_section.find('akn:container[@name="signature"]', namespaces=self.namespaces)
+        if container is None:
+            container = conclusions_section.find('.//akn:container[@name="signature"]', namespaces=self.namespaces)
         if container is None:
             return None
 
@@ -286,8 +311,9 @@ class AkomaNtosoParser(XMLParser):
             # For each <p>, find all <signature> tags
             paragraph_signatures = []
             for signature in p.findall('akn:signature', namespaces=self.namespaces):
-                # Collect text within the <signature>, including nested elements
-                signature_text = ''.join(signature.itertext()).strip()
+                # Collect text within the <signature>, including nested
+                # elements, in a single libxml2 string-value evaluation
+                signature_text = text_content(signature).strip()
                 paragraph_signatures.append(signature_text)
 
             # Add the paragraph's signatures as a group
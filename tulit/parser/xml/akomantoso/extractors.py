@@ -8,6 +8,8 @@ AkomaNtoso parser variants and improve code organization.
 from typing import Dict, List, Optional
 from lxml import etree
 
+from tulit.parser.xml.helpers import text_content
+
 
 class AKNArticleExtractor:
     """
@@ -30,6 +32,12 @@ class AKNArticleExtractor:
         """
         self.namespaces = namespaces
         self.id_attr = id_attr
+        # Clark names of the direct children looked up for every article,
+        # paragraph and point; find() with a plain tag skips prefix mapping
+        akn = namespaces['akn']
+        self._tag = {name: f'{{{akn}}}{name}' for name in (
+            'num', 'heading', 'paragraph', 'subparagraph', 'list', 'point', 'content'
+        )}
     
     def extract_article_metadata(self, article: etree._Element) -> Dict[str, Optional[str]]:
         """
@@ -59,8 +67,22 @@ class AKNArticleExtractor:
                 xpath=f"@{self.id_attr}"
             )
         
+        # One pass over the direct children collects the first <num>, the
+        # first <heading> and, as heading fallback, a second <num>
+        num_tag, heading_tag = self._tag['num'], self._tag['heading']
+        num_elem = heading_elem = second_num = None
+        for child in article.iterchildren(num_tag, heading_tag):
+            if child.tag == heading_tag:
+                if heading_elem is None:
+                    heading_elem = child
+            elif num_elem is None:
+                num_elem = child
+            elif second_num is None:
+                second_num = child
+            if num_elem is not None and heading_elem is not None:
+                break
+        
         # Extract article number
-        num_elem = article.find('akn:num', namespaces=self.namespaces)
         if num_elem is None:
             from tulit.parser.exceptions import ElementNotFoundError
             raise ElementNotFoundError(
@@ -69,19 +91,16 @@ class AKNArticleExtractor:
                 xpath="akn:num"
             )
         
-        num_text = ''.join(num_elem.itertext()).strip()
+        num_text = text_content(num_elem).strip()
         if not num_text:
             from tulit.parser.exceptions import ExtractionError
             raise ExtractionError(f"Article number text is empty for article with eId={eId}")
         
-        # Extract article heading/title
-        heading_elem = article.find('akn:heading', namespaces=self.namespaces)
+        # Extract article heading/title, falling back to the second <num>
         if heading_elem is None:
-            # Fallback: use second <num> if exists
-            num_elems = article.findall('akn:num', namespaces=self.namespaces)
-            heading_elem = num_elems[1] if len(num_elems) > 1 else None
+            heading_elem = second_num
         
-        heading_text = ''.join(heading_elem.itertext()).strip() if heading_elem is not None else None
+        heading_text = text_content(heading_elem).strip() if heading_elem is not None else None
         
         return {
             'eId': eId,
@@ -104,8 +123,10 @@ class AKNArticleExtractor:
             List of dicts with 'eId' and 'text' keys.
         """
         elements = []
+        # eId -> entry in elements, so repeated eIds are merged in O(1)
+        by_eid = {}
         
-        for p in node.findall('.//akn:p', namespaces=self.namespaces):
+        for p in node.iterfind('.//akn:p', namespaces=self.namespaces):
             # Find nearest parent with id_attr
             parent = p.getparent()
             while parent is not None and self.id_attr not in parent.attrib:
@@ -113,14 +134,15 @@ class AKNArticleExtractor:
             
             if parent is not None:
                 parent_eId = parent.get(self.id_attr, '')
-                text = ''.join(p.itertext()).strip()
+                text = text_content(p).strip()
                 if text:
                     # Check if we already have this eId
-                    existing = next((e for e in elements if e['eId'] == parent_eId), None)
+                    existing = by_eid.get(parent_eId)
                     if existing:
                         existing['text'] += ' ' + text
                     else:
-                        elements.append({'eId': parent_eId, 'text': text})
+                        by_eid[parent_eId] = {'eId': parent_eId, 'text': text}
+                        elements.append(by_eid[parent_eId])
         
         return elements
     
@@ -144,17 +166,17 @@ class AKNArticleExtractor:
         result = []
         
         # Process each paragraph in the article
-        paragraphs = node.findall('akn:paragraph', namespaces=self.namespaces)
+        paragraphs = node.findall(self._tag['paragraph'])
         
         for para in paragraphs:
             para_eId = para.get(self.id_attr, '')
             
             # Get paragraph number
-            num_elem = para.find('akn:num', namespaces=self.namespaces)
-            para_num = ''.join(num_elem.itertext()).strip() if num_elem is not None else ''
+            num_elem = para.find(self._tag['num'])
+            para_num = text_content(num_elem).strip() if num_elem is not None else ''
             
             # Process lists within the paragraph
-            lst = para.find('akn:list', namespaces=self.namespaces)
+            lst = para.find(self._tag['list'])
             if lst is not None:
                 # Combine intro + all points into one text
                 combined_text = self._combine_list_content(lst)
@@ -162,7 +184,7 @@ class AKNArticleExtractor:
                     result.append({'eId': para_eId, 'text': combined_text})
             else:
                 # Direct content without list
-                content = para.find('akn:content', namespaces=self.namespaces)
+                content = para.find(self._tag['content'])
                 if content is not None:
                     text = self._get_p_text(content)
                     if text:
@@ -170,7 +192,7 @@ class AKNArticleExtractor:
         
         # If no paragraphs found, check for direct lists
         if not paragraphs:
-            lists = node.findall('akn:list', namespaces=self.namespaces)
+            lists = node.findall(self._tag['list'])
             for lst in lists:
                 lst_eId = lst.get(self.id_attr, '')
                 combined_text = self._combine_list_content(lst)
@@ -196,14 +218,14 @@ class AKNArticleExtractor:
         parts = []
         
         # Get intro text from subparagraph(s)
-        intros = lst.findall('akn:subparagraph', namespaces=self.namespaces)
+        intros = lst.findall(self._tag['subparagraph'])
         for intro in intros:
             intro_text = self._get_p_text(intro)
             if intro_text:
                 parts.append(intro_text)
         
         # Process points
-        points = lst.findall('akn:point', namespaces=self.namespaces)
+        points = lst.findall(self._tag['point'])
         for point in points:
             point_text = self._combine_point_content(point)
             if point_text:
@@ -228,21 +250,21 @@ class AKNArticleExtractor:
         parts = []
         
         # Get point number
-        num_elem = point.find('akn:num', namespaces=self.namespaces)
+        num_elem = point.find(self._tag['num'])
         if num_elem is not None:
-            num_text = ''.join(num_elem.itertext()).strip()
+            num_text = text_content(num_elem).strip()
             if num_text:
                 parts.append(num_text)
         
         # Check for nested list
-        nested_list = point.find('akn:list', namespaces=self.namespaces)
+        nested_list = point.find(self._tag['list'])
         if nested_list is not None:
             nested_text = self._combine_list_content(nested_list)
             if nested_text:
                 parts.append(nested_text)
         else:
             # Direct content
-            content = point.find('akn:content', namespaces=self.namespaces)
+            content = point.find(self._tag['content'])
             if content is not None:
                 text = self._get_p_text(content)
                 if text:
@@ -267,16 +289,9 @@ class AKNArticleExtractor:
         if elem is None:
             return ''
         
-        p_elements = elem.findall('.//akn:p', namespaces=self.namespaces)
-        if p_elements:
-            texts = []
-            for p in p_elements:
-                text = ''.join(p.itertext()).strip()
-                if text:
-                    texts.append(text)
-            return ' '.join(texts)
-        
-        return ''
+        texts = (text_content(p).strip()
+                 for p in elem.iterfind('.//akn:p', namespaces=self.namespaces))
+        return ' '.join(filter(None, texts))
         
         return elements
     
@@ -306,7 +321,7 @@ class AKNArticleExtractor:
         result = []
         
         # Find direct paragraph children
-        paragraphs = node.findall('akn:paragraph', namespaces=self.namespaces)
+        paragraphs = node.findall(self._tag['paragraph'])
         
         if paragraphs:
             for para in paragraphs:
@@ -315,7 +330,7 @@ class AKNArticleExtractor:
                     result.append(para_data)
         else:
             # No paragraphs - might be direct list or content
-            lists = node.findall('akn:list', namespaces=self.namespaces)
+            lists = node.findall(self._tag['list'])
             if lists:
                 for lst in lists:
                     list_data = self._extract_list_structure(lst)
@@ -343,11 +358,11 @@ class AKNArticleExtractor:
         para_eId = para.get(self.id_attr, '')
         
         # Get paragraph number
-        num_elem = para.find('akn:num', namespaces=self.namespaces)
-        num_text = ''.join(num_elem.itertext()).strip() if num_elem is not None else None
+        num_elem = para.find(self._tag['num'])
+        num_text = text_content(num_elem).strip() if num_elem is not None else None
         
         # Check for list structure
-        lst = para.find('akn:list', namespaces=self.namespaces)
+        lst = para.find(self._tag['list'])
         if lst is not None:
             list_content = self._extract_list_structure(lst)
             return {
@@ -357,7 +372,7 @@ class AKNArticleExtractor:
             }
         
         # Check for direct content
-        content = para.find('akn:content', namespaces=self.namespaces)
+        content = para.find(self._tag['content'])
         if content is not None:
             text = self._extract_element_text(content)
             if text:
@@ -395,7 +410,7 @@ class AKNArticleExtractor:
         items = []
         
         # Extract intro (subparagraph with refersTo="~INP")
-        intros = lst.findall('akn:subparagraph', namespaces=self.namespaces)
+        intros = lst.findall(self._tag['subparagraph'])
         for intro in intros:
             intro_eId = intro.get(self.id_attr, '')
             intro_text = self._extract_element_text(intro)
@@ -407,7 +422,7 @@ class AKNArticleExtractor:
                 })
         
         # Extract points
-        points = lst.findall('akn:point', namespaces=self.namespaces)
+        points = lst.findall(self._tag['point'])
         for point in points:
             point_data = self._extract_point_structure(point)
             if point_data:
@@ -432,11 +447,11 @@ class AKNArticleExtractor:
         point_eId = point.get(self.id_attr, '')
         
         # Get point number (a), (b), (i), (ii), etc.
-        num_elem = point.find('akn:num', namespaces=self.namespaces)
-        num_text = ''.join(num_elem.itertext()).strip() if num_elem is not None else None
+        num_elem = point.find(self._tag['num'])
+        num_text = text_content(num_elem).strip() if num_elem is not None else None
         
         # Check for nested list
-        nested_list = point.find('akn:list', namespaces=self.namespaces)
+        nested_list = point.find(self._tag['list'])
         if nested_list is not None:
             children = self._extract_list_structure(nested_list)
             return {
@@ -447,7 +462,7 @@ class AKNArticleExtractor:
             }
         
         # Check for direct content
-        content = point.find('akn:content', namespaces=self.namespaces)
+        content = point.find(self._tag['content'])
         if content is not None:
             text = self._extract_element_text(content)
             if text:
@@ -474,18 +489,14 @@ class AKNArticleExtractor:
         str
             Concatenated and stripped text content.
         """
-        # Find all <p> elements within this element
-        p_elements = elem.findall('.//akn:p', namespaces=self.namespaces)
-        if p_elements:
-            texts = []
-            for p in p_elements:
-                text = ''.join(p.itertext()).strip()
-                if text:
-                    texts.append(text)
-            return ' '.join(texts)
+        # Join the text of all <p> elements within this element
+        if elem.find('.//akn:p', namespaces=self.namespaces) is not None:
+            texts = (text_content(p).strip()
+                     for p in elem.iterfind('.//akn:p', namespaces=self.namespaces))
+            return ' '.join(filter(None, texts))
         
         # Fallback to all text
-        return ''.join(elem.itertext()).strip()
+        return text_content(elem).strip()
 
 
 class AKNParseOrchestrator:
@@ -496,6 +507,20 @@ class AKNParseOrchestrator:
     across different AKN parser variants.
     """
     
+    # Standard workflow as (method name, description), built once per class
+    _STANDARD_STEPS = (
+        ('get_preface', 'Preface'),
+        ('get_preamble', 'Preamble'),
+        ('get_formula', 'Formula'),
+        ('get_citations', 'Citations'),
+        ('get_recitals', 'Recitals'),
+        ('get_preamble_final', 'Preamble final'),
+        ('get_body', 'Body'),
+        ('get_chapters', 'Chapters'),
+        ('get_articles', 'Articles'),
+        ('get_conclusions', 'Conclusions'),
+    )
+    
     def __init__(self, parser):
         """
         Initialize with reference to parser instance.
@@ -539,20 +564,7 @@ class AKNParseOrchestrator:
         preface -> preamble -> formula -> citations -> recitals ->
         preamble_final -> body -> chapters -> articles -> conclusions
         """
-        steps = [
-            ('get_preface', 'Preface'),
-            ('get_preamble', 'Preamble'),
-            ('get_formula', 'Formula'),
-            ('get_citations', 'Citations'),
-            ('get_recitals', 'Recitals'),
-            ('get_preamble_final', 'Preamble final'),
-            ('get_body', 'Body'),
-            ('get_chapters', 'Chapters'),
-            ('get_articles', 'Articles'),
-            ('get_conclusions', 'Conclusions'),
-        ]
-        
-        for method_name, description in steps:
+        for method_name, description in self._STANDARD_STEPS:
             self.execute_parse_step(method_name, description)
 
 
@@ -593,7 +605,7 @@ class AKNContentProcessor:
         
         for item in parent.findall('.//akn:item', namespaces=self.namespaces):
             eId = item.get('eId', '')
-            text = ''.join(item.itertext()).strip()
+            text = text_content(item).strip()
             if text:
                 items.append({'eId': eId, 'text': text})
         
@@ -619,7 +631,7 @@ class AKNContentProcessor:
         for row in table.findall('.//akn:tr', namespaces=self.namespaces):
             cells = []
             for cell in row.findall('.//akn:td', namespaces=self.namespaces):
-                cells.append(''.join(cell.itertext()).strip())
+                cells.append(text_content(cell).strip())
             if cells:
                 rows.append(cells)
         
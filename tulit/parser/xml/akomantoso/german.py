@@ -30,16 +30,11 @@ class GermanLegalDocMLParser(AkomaNtosoParser):
     >>> print(parser.articles)
     """
     
-    def __init__(self) -> None:
-        """Initialize the German LegalDocML parser with German namespace."""
-        super().__init__()
-        
-        # Override namespace to use German LegalDocML
-        # Map 'akn' prefix to German namespace so all XPath queries work seamlessly
-        self.namespaces = {
-            'akn': 'http://Inhaltsdaten.LegalDocML.de/1.8.2/',
-            'an': 'http://Inhaltsdaten.LegalDocML.de/1.8.2/',
-        }
+    # Map 'akn' prefix to German namespace so all XPath queries work seamlessly
+    NAMESPACES: dict[str, str] = {
+        'akn': 'http://Inhaltsdaten.LegalDocML.de/1.8.2/',
+        'an': 'http://Inhaltsdaten.LegalDocML.de/1.8.2/',
+    }
     
     def parse(self, file: str, **options) -> 'GermanLegalDocMLParser':
         """
@@ -33,17 +33,13 @@ class LuxembourgAKNParser(AkomaNtosoParser):
     >>> print(parser.articles)
     """
     
-    def __init__(self) -> None:
-        """Initialize the Luxembourg parser with CSD13 namespace."""
-        super().__init__()
-        
-        # Override namespace to use Luxembourg's CSD13 variant
-        # Map 'akn' prefix to CSD13 namespace so all XPath queries work seamlessly
-        self.namespaces = {
-            'akn': 'http://docs.oasis-open.org/legaldocml/ns/akn/3.0/CSD13',
-            'an': 'http://docs.oasis-open.org/legaldocml/ns/akn/3.0/CSD13',
-            'scl': 'http://www.scl.lu'  # Luxembourg-specific metadata namespace
-        }
+    # Map 'akn' prefix to Luxembourg's CSD13 namespace so all XPath queries
+    # work seamlessly
+    NAMESPACES: dict[str, str] = {
+        'akn': 'http://docs.oasis-open.org/legaldocml/ns/akn/3.0/CSD13',
+        'an': 'http://docs.oasis-open.org/legaldocml/ns/akn/3.0/CSD13',
+        'scl': 'http://www.scl.lu'  # Luxembourg-specific metadata namespace
+    }
     
     def extract_eId(self, element: etree._Element, index: Optional[int] = None) -> str:
         """
@@ -116,13 +112,13 @@ class LuxembourgAKNParser(AkomaNtosoParser):
             return
         
         # Removing all authorialNote nodes
-        self.body = self.remove_node(self.body, './/akn:authorialNote')
+        self._strip_authorial_notes()
 
         # Use extractor for article processing with 'id' attribute
         extractor = AKNArticleExtractor(self.namespaces, id_attr='id')
 
         # Find all <article> elements in the XML
-        for article in self.body.findall('.//akn:article', namespaces=self.namespaces):
+        for article in self.body.iter(f"{{{self.namespaces['akn']}}}article"):
             metadata = extractor.extract_article_metadata(article)
             children = extractor.extract_paragraphs_by_eid(article)
 
@@ -134,7 +130,7 @@ class LuxembourgAKNParser(AkomaNtosoParser):
             })
         
         # Also find all <section> elements (used in some jurisdictions like Finland)
-        for section in self.body.findall('.//akn:section', namespaces=self.namespaces):
+        for section in self.body.iter(f"{{{self.namespaces['akn']}}}section"):
             metadata = extractor.extract_article_metadata(section)
             children = extractor.extract_paragraphs_by_eid(section)
 
@@ -1,9 +1,8 @@
 import os
 import re
-import json
-import argparse
 import logging
 from copy import deepcopy
+from itertools import islice
 from typing import Optional, Any
 from lxml import etree
 
@@ -62,8 +61,66 @@ _CITED_ACT_RE = re.compile(
     r"|\d{2,4}/\d{1,4}/(?:EU|EC|EEC|CFSP|Euratom))"
 )
 
+# XPath expressions evaluated for every document (and most of them for every
+# article or content block), compiled once at import time. Calling
+# element.xpath() with a string recompiles the expression on each call.
+_XP_TOP_P = etree.XPath('.//P[not(ancestor::P) and not(ancestor::NOTE)]')
+_XP_PREAMBLE_GROUPS = etree.XPath('.//GR.VISA | .//VISA | .//GR.CONSID | .//CONSID')
+_XP_DIV_CONSID_TITLES = etree.XPath('.//DIV.CONSID/TITLE')
+_XP_RECITAL_BLOCKS = etree.XPath(
+    './/TBL[not(ancestor::CONSID) and not(ancestor::TBL)]'
+    ' | .//QUOT.S[not(ancestor::CONSID) and not(ancestor::QUOT.S)]'
+)
+_XP_RECITAL_ITEMS = etree.XPath('.//ITEM[not(ancestor::CONSID) and not(ancestor::ITEM)]')
+_XP_TOP_ITEMS = etree.XPath('.//ITEM[not(ancestor::ITEM)]')
+_XP_TOP_NP = etree.XPath('.//NP[not(ancestor::NP)]')
+_XP_ARTICLE_STI = etree.XPath('.//STI.ART[not(ancestor::QUOT.S)]')
+_XP_QUOTES = etree.XPath('.//QUOT.S | .//QUOT.START')
+_XP_TOP_PARAG = etree.XPath('.//PARAG[not(ancestor::QUOT.S) and not(ancestor::PARAG)]')
+_XP_CHILDREN_QUOTED = etree.XPath(
+    './/ALINEA[not(ancestor::QUOT.S) and not(ancestor::ALINEA)]'
+    ' | .//QUOT.S[not(ancestor::ALINEA) and not(ancestor::QUOT.S)]'
+    ' | .//SUBDIV/TITLE[not(ancestor::QUOT.S)]'
+)
+_XP_CHILDREN_PARAG = etree.XPath(
+    './/PARAG[not(ancestor::QUOT.S) and not(ancestor::PARAG)]'
+    ' | .//ALINEA[not(ancestor::QUOT.S) and not(ancestor::PARAG) and not(ancestor::ALINEA) and not(descendant::PARAG)]'
+    ' | .//SUBDIV/TITLE[not(ancestor::QUOT.S)]'
+)
+_XP_CHILDREN_ALINEA = etree.XPath('.//ALINEA[not(ancestor::ALINEA)] | .//SUBDIV/TITLE')
+_XP_FINAL_P = etree.XPath('.//P[not(ancestor::SIGNATURE)]')
+_XP_INCLUSIONS = etree.XPath('.//INCL.ELEMENT[not(ancestor::BIB.INSTANCE)]')
+_XP_SPECIAL_BLOCKS = etree.XPath('.//TBL | .//QUOT.S | .//NP | .//DLIST.ITEM')
+_XP_TOP_QUOT_S = etree.XPath('.//QUOT.S[not(ancestor::QUOT.S)]')
+_XP_DIVISIONS = etree.XPath('.//DIVISION[not(ancestor::QUOT.S)]')
+_XP_LEGACY_TITLES = etree.XPath(
+    './/TITLE[not(ancestor::DIVISION) and not(ancestor::ARTICLE)'
+    ' and not(ancestor::TBL) and not(ancestor::QUOT.S)'
+    ' and not(ancestor::GR.NOTES) and not(ancestor::GR.SEQ)]'
+)
+
+
+def _remove_keeping_tail(elements, keep_blank_tail: bool = True) -> None:
+    """
+    Removes elements from their tree, moving each element's tail text onto
+    the previous sibling (or the parent's text) so surrounding text stays
+    intact. Whitespace-only tails are dropped unless keep_blank_tail is set.
+    """
+    for el in elements:
+        parent = el.getparent()
+        if parent is None:
+            continue
+        if el.tail and (keep_blank_tail or el.tail.strip()):
+            prev = el.getprevious()
+            if prev is not None:
+                prev.tail = (prev.tail or '') + el.tail
+            else:
+                parent.text = (parent.text or '') + el.tail
+        parent.remove(el)
+
 from tulit.parser.xml.xml import XMLParser
-from tulit.parser.parser import LegalJSONValidator, create_formex_normalizer
+from tulit.parser.xml.helpers import text_content
+from tulit.parser.parser import create_formex_normalizer
 from tulit.parser.strategies.article_extraction import FormexArticleStrategy
 
 class Formex4Parser(XMLParser):
@@ -101,7 +158,7 @@ class Formex4Parser(XMLParser):
             self.preface = None
             return None
         title = self._without_notes(title)
-        paragraphs = title.xpath('.//P[not(ancestor::P) and not(ancestor::NOTE)]')
+        paragraphs = _XP_TOP_P(title)
         if paragraphs:
             text = ' '.join(filter(None, (self.clean_text(p) for p in paragraphs)))
         else:
@@ -146,17 +203,7 @@ class Formex4Parser(XMLParser):
             # groups inside PREAMBLE.INIT — those are extracted separately
             # and must not be repeated here.
             copy = deepcopy(el)
-            for sub in copy.xpath('.//GR.VISA | .//VISA | .//GR.CONSID | .//CONSID'):
-                parent = sub.getparent()
-                if parent is None:
-                    continue
-                if sub.tail:
-                    prev = sub.getprevious()
-                    if prev is not None:
-                        prev.tail = (prev.tail or '') + sub.tail
-                    else:
-                        parent.text = (parent.text or '') + sub.tail
-                parent.remove(sub)
+            _remove_keeping_tail(_XP_PREAMBLE_GROUPS(copy))
             self.formula = self.clean_text(copy) or None
         else:
             self.formula = None
@@ -252,7 +299,7 @@ class Formex4Parser(XMLParser):
         recitals = []
 
         # Group titles inside the recitals (DIV.CONSID divisions)
-        for div_title in recitals_section.xpath('.//DIV.CONSID/TITLE'):
+        for div_title in _XP_DIV_CONSID_TITLES(recitals_section):
             text = self._title_text(div_title)
             if text:
                 recitals.append({'eId': f'rct_grp_{len(recitals) + 1}',
@@ -273,14 +320,14 @@ class Formex4Parser(XMLParser):
                 if child.tag == 'CONSID':
                     parts.append(norm(child.tail))
                     continue
-                if child.xpath('.//CONSID'):
+                if child.find('.//CONSID') is not None:
                     # container of chained recitals: render only its
                     # non-CONSID pieces
                     parts.append(norm(child.text))
                     for sub in child:
                         if not isinstance(sub.tag, str):
                             continue
-                        if sub.tag != 'CONSID' and not sub.xpath('.//CONSID'):
+                        if sub.tag != 'CONSID' and sub.find('.//CONSID') is None:
                             parts.append(self._render_annex_text(sub))
                         parts.append(norm(sub.tail))
                 elif child.tag == 'NP':
@@ -310,17 +357,14 @@ class Formex4Parser(XMLParser):
             # Recital groups (DIV.CONSID) may hold free-standing tables or
             # quoted blocks outside any CONSID (e.g. injury-analysis tables
             # in trade-defence decisions)
-            for block in recitals_section.xpath(
-                    './/TBL[not(ancestor::CONSID) and not(ancestor::TBL)]'
-                    ' | .//QUOT.S[not(ancestor::CONSID) and not(ancestor::QUOT.S)]'):
+            for block in _XP_RECITAL_BLOCKS(recitals_section):
                 text = self._render_annex_text(block)
                 if text:
                     recitals.append({'eId': f'rct_blk_{len(recitals) + 1}',
                                      'text': text})
 
             # ... and list items outside any CONSID
-            for item in recitals_section.xpath(
-                    './/ITEM[not(ancestor::CONSID) and not(ancestor::ITEM)]'):
+            for item in _XP_RECITAL_ITEMS(recitals_section):
                 no_p = item.findtext('.//NO.P')
                 parts = [self._render_annex_text(sub) for sub in item
                          if isinstance(sub.tag, str)]
@@ -331,7 +375,7 @@ class Formex4Parser(XMLParser):
         else:
             # Some acts list recitals as list items (LIST > ITEM holding NP
             # or plain P blocks) or as bare numbered points
-            items = recitals_section.xpath('.//ITEM[not(ancestor::ITEM)]')
+            items = _XP_TOP_ITEMS(recitals_section)
             if items:
                 for item in items:
                     no_p = item.findtext('.//NO.P')
@@ -342,7 +386,7 @@ class Formex4Parser(XMLParser):
                         recitals.append({'eId': make_eid(no_p, len(recitals) + 1),
                                          'text': text})
             else:
-                for np in recitals_section.xpath('.//NP[not(ancestor::NP)]'):
+                for np in _XP_TOP_NP(recitals_section):
                     no_p = np.findtext('NO.P')
                     text = np_text([np])
                     if text:
@@ -408,7 +452,7 @@ class Formex4Parser(XMLParser):
             return eid
 
         counters: dict[str, int] = {}
-        divisions = self.body.xpath('.//DIVISION[not(ancestor::QUOT.S)]')
+        divisions = _XP_DIVISIONS(self.body)
         for div in divisions:
             title = div.find('TITLE')
             ti = title.find('TI') if title is not None else None
@@ -431,17 +475,15 @@ class Formex4Parser(XMLParser):
 
         # Legacy layout: division titles as bare TITLE elements (older
         # Formex versions), outside any DIVISION/article/table/quote
-        titles = self.body.xpath(
-            './/TITLE[not(ancestor::DIVISION) and not(ancestor::ARTICLE)'
-            ' and not(ancestor::TBL) and not(ancestor::QUOT.S)'
-            ' and not(ancestor::GR.NOTES) and not(ancestor::GR.SEQ)]'
-        )
+        titles = _XP_LEGACY_TITLES(self.body)
         for title in titles:
-            hts = title.findall('.//HT')
+            # Only the first two HT (number, heading) are used: stop there
+            # instead of collecting every HT of the title
+            hts = list(islice(title.iterdescendants('HT'), 2))
             if len(hts) < 2:
                 continue
-            num = ''.join(hts[0].itertext()).strip()
-            heading = ''.join(hts[1].itertext()).strip()
+            num = text_content(hts[0]).strip()
+            heading = text_content(hts[1]).strip()
             div_type, prefix = classify(num)
             counters[div_type] = counters.get(div_type, 0) + 1
             self.chapters.append({
@@ -479,22 +521,28 @@ class Formex4Parser(XMLParser):
             # structured amendment objects, uniform with annex children
             division_eids = getattr(self, '_division_eids', {})
             self._article_elems = {}
+            # One streamed pass maps each IDENTIFIER to its first ARTICLE
+            # (and document position), instead of a body-wide query per article
+            article_index = {}
+            for position, elem in enumerate(self.body.iterfind('.//ARTICLE[@IDENTIFIER]')):
+                article_index.setdefault(elem.get('IDENTIFIER'), (position, elem))
             for article in self.articles:
                 identifier = article.pop('identifier', None) or article['eId'][4:]
-                matches = self.body.xpath(
-                    f".//ARTICLE[@IDENTIFIER='{identifier}']"
-                    f" | .//ARTICLE[@IDENTIFIER='3{identifier}']"
-                )
+                matches = [
+                    article_index[key]
+                    for key in (identifier, f'3{identifier}')
+                    if key in article_index
+                ]
                 if not matches:
                     article['parent'] = None
                     continue
-                article_elem = matches[0]
+                article_elem = min(matches, key=lambda match: match[0])[1]
                 self._article_elems[article_elem] = article['eId']
                 # Heading: only the article's own STI.ART, never one inside
                 # quoted amendment content
-                sti = article_elem.xpath('.//STI.ART[not(ancestor::QUOT.S)]')
+                sti = _XP_ARTICLE_STI(article_elem)
                 article['heading'] = (
-                    (sti[0].findtext('.//P') or ''.join(sti[0].itertext())).strip()
+                    (sti[0].findtext('.//P') or text_content(sti[0])).strip()
                     if sti else None
                 ) or None
                 # Hierarchy: the nearest enclosing division, if any
@@ -669,19 +717,11 @@ class Formex4Parser(XMLParser):
 
     def _select_article_children(self, article_elem: etree._Element) -> list:
         """The element selection matching the article strategy's children."""
-        if article_elem.xpath('.//QUOT.S | .//QUOT.START'):
-            return article_elem.xpath(
-                './/ALINEA[not(ancestor::QUOT.S) and not(ancestor::ALINEA)]'
-                ' | .//QUOT.S[not(ancestor::ALINEA) and not(ancestor::QUOT.S)]'
-                ' | .//SUBDIV/TITLE[not(ancestor::QUOT.S)]'
-            )
-        if article_elem.xpath('.//PARAG[not(ancestor::QUOT.S) and not(ancestor::PARAG)]'):
-            return article_elem.xpath(
-                './/PARAG[not(ancestor::QUOT.S) and not(ancestor::PARAG)]'
-                ' | .//ALINEA[not(ancestor::QUOT.S) and not(ancestor::PARAG) and not(ancestor::ALINEA) and not(descendant::PARAG)]'
-                ' | .//SUBDIV/TITLE[not(ancestor::QUOT.S)]'
-            )
-        return article_elem.xpath('.//ALINEA[not(ancestor::ALINEA)] | .//SUBDIV/TITLE')
+        if _XP_QUOTES(article_elem):
+            return _XP_CHILDREN_QUOTED(article_elem)
+        if _XP_TOP_PARAG(article_elem):
+            return _XP_CHILDREN_PARAG(article_elem)
+        return _XP_CHILDREN_ALINEA(article_elem)
     
     def get_conclusions(self) -> None:
         """
@@ -699,7 +739,7 @@ class Formex4Parser(XMLParser):
         if final_section is not None:
             final_section = self._without_notes(final_section)
             # All concluding paragraphs outside the signature block
-            paragraphs = final_section.xpath('.//P[not(ancestor::SIGNATURE)]')
+            paragraphs = _XP_FINAL_P(final_section)
             conclusion_text = ' '.join(
                 filter(None, (self.clean_text(p) for p in paragraphs))
             ).strip()
@@ -755,7 +795,7 @@ class Formex4Parser(XMLParser):
         self.annexes = []
         for index, annex_file in enumerate(annex_files, start=1):
             try:
-                tree = etree.parse(annex_file)
+                tree = etree.parse(annex_file, self._create_secure_parser())
             except Exception as e:
                 self.logger.warning(f"Could not parse annex file {annex_file}: {e}")
                 continue
@@ -776,17 +816,7 @@ class Formex4Parser(XMLParser):
         conclusions); annexes keep them.
         """
         copy = deepcopy(element)
-        for note in copy.findall('.//NOTE'):
-            parent = note.getparent()
-            if parent is None:
-                continue
-            if note.tail:
-                prev = note.getprevious()
-                if prev is not None:
-                    prev.tail = (prev.tail or '') + note.tail
-                else:
-                    parent.text = (parent.text or '') + note.tail
-            parent.remove(note)
+        _remove_keeping_tail(copy.findall('.//NOTE'))
         return copy
 
     def _resolve_inclusions(self, element: etree._Element, base_dir: Optional[str], _depth: int = 0) -> None:
@@ -814,7 +844,7 @@ class Formex4Parser(XMLParser):
 
         # INCL.ELEMENT inside BIB.INSTANCE is a manifest declaration, not a
         # content reference — only resolve inclusions in the document body.
-        for incl in element.xpath('.//INCL.ELEMENT[not(ancestor::BIB.INSTANCE)]'):
+        for incl in _XP_INCLUSIONS(element):
             fileref = incl.get('FILEREF')
             if not fileref:
                 continue
@@ -823,7 +853,7 @@ class Formex4Parser(XMLParser):
                 self.logger.warning(f"Included file not found: {path}")
                 continue
             try:
-                included_root = etree.parse(path).getroot()
+                included_root = etree.parse(path, self._create_secure_parser()).getroot()
             except Exception as e:
                 self.logger.warning(f"Could not parse included file {path}: {e}")
                 continue
@@ -1016,7 +1046,7 @@ class Formex4Parser(XMLParser):
             no_p = element.find('NO.P')
             if no_p is not None:
                 # Raw text: the normalizer would strip numbers like '(1)'
-                num = ' '.join(''.join(no_p.itertext()).split())
+                num = ' '.join(text_content(no_p).split())
                 if num:
                     parts.append(num)
             for sub in element:
@@ -1058,7 +1088,7 @@ class Formex4Parser(XMLParser):
 
         # Blocks containing tables, quoted blocks, numbered points or
         # definition lists need structured rendering; anything else is plain text.
-        special = element.xpath('.//TBL | .//QUOT.S | .//NP | .//DLIST.ITEM')
+        special = _XP_SPECIAL_BLOCKS(element)
         if not special:
             return self.clean_text(element)
 
@@ -1144,7 +1174,7 @@ class Formex4Parser(XMLParser):
                             'children': self._quoted_children(element)}],
             }
 
-        quot_blocks = element.xpath('.//QUOT.S[not(ancestor::QUOT.S)]')
+        quot_blocks = _XP_TOP_QUOT_S(element)
         instruction = self._instruction_text(element)
         action = self._amendment_action(instruction)
 
@@ -1204,17 +1234,7 @@ class Formex4Parser(XMLParser):
         leaving only the amendment command itself.
         """
         copy = deepcopy(element)
-        for quot in copy.xpath('.//QUOT.S'):
-            parent = quot.getparent()
-            if parent is None:
-                continue
-            if quot.tail and quot.tail.strip():
-                prev = quot.getprevious()
-                if prev is not None:
-                    prev.tail = (prev.tail or '') + quot.tail
-                else:
-                    parent.text = (parent.text or '') + quot.tail
-            parent.remove(quot)
+        _remove_keeping_tail(list(copy.iterdescendants('QUOT.S')), keep_blank_tail=False)
         return self._render_annex_text(copy)
 
     def _inline_quoted_spans(self, element: etree._Element) -> list[str]:
@@ -1224,19 +1244,19 @@ class Formex4Parser(XMLParser):
         their own).
         """
         copy = deepcopy(element)
-        for quot in copy.xpath('.//QUOT.S'):
+        for quot in list(copy.iterdescendants('QUOT.S')):
             parent = quot.getparent()
             if parent is not None:
                 parent.remove(quot)
-        starts = copy.xpath('.//QUOT.START')
+        starts = copy.findall('.//QUOT.START')
         if not starts:
             return []
         # Private-use-area sentinels: lxml rejects ASCII control characters
         for marker in starts:
             marker.text = ''
-        for marker in copy.xpath('.//QUOT.END'):
+        for marker in copy.findall('.//QUOT.END'):
             marker.text = ''
-        raw = ''.join(copy.itertext())
+        raw = text_content(copy)
         spans = re.findall('\ue000(.*?)\ue001', raw, re.S)
         return [' '.join(s.split()) for s in spans if s.strip()]
 
@@ -1259,7 +1279,7 @@ class Formex4Parser(XMLParser):
                     return False
             return True
 
-        scopes = [c for c in quot.xpath('.//CONTENTS')
+        scopes = [c for c in quot.findall('.//CONTENTS')
                   if _top_level_in_quote(c)] or [quot]
 
         children: list[dict[str, Any]] = []
@@ -1311,7 +1331,7 @@ class Formex4Parser(XMLParser):
                 sub.text = "'"
             elif sub.tag == 'QUOT.END':
                 sub.text = "'"
-        return ' '.join(''.join(element.itertext()).split())
+        return ' '.join(text_content(element).split())
 
     def _table_rows(self, table: etree._Element) -> list[list[str]]:
         """
@@ -1359,7 +1379,7 @@ class Formex4Parser(XMLParser):
                 sub_element.text = "'"
                 
         # Extract text and normalize using strategy
-        text = "".join(element.itertext())
+        text = text_content(element)
         text = self.normalizer.normalize(text)
         
         return text
@@ -1460,17 +1480,44 @@ class Formex4Parser(XMLParser):
 
         Manifest declarations inside BIB.INSTANCE are ignored — only body
         references count as inclusions.
+
+        Only the FILEREF attributes are needed, so each file is streamed with
+        iterparse and every element is discarded once it has been closed:
+        the full annex tree is never held in memory here.
         """
         if not annex_files:
             return annex_files
         referenced = set()
         for annex_file in annex_files:
             try:
-                root = etree.parse(annex_file).getroot()
+                referenced.update(self._included_filerefs(annex_file))
             except Exception:
                 continue
-            for incl in root.xpath('.//INCL.ELEMENT[not(ancestor::BIB.INSTANCE)]'):
-                fileref = incl.get('FILEREF')
+        return [f for f in annex_files if os.path.basename(f) not in referenced]
+
+    @staticmethod
+    def _included_filerefs(annex_file: str) -> set[str]:
+        """
+        Returns the base names referenced by INCL.ELEMENT outside BIB.INSTANCE
+        in an annex file, streaming it element by element.
+        """
+        filerefs = set()
+        bib_depth = 0
+        for event, elem in etree.iterparse(
+            annex_file, events=('start', 'end'),
+            resolve_entities=False, no_network=True,
+        ):
+            if elem.tag == 'BIB.INSTANCE':
+                bib_depth += 1 if event == 'start' else -1
+            elif event == 'start' and elem.tag == 'INCL.ELEMENT' and not bib_depth:
+                fileref = elem.get('FILEREF')
                 if fileref:
-                    referenced.add(os.path.basename(fileref))
-        return [f for f in annex_files if os.path.basename(f) not in referenced]
\ No newline at end of file
+                    filerefs.add(os.path.basename(fileref))
+            if event == 'end':
+                # Free the finished subtree and the already processed siblings
+                elem.clear()
+                parent = elem.getparent()
+                if parent is not None:
+                    while elem.getprevious() is not None:
+                        del parent[0]
+        return filerefs
\ No newline at end of file
@@ -6,10 +6,37 @@ XPath-based extraction, validation, and node manipulation. These utilities
 reduce code duplication across XML-based parsers.
 """
 
-from typing import Optional, List
+from typing import Optional, List, Union
 from lxml import etree
 import os
 import logging
+import threading
+
+
+XSD_NAMESPACE = 'http://www.w3.org/2001/XMLSchema'
+XML_NAMESPACE = 'http://www.w3.org/XML/1998/namespace'
+
+_XP_STRING_VALUE = etree.XPath('string()', smart_strings=False)
+
+
+def text_content(element: etree._Element) -> str:
+    """
+    Return the concatenated descendant text of an element.
+
+    Equivalent to ``''.join(element.itertext())`` but evaluated by libxml2 as
+    the XPath string-value, so the tree walk does not go through Python.
+
+    Parameters
+    ----------
+    element : lxml.etree._Element
+        Element to extract text from
+
+    Returns
+    -------
+    str
+        Concatenated text content, without the element's own tail
+    """
+    return _XP_STRING_VALUE(element)
 
 
 class XMLNodeExtractor:
@@ -42,7 +69,7 @@ class XMLNodeExtractor:
         """
         self.namespaces = namespaces or {}
     
-    def find(self, element: etree._Element, xpath: str) -> Optional[etree._Element]:
+    def find(self, element: etree._Element, xpath: Union[str, etree.XPath]) -> Optional[etree._Element]:
         """
         Find the first element matching the XPath expression.
         
@@ -50,17 +77,20 @@ class XMLNodeExtractor:
         ----------
         element : lxml.etree._Element
             Root element to search from
-        xpath : str
-            XPath expression
+        xpath : str or lxml.etree.XPath
+            XPath expression, or an expression precompiled with etree.XPath
         
         Returns
         -------
         lxml.etree._Element or None
             First matching element or None
         """
+        if isinstance(xpath, etree.XPath):
+            matches = xpath(element)
+            return matches[0] if matches else None
         return element.find(xpath, namespaces=self.namespaces)
     
-    def findall(self, element: etree._Element, xpath: str) -> List[etree._Element]:
+    def findall(self, element: etree._Element, xpath: Union[str, etree.XPath]) -> List[etree._Element]:
         """
         Find all elements matching the XPath expression.
         
@@ -68,14 +98,16 @@ class XMLNodeExtractor:
         ----------
         element : lxml.etree._Element
             Root element to search from
-        xpath : str
-            XPath expression
+        xpath : str or lxml.etree.XPath
+            XPath expression, or an expression precompiled with etree.XPath
         
         Returns
         -------
         list[lxml.etree._Element]
             List of matching elements
         """
+        if isinstance(xpath, etree.XPath):
+            return xpath(element)
         return element.findall(xpath, namespaces=self.namespaces)
     
     def extract_text(self, element: etree._Element, strip: bool = True) -> str:
@@ -94,7 +126,7 @@ class XMLNodeExtractor:
         str
             Concatenated text content
         """
-        text = ''.join(element.itertext())
+        text = text_content(element)
         return text.strip() if strip else text
     
     def extract_text_from_all(
@@ -234,12 +266,57 @@ class XMLValidator:
     >>> is_valid = validator.validate(xml_root)
     """
     
+    # Compiled schemas shared by all validators, keyed by (absolute path,
+    # schema type, modification time): every parser instance loads the same
+    # bundled schema, and compiling an XSD is far costlier than validating.
+    # Each entry carries a lock, as a schema's error_log is overwritten by
+    # every validation run on it
+    _schema_cache: dict = {}
+    
     def __init__(self):
         """Initialize the XML validator."""
         self.schema = None
         self.relaxng = None
+        self._expected_roots = None
+        self._schema_lock = None
+        self._errors = []
         self.logger = logging.getLogger(__name__)
     
+    @staticmethod
+    def _collect_root_names(schema_doc: etree._ElementTree) -> Optional[set]:
+        """
+        Collect the names of the top-level elements declared by an XSD.
+        
+        Only global ``xs:element`` declarations can be used as document
+        roots, so their local names are enough to reject documents of the
+        wrong type before running the full schema engine.
+        
+        Parameters
+        ----------
+        schema_doc : lxml.etree._ElementTree
+            Parsed XSD document
+        
+        Returns
+        -------
+        set[str] or None
+            Local names of the allowed root elements, or None if the schema
+            pulls in declarations from other documents and the set cannot be
+            determined from this file alone
+        """
+        root = schema_doc.getroot()
+        for child in root:
+            if child.tag in (f'{{{XSD_NAMESPACE}}}include', f'{{{XSD_NAMESPACE}}}redefine'):
+                return None
+            # Importing the XML namespace only brings in xml:* attributes
+            if child.tag == f'{{{XSD_NAMESPACE}}}import' and child.get('namespace') != XML_NAMESPACE:
+                return None
+        
+        return {
+            child.get('name')
+            for child in root.iterchildren(f'{{{XSD_NAMESPACE}}}element')
+            if child.get('name')
+        }
+    
     def load_schema(self, schema_path: str, schema_type: str = 'xsd') -> bool:
         """
         Load an XML schema file.
@@ -272,19 +349,29 @@ class XMLValidator:
                 self.logger.error(error_msg)
                 raise FileLoadError(error_msg)
             
-            schema_doc = etree.parse(schema_path)
-            
-            if schema_type.lower() == 'xsd':
-                self.schema = etree.XMLSchema(schema_doc)
-                self.logger.info(f"Loaded XSD schema: {schema_path}")
-            elif schema_type.lower() == 'relaxng':
-                self.relaxng = etree.RelaxNG(schema_doc)
-                self.logger.info(f"Loaded RelaxNG schema: {schema_path}")
-            else:
+            kind = schema_type.lower()
+            if kind not in ('xsd', 'relaxng'):
                 error_msg = f"Unknown schema type: {schema_type}"
                 self.logger.error(error_msg)
                 raise ParserConfigurationError(error_msg)
             
+            cache_key = (os.path.abspath(schema_path), kind, os.path.getmtime(schema_path))
+            cached = self._schema_cache.get(cache_key)
+            if cached is None:
+                schema_doc = etree.parse(schema_path)
+                if kind == 'xsd':
+                    cached = (etree.XMLSchema(schema_doc), self._collect_root_names(schema_doc), threading.Lock())
+                else:
+                    cached = (etree.RelaxNG(schema_doc), None, threading.Lock())
+                self._schema_cache[cache_key] = cached
+            
+            if kind == 'xsd':
+                self.schema, self._expected_roots, self._schema_lock = cached
+                self.logger.info(f"Loaded XSD schema: {schema_path}")
+            else:
+                self.relaxng, self._expected_roots, self._schema_lock = cached
+                self.logger.info(f"Loaded RelaxNG schema: {schema_path}")
+            
             return True
             
         except etree.XMLSchemaParseError as e:
@@ -320,42 +407,38 @@ class XMLValidator:
         ParserConfigurationError
             If no schema is loaded or validation setup fails
         """
+        from tulit.parser.exceptions import SchemaValidationError, ParserConfigurationError
+        
         if self.schema is None and self.relaxng is None:
-            from tulit.parser.exceptions import ParserConfigurationError
             error_msg = "No schema loaded for validation"
             self.logger.warning(error_msg)
             raise ParserConfigurationError(error_msg)
         
+        self._errors = []
+        
         try:
             if self.schema is not None:
-                is_valid = self.schema.validate(xml_tree)
+                self._check_root(xml_tree)
+                is_valid = self._run_validation(self.schema, xml_tree)
                 if not is_valid:
-                    error_messages = []
-                    for error in self.schema.error_log:
-                        error_msg = f"Line {error.line}: {error.message}"
-                        error_messages.append(error_msg)
+                    for error_msg in self._errors:
                         self.logger.error(f"XSD validation failed: {error_msg}")
                     
-                    from tulit.parser.exceptions import SchemaValidationError
                     raise SchemaValidationError(
                         "XSD validation failed",
-                        validation_errors=error_messages
+                        validation_errors=list(self._errors)
                     )
                 return is_valid
             
             elif self.relaxng is not None:
-                is_valid = self.relaxng.validate(xml_tree)
+                is_valid = self._run_validation(self.relaxng, xml_tree)
                 if not is_valid:
-                    error_messages = []
-                    for error in self.relaxng.error_log:
-                        error_msg = f"Line {error.line}: {error.message}"
-                        error_messages.append(error_msg)
+                    for error_msg in self._errors:
                         self.logger.error(f"RelaxNG validation failed: {error_msg}")
                     
-                    from tulit.parser.exceptions import SchemaValidationError
                     raise SchemaValidationError(
                         "RelaxNG validation failed",
-                        validation_errors=error_messages
+                        validation_errors=list(self._errors)
                     )
                 return is_valid
             
@@ -363,13 +446,69 @@ class XMLValidator:
             # SchemaValidationError should be re-raised, not wrapped
             raise
         except Exception as e:
-            from tulit.parser.exceptions import ParserConfigurationError
             error_msg = f"Validation setup error: {e}"
             self.logger.error(error_msg)
             raise ParserConfigurationError(error_msg) from e
         
         return False
     
+    def _run_validation(self, schema: Union[etree.XMLSchema, etree.RelaxNG], xml_tree: etree._Element) -> bool:
+        """
+        Validate against a shared schema and keep this validator's own copy
+        of the errors.
+        
+        The schema's ``error_log`` belongs to the schema object, which other
+        validators share, so it is read under the schema's lock right after
+        validating and never consulted again.
+        
+        Parameters
+        ----------
+        schema : lxml.etree.XMLSchema or lxml.etree.RelaxNG
+            Loaded schema to validate against
+        xml_tree : lxml.etree._Element
+            XML tree to validate
+        
+        Returns
+        -------
+        bool
+            True if the document is valid
+        """
+        with self._schema_lock:
+            is_valid = schema.validate(xml_tree)
+            self._errors = [f"Line {error.line}: {error.message}" for error in schema.error_log]
+        return is_valid
+    
+    def _check_root(self, xml_tree: etree._Element) -> None:
+        """
+        Reject documents whose root element the loaded XSD does not declare.
+        
+        Parameters
+        ----------
+        xml_tree : lxml.etree._Element or lxml.etree._ElementTree
+            XML tree about to be validated
+        
+        Raises
+        ------
+        SchemaValidationError
+            If the root element is not a top-level element of the schema
+        """
+        if not self._expected_roots:
+            return
+        
+        root = xml_tree.getroot() if hasattr(xml_tree, 'getroot') else xml_tree
+        root_name = etree.QName(root).localname
+        if root_name in self._expected_roots:
+            return
+        
+        from tulit.parser.exceptions import SchemaValidationError
+        error_msg = f"Line {root.sourceline}: Root element '{root_name}' is not declared by the schema"
+        self._errors = [error_msg]
+        self.logger.error(f"XSD validation failed: {error_msg}")
+        raise SchemaValidationError(
+            "XSD validation failed",
+            validation_errors=[error_msg]
+        )
+    
     def get_validation_errors(self) -> List[str]:
         """
         Get list of validation error messages.
@@ -379,14 +518,4 @@ class XMLValidator:
         list[str]
             List of error messages from last validation
         """
-        errors = []
-        
-        if self.schema is not None:
-            for error in self.schema.error_log:
-                errors.append(f"Line {error.line}: {error.message}")
-        
-        elif self.relaxng is not None:
-            for error in self.relaxng.error_log:
-                errors.append(f"Line {error.line}: {error.message}")
-        
-        return errors
+        return list(self._errors)
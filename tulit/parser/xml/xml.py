@@ -25,6 +25,15 @@ from tulit.parser.normalization import (
 from tulit.parser.xml.helpers import XMLNodeExtractor, XMLValidator
 
 
+# Shared by every XML parser: entities and network access stay disabled against
+# XXE, and libxml2's default depth/text-size limits stay in force against
+# hostile or oversized input.
+_XML_PARSER = etree.XMLParser(
+    resolve_entities=False,
+    no_network=True,
+    remove_blank_text=False,
+)
+
 # ============================================================================
 # XML Parser Abstract Base Class
 # ============================================================================
@@ -53,6 +62,22 @@ class XMLParser(Parser):
         Strategy for text normalization operations.
     """
     
+    # Extraction steps in order, as (method name, component name); built once
+    # per class rather than on every parse
+    _EXTRACTION_STEPS: Tuple[Tuple[str, str], ...] = (
+        ('get_root', 'root'),
+        ('get_preface', 'preface'),
+        ('get_preamble', 'preamble'),
+        ('get_formula', 'formula'),
+        ('get_citations', 'citations'),
+        ('get_recitals', 'recitals'),
+        ('get_preamble_final', 'preamble_final'),
+        ('get_body', 'body'),
+        ('get_chapters', 'chapters'),
+        ('get_articles', 'articles'),
+        ('get_conclusions', 'conclusions'),
+    )
+    
     def __init__(self, normalizer: Optional[TextNormalizationStrategy] = None) -> None:
         """
         Initializes the Parser object with default attributes.
@@ -198,20 +223,14 @@ class XMLParser(Parser):
     
     def _create_secure_parser(self) -> etree.XMLParser:
         """
-        Creates a secure XML parser with protections against XXE attacks.
+        Returns the shared XML parser, configured against XXE attacks.
         
         Returns
         -------
         etree.XMLParser
             Configured secure parser
         """
-        # Create parser with security settings to prevent XXE attacks
-        parser = etree.XMLParser(
-            resolve_entities=False,  # Disable external entity resolution
-            no_network=True,         # Disable network access
-            remove_blank_text=False  # Preserve formatting
-        )
-        return parser
+        return _XML_PARSER
     
     def get_root(self, file: Optional[str] = None):
         """
@@ -237,10 +256,8 @@ class XMLParser(Parser):
             raise FileLoadError("No file path provided to get_root()")
         
         try:
-            parser = self._create_secure_parser()
-            with open(file_path, 'r', encoding='utf-8') as f:
-                tree = etree.parse(f, parser)
-                self.root = tree.getroot()
+            # Hand libxml2 the path so it reads and decodes the bytes itself
+            self.root = etree.parse(file_path, self._create_secure_parser()).getroot()
         except (IOError, OSError) as e:
             raise FileLoadError(f"Failed to load XML file '{file_path}': {e}") from e
         except etree.ParseError as e:
@@ -549,23 +566,8 @@ class XMLParser(Parser):
         This method defines the parsing workflow. Subclasses should not override
         this method - instead, override the individual component extraction methods.
         """
-        # Define extraction steps in order
-        extraction_steps = [
-            ('get_root', 'root'),
-            ('get_preface', 'preface'),
-            ('get_preamble', 'preamble'),
-            ('get_formula', 'formula'),
-            ('get_citations', 'citations'),
-            ('get_recitals', 'recitals'),
-            ('get_preamble_final', 'preamble_final'),
-            ('get_body', 'body'),
-            ('get_chapters', 'chapters'),
-            ('get_articles', 'articles'),
-            ('get_conclusions', 'conclusions'),
-        ]
-        
         # Execute each step with standardized error handling
-        for method_name, component_name in extraction_steps:
+        for method_name, component_name in self._EXTRACTION_STEPS:
             self._extract_component(method_name, component_name)
     
     def parse(self, file: str, **options) -> 'XMLParser':